@@ -1,8 +1,10 @@
 """Main CLI for MilkBottle with Phase 5 integration."""
 
 import asyncio
+import importlib
+import shlex
 from pathlib import Path
-from typing import Optional
+from typing import Any, Optional
 
 import click
 from rich.console import Console
@@ -10,30 +12,76 @@ from rich.progress import Progress, SpinnerColumn, TextColumn
 from rich.table import Table
 
 from .config import get_config
-from .deployment.cli import deployment
 from .performance.optimizer import (
     cache_manager,
     performance_monitor_instance,
     resource_optimizer,
 )
-from .plugin_marketplace.cli import marketplace
 from .plugin_sdk import PluginSDK
 from .registry import get_registry
+from .utils import cli_event_loop, run_async
 
-console = Console()
+_console_instance: Optional[Console] = None
 
 
-@click.group()
-@click.option(
-    "--config", "-c", type=click.Path(exists=True), help="Configuration file path"
+def _console() -> Console:
+    """Return the shared Rich console, creating it on first use."""
+    global _console_instance
+    if _console_instance is None:
+        _console_instance = Console()
+    return _console_instance
+
+
+# Shared option/argument specs, built once at import and reused by decorators.
+_EXISTING_PATH = click.Path(exists=True)
+_PLUGIN_PATH_ARG = click.argument("plugin_path", type=_EXISTING_PATH)
+_OUTPUT_OPT = click.option(
+    "--output", "-o", type=click.Path(), help="Output path for package"
+)
+
+
+class _LazyGroup(click.Group):
+    """Click group whose *lazy_subcommands* are imported on first use.
+
+    Each entry maps a command name to ``"module:attribute"``; the module is
+    only imported when that command is invoked (or listed in help), so a
+    plain ``milk sdk ...`` does not load the deployment or marketplace code.
+    """
+
+    def __init__(
+        self,
+        *args: Any,
+        lazy_subcommands: Optional[dict[str, str]] = None,
+        **kwargs: Any,
+    ):
+        super().__init__(*args, **kwargs)
+        self.lazy_subcommands = lazy_subcommands or {}
+
+    def list_commands(self, ctx: click.Context) -> list[str]:
+        return sorted({*super().list_commands(ctx), *self.lazy_subcommands})
+
+    def get_command(self, ctx: click.Context, cmd_name: str) -> Optional[click.Command]:
+        if cmd_name in self.lazy_subcommands and cmd_name not in self.commands:
+            module_name, attr = self.lazy_subcommands[cmd_name].split(":")
+            module = importlib.import_module(module_name, __package__)
+            self.add_command(getattr(module, attr), cmd_name)
+        return super().get_command(ctx, cmd_name)
+
+
+@click.group(
+    cls=_LazyGroup,
+    lazy_subcommands={
+        "deployment": ".deployment.cli:deployment",
+        "marketplace": ".plugin_marketplace.cli:marketplace",
+    },
 )
+@click.option("--config", "-c", type=_EXISTING_PATH, help="Configuration file path")
 @click.option("--verbose", "-v", is_flag=True, help="Verbose output")
 @click.option("--debug", is_flag=True, help="Debug mode")
 def cli(config: Optional[str], verbose: bool, debug: bool):
     """MilkBottle - Modular CLI Toolbox with Advanced Features."""
     # Initialize configuration
-    config_path = Path(config) if config else None
-    milk_config = get_config(config_file=str(config_path) if config_path else None)
+    milk_config = get_config(config_file=config)
 
     # Set up logging based on verbosity
     if debug:
@@ -77,7 +125,7 @@ def create(name: str, template: str, output_dir: Optional[str], **kwargs):
         with Progress(
             SpinnerColumn(),
             TextColumn("[progress.description]{task.description}"),
-            console=console,
+            console=_console(),
         ) as progress:
             progress.add_task(f"Creating plugin {name}...", total=None)
 
@@ -85,17 +133,17 @@ def create(name: str, template: str, output_dir: Optional[str], **kwargs):
             success = sdk.create_plugin(name, template, output_path, **kwargs)
 
             if success:
-                console.print(f"✅ Successfully created plugin: {name}")
+                _console().print(f"✅ Successfully created plugin: {name}")
                 if output_path:
-                    console.print(f"📁 Plugin location: {output_path}")
+                    _console().print(f"📁 Plugin location: {output_path}")
             else:
-                console.print(f"❌ Failed to create plugin: {name}")
+                _console().print(f"❌ Failed to create plugin: {name}")
 
-    asyncio.run(_create())
+    run_async(_create())
 
 
 @sdk.command()
-@click.argument("plugin_path", type=click.Path(exists=True))
+@_PLUGIN_PATH_ARG
 def validate(plugin_path: str):
     """Validate a plugin."""
 
@@ -105,32 +153,32 @@ def validate(plugin_path: str):
         with Progress(
             SpinnerColumn(),
             TextColumn("[progress.description]{task.description}"),
-            console=console,
+            console=_console(),
         ) as progress:
             progress.add_task("Validating plugin...", total=None)
 
             result = sdk.validate_plugin(Path(plugin_path))
 
             if result.get("valid", False):
-                console.print("✅ Plugin validation passed")
+                _console().print("✅ Plugin validation passed")
 
                 if result.get("warnings"):
-                    console.print("\n⚠️  Warnings:")
+                    _console().print("\n⚠️  Warnings:")
                     for warning in result["warnings"]:
-                        console.print(f"  - {warning}")
+                        _console().print(f"  - {warning}")
             else:
-                console.print("❌ Plugin validation failed")
+                _console().print("❌ Plugin validation failed")
 
                 if result.get("errors"):
-                    console.print("\n❌ Errors:")
+                    _console().print("\n❌ Errors:")
                     for error in result["errors"]:
-                        console.print(f"  - {error}")
+                        _console().print(f"  - {error}")
 
-    asyncio.run(_validate())
+    run_async(_validate())
 
 
 @sdk.command()
-@click.argument("plugin_path", type=click.Path(exists=True))
+@_PLUGIN_PATH_ARG
 def test(plugin_path: str):
     """Test a plugin."""
 
@@ -140,31 +188,31 @@ def test(plugin_path: str):
         with Progress(
             SpinnerColumn(),
             TextColumn("[progress.description]{task.description}"),
-            console=console,
+            console=_console(),
         ) as progress:
             progress.add_task("Testing plugin...", total=None)
 
             result = sdk.test_plugin(Path(plugin_path))
 
             if result.get("success", False):
-                console.print("✅ Plugin tests passed")
+                _console().print("✅ Plugin tests passed")
 
                 if result.get("coverage"):
-                    console.print(f"📊 Test coverage: {result['coverage']:.1f}%")
+                    _console().print(f"📊 Test coverage: {result['coverage']:.1f}%")
             else:
-                console.print("❌ Plugin tests failed")
+                _console().print("❌ Plugin tests failed")
 
                 if result.get("errors"):
-                    console.print("\n❌ Test errors:")
+                    _console().print("\n❌ Test errors:")
                     for error in result["errors"]:
-                        console.print(f"  - {error}")
+                        _console().print(f"  - {error}")
 
-    asyncio.run(_test())
+    run_async(_test())
 
 
 @sdk.command()
-@click.argument("plugin_path", type=click.Path(exists=True))
-@click.option("--output", "-o", type=click.Path(), help="Output path for package")
+@_PLUGIN_PATH_ARG
+@_OUTPUT_OPT
 def package(plugin_path: str, output: Optional[str]):
     """Package a plugin for distribution."""
 
@@ -174,7 +222,7 @@ def package(plugin_path: str, output: Optional[str]):
         with Progress(
             SpinnerColumn(),
             TextColumn("[progress.description]{task.description}"),
-            console=console,
+            console=_console(),
         ) as progress:
             progress.add_task("Packaging plugin...", total=None)
 
@@ -182,13 +230,13 @@ def package(plugin_path: str, output: Optional[str]):
             success = sdk.package_plugin(Path(plugin_path), output_path)
 
             if success:
-                console.print("✅ Plugin packaged successfully")
+                _console().print("✅ Plugin packaged successfully")
                 if output_path:
-                    console.print(f"📦 Package location: {output_path}")
+                    _console().print(f"📦 Package location: {output_path}")
             else:
-                console.print("❌ Failed to package plugin")
+                _console().print("❌ Failed to package plugin")
 
-    asyncio.run(_package())
+    run_async(_package())
 
 
 @sdk.command()
@@ -213,11 +261,11 @@ def templates():
                     template.get("type", ""),
                 )
 
-            console.print(table)
+            _console().print(table)
         else:
-            console.print("No templates available")
+            _console().print("No templates available")
 
-    asyncio.run(_templates())
+    run_async(_templates())
 
 
 @cli.group()
@@ -235,12 +283,12 @@ def start_monitoring(interval: int):
         success = await performance_monitor_instance.start_monitoring(interval)
 
         if success:
-            console.print("✅ Performance monitoring started")
-            console.print(f"⏱️  Monitoring interval: {interval} seconds")
+            _console().print("✅ Performance monitoring started")
+            _console().print(f"⏱️  Monitoring interval: {interval} seconds")
         else:
-            console.print("❌ Failed to start performance monitoring")
+            _console().print("❌ Failed to start performance monitoring")
 
-    asyncio.run(_start_monitoring())
+    run_async(_start_monitoring())
 
 
 @performance.command()
@@ -249,9 +297,9 @@ def stop_monitoring():
 
     async def _stop_monitoring():
         await performance_monitor_instance.stop_monitoring()
-        console.print("✅ Performance monitoring stopped")
+        _console().print("✅ Performance monitoring stopped")
 
-    asyncio.run(_stop_monitoring())
+    run_async(_stop_monitoring())
 
 
 @performance.command()
@@ -270,9 +318,9 @@ def metrics():
         table.add_row("Response Time", f"{metrics.response_time:.3f}s")
         table.add_row("Throughput", f"{metrics.throughput:.2f} ops/s")
 
-        console.print(table)
+        _console().print(table)
 
-    asyncio.run(_metrics())
+    run_async(_metrics())
 
 
 @performance.command()
@@ -283,7 +331,7 @@ def report():
         report = performance_monitor_instance.get_performance_report()
 
         if "error" in report:
-            console.print(f"❌ {report['error']}")
+            _console().print(f"❌ {report['error']}")
             return
 
         table = Table(title="Performance Report")
@@ -315,9 +363,9 @@ def report():
             f"{avg_1hour['response_time']:.3f}s",
         )
 
-        console.print(table)
+        _console().print(table)
 
-    asyncio.run(_report())
+    run_async(_report())
 
 
 @performance.command()
@@ -328,29 +376,29 @@ def optimize_memory():
         with Progress(
             SpinnerColumn(),
             TextColumn("[progress.description]{task.description}"),
-            console=console,
+            console=_console(),
         ) as progress:
             progress.add_task("Optimizing memory...", total=None)
 
             result = await resource_optimizer.optimize_memory()
 
             if result["success"]:
-                console.print("✅ Memory optimization completed")
-                console.print(f"💾 Freed memory: {result['freed_memory_mb']:.2f} MB")
-                console.print(
+                _console().print("✅ Memory optimization completed")
+                _console().print(f"💾 Freed memory: {result['freed_memory_mb']:.2f} MB")
+                _console().print(
                     f"📊 Memory usage before: {result['memory_usage_before']:.1f}%"
                 )
-                console.print(
+                _console().print(
                     f"📊 Memory usage after: {result['memory_usage_after']:.1f}%"
                 )
             else:
-                console.print(f"❌ Memory optimization failed: {result['error']}")
+                _console().print(f"❌ Memory optimization failed: {result['error']}")
 
-    asyncio.run(_optimize_memory())
+    run_async(_optimize_memory())
 
 
 @performance.command()
-@click.argument("path", type=click.Path(exists=True))
+@click.argument("path", type=_EXISTING_PATH)
 def optimize_disk(path: str):
     """Optimize disk usage for a directory."""
 
@@ -358,22 +406,24 @@ def optimize_disk(path: str):
         with Progress(
             SpinnerColumn(),
             TextColumn("[progress.description]{task.description}"),
-            console=console,
+            console=_console(),
         ) as progress:
             progress.add_task("Optimizing disk usage...", total=None)
 
             result = await resource_optimizer.optimize_disk_usage(Path(path))
 
             if result["success"]:
-                console.print("✅ Disk optimization completed")
-                console.print(f"💾 Freed space: {result['freed_space_mb']:.2f} MB")
-                console.print(f"🗑️  Temp files removed: {result['temp_files_removed']}")
-                console.print(f"📊 Usage before: {result['usage_before_mb']:.2f} MB")
-                console.print(f"📊 Usage after: {result['usage_after_mb']:.2f} MB")
+                _console().print("✅ Disk optimization completed")
+                _console().print(f"💾 Freed space: {result['freed_space_mb']:.2f} MB")
+                _console().print(
+                    f"🗑️  Temp files removed: {result['temp_files_removed']}"
+                )
+                _console().print(f"📊 Usage before: {result['usage_before_mb']:.2f} MB")
+                _console().print(f"📊 Usage after: {result['usage_after_mb']:.2f} MB")
             else:
-                console.print(f"❌ Disk optimization failed: {result['error']}")
+                _console().print(f"❌ Disk optimization failed: {result['error']}")
 
-    asyncio.run(_optimize_disk())
+    run_async(_optimize_disk())
 
 
 @performance.command()
@@ -390,14 +440,14 @@ def cache_stats():
     table.add_row("Hit Rate", f"{stats['hit_rate']:.2%}")
     table.add_row("Memory Usage", f"{stats['memory_usage'] / 1024:.2f} KB")
 
-    console.print(table)
+    _console().print(table)
 
 
 @performance.command()
 def clear_cache():
     """Clear performance cache."""
     cache_manager.clear_cache()
-    console.print("✅ Performance cache cleared")
+    _console().print("✅ Performance cache cleared")
 
 
 @cli.group()
@@ -415,7 +465,7 @@ def run(bottle_name: str, args: tuple):
     bottle = registry.get_bottle(bottle_name)
 
     if not bottle:
-        console.print(f"❌ Bottle '{bottle_name}' not found")
+        _console().print(f"❌ Bottle '{bottle_name}' not found")
         return
 
     try:
@@ -434,7 +484,7 @@ def run(bottle_name: str, args: tuple):
         # Restore original argv
         sys.argv = original_argv
     except Exception as e:
-        console.print(f"❌ Error running bottle '{bottle_name}': {e}")
+        _console().print(f"❌ Error running bottle '{bottle_name}': {e}")
         # Restore original argv in case of error
         if "original_argv" in locals():
             sys.argv = original_argv
@@ -447,7 +497,7 @@ def list():
     bottles = registry.discover_bottles()
 
     if not bottles:
-        console.print("❌ No bottles found")
+        _console().print("❌ No bottles found")
         return
 
     table = Table(title="Available Bottles")
@@ -460,7 +510,7 @@ def list():
         description = info.get("description", "No description")
         table.add_row(name, description, status)
 
-    console.print(table)
+    _console().print(table)
 
 
 @bottle.command()
@@ -471,7 +521,7 @@ def info(bottle_name: str):
     metadata = registry.get_bottle_metadata(bottle_name)
 
     if not metadata:
-        console.print(f"❌ Bottle '{bottle_name}' not found")
+        _console().print(f"❌ Bottle '{bottle_name}' not found")
         return
 
     table = Table(title=f"Bottle: {bottle_name}")
@@ -490,7 +540,7 @@ def info(bottle_name: str):
         except Exception as e:
             table.add_row(key, f"Error: {e}")
 
-    console.print(table)
+    _console().print(table)
 
 
 @bottle.command()
@@ -533,7 +583,7 @@ def health(bottle_name: Optional[str]):
             details = f"{len(health_info)} components checked"
             table.add_row(name, status, details)
 
-    console.print(table)
+    _console().print(table)
 
 
 @cli.command()
@@ -590,9 +640,9 @@ def status():
         cache_stats = cache_manager.get_stats()
         table.add_row("Cache System", "✅ Active", f"Size: {cache_stats['size']}")
 
-        console.print(table)
+        _console().print(table)
 
-    asyncio.run(_status())
+    run_async(_status())
 
 
 @cli.command()
@@ -600,12 +650,57 @@ def version():
     """Show MilkBottle version."""
     from . import __version__
 
-    console.print(f"MilkBottle v{__version__}")
+    _console().print(f"MilkBottle v{__version__}")
 
 
-# Add subcommands
-cli.add_command(deployment)
-cli.add_command(marketplace)
+@cli.command()
+def repl():
+    """Run several commands in one session on a shared event loop."""
+    try:
+        import readline  # noqa: F401  (line editing and history for input())
+    except ImportError:
+        pass
+
+    # Every command in the session, deployment ones included, runs on the
+    # process-wide CLI loop.
+    loop = cli_event_loop()
+    asyncio.set_event_loop(loop)
+    _console().print("MilkBottle REPL - type 'exit' or press Ctrl-D to quit")
+
+    try:
+        while True:
+            try:
+                line = input("milk> ").strip()
+            except (EOFError, KeyboardInterrupt):
+                _console().print()
+                break
+
+            if not line:
+                continue
+            if line in ("exit", "quit"):
+                break
+
+            try:
+                args = shlex.split(line)
+            except ValueError as e:
+                _console().print(f"❌ {e}")
+                continue
+
+            if args[0] == "repl":
+                _console().print("❌ Already in a REPL session")
+                continue
+
+            try:
+                cli.main(args=args, prog_name="milk", standalone_mode=False)
+            except click.exceptions.Exit:
+                pass
+            except click.exceptions.Abort:
+                _console().print("Aborted")
+            except click.ClickException as e:
+                e.show()
+    finally:
+        asyncio.set_event_loop(None)
+        loop.close()
 
 
 if __name__ == "__main__":
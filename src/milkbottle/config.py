@@ -11,6 +11,9 @@ The resulting `MilkBottleConfig` dataclass is consumed by the main CLI.
 
 from __future__ import annotations
 
+import hashlib
+import json
+import os
 import tomllib
 from dataclasses import dataclass, field
 from pathlib import Path
@@ -128,19 +131,52 @@ class MilkBottleConfig:
 # Loader helpers
 # ---------------------------------------------------------------------------
 
+# Files below this size are read with a single ``os.read`` call.
+_SMALL_TOML_BYTES = 1 << 20
 
-def _load_toml(start_dir: Path) -> dict[str, Any]:
-    """Search *start_dir* and parents for `milkbottle.toml`."""
+
+def _parse_toml(path: Path) -> dict[str, Any]:
+    """Parse the TOML file at *path*.
+
+    Small files (the common case) are slurped with one raw read instead of
+    going through a buffered file object.
+    """
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        size = os.fstat(fd).st_size
+        if size < _SMALL_TOML_BYTES:
+            data = os.read(fd, size)
+            return tomllib.loads(data.decode("utf-8"))
+    finally:
+        os.close(fd)
+    with path.open("rb") as fh:
+        return tomllib.load(fh)
+
+
+# Names that mark a project root; the search never climbs above one.
+_ROOT_MARKERS = frozenset({".git", "pyproject.toml"})
+
+
+def _find_toml(start_dir: Path) -> Optional[Path]:
+    """Search *start_dir* and parents for `milkbottle.toml`.
+
+    Each directory is listed once with ``os.scandir`` and the walk stops at
+    the first project root, so deep trees do not stat every ancestor.
+
+    The result is not memoised, so a file created or removed during a
+    long-lived session is picked up by the next lookup.
+    """
     for parent in [start_dir, *start_dir.parents]:
-        candidate = parent / "milkbottle.toml"
-        if candidate.is_file():
-            try:
-                with candidate.open("rb") as fh:
-                    return tomllib.load(fh)
-            except (OSError, ValueError, tomllib.TOMLDecodeError):
-                # If TOML parsing fails, return empty dict
-                return {}
-    return {}
+        try:
+            with os.scandir(parent) as entries:
+                names = {entry.name for entry in entries}
+        except OSError:
+            continue
+        if "milkbottle.toml" in names:
+            return parent / "milkbottle.toml"
+        if not _ROOT_MARKERS.isdisjoint(names):
+            return None
+    return None
 
 
 def _deep_update(
@@ -158,22 +194,123 @@ def _deep_update(
             target[key] = value
 
 
-def _load_config_file(config_path: Optional[str]) -> dict[str, Any]:
-    """Load configuration from a specific file path."""
+def _load_config_file(config_path: str | Path | None) -> dict[str, Any]:
+    """Load configuration from a specific file path.
+
+    This is the single TOML read path; every config source goes through it.
+    """
     if not config_path:
         return {}
 
-    config_file = Path(config_path)
+    config_file = Path(config_path) if isinstance(config_path, str) else config_path
     if not config_file.is_file():
         return {}
 
     try:
-        with config_file.open("rb") as fh:
-            return tomllib.load(fh)
+        return _parse_toml(config_file)
     except (OSError, ValueError, tomllib.TOMLDecodeError):
         return {}
 
 
+# ---------------------------------------------------------------------------
+# Snapshot cache
+# ---------------------------------------------------------------------------
+
+# Merged TOML layers are cached as JSON, keyed by the files they came from,
+# in this directory; None means ~/.milkbottle/config_cache, resolved on use.
+_SNAPSHOT_DIR: Optional[Path] = None
+
+# At most this many snapshots are kept; the least recently written go first.
+_MAX_SNAPSHOTS = 32
+
+# Changing the built-in defaults must invalidate every snapshot.
+_DEFAULTS_DIGEST = hashlib.blake2b(
+    json.dumps(DEFAULTS, sort_keys=True).encode(), digest_size=8
+).hexdigest()
+
+
+def _source_stamps(sources: list[Path]) -> Optional[list[list[Any]]]:
+    """Return ``[path, mtime_ns, size]`` for each source, or None if one is gone."""
+    stamps: list[list[Any]] = []
+    for source in sources:
+        try:
+            st = source.stat()
+        except OSError:
+            return None
+        stamps.append([str(source), st.st_mtime_ns, st.st_size])
+    return stamps
+
+
+def _snapshot_dir() -> Path:
+    if _SNAPSHOT_DIR is not None:
+        return _SNAPSHOT_DIR
+    return Path.home() / ".milkbottle" / "config_cache"
+
+
+def _snapshot_file(sources: list[Path]) -> Path:
+    key = hashlib.blake2b(
+        "|".join(str(source) for source in sources).encode(), digest_size=8
+    ).hexdigest()
+    return _snapshot_dir() / f"cfg-{key}.json"
+
+
+def _read_snapshot(snapshot: Path, stamps: list[list[Any]]) -> Optional[dict[str, Any]]:
+    """Return the cached merge for *stamps*, or None if missing or stale."""
+    try:
+        payload = json.loads(snapshot.read_bytes())
+    except (OSError, ValueError):
+        return None
+    if (
+        not isinstance(payload, dict)
+        or payload.get("defaults") != _DEFAULTS_DIGEST
+        or payload.get("sources") != stamps
+        or not isinstance(payload.get("data"), dict)
+    ):
+        return None
+    return payload["data"]
+
+
+def _write_snapshot(
+    snapshot: Path, stamps: list[list[Any]], data: dict[str, Any]
+) -> None:
+    """Best-effort atomic write of a merged config snapshot."""
+    payload = {"defaults": _DEFAULTS_DIGEST, "sources": stamps, "data": data}
+    try:
+        encoded = json.dumps(payload)
+    except (TypeError, ValueError):
+        # TOML dates/times are not JSON serializable; just skip caching.
+        return
+    try:
+        snapshot.parent.mkdir(parents=True, exist_ok=True)
+        is_new = not snapshot.exists()
+        tmp = snapshot.with_suffix(".tmp")
+        tmp.write_text(encoded, encoding="utf-8")
+        os.replace(tmp, snapshot)
+    except OSError:
+        return
+    if is_new:
+        _prune_snapshots(snapshot.parent)
+
+
+def _prune_snapshots(snapshot_dir: Path) -> None:
+    """Delete the oldest snapshots beyond `_MAX_SNAPSHOTS`."""
+    try:
+        with os.scandir(snapshot_dir) as entries:
+            snapshots = [
+                (entry.stat().st_mtime_ns, entry.path)
+                for entry in entries
+                if entry.name.startswith("cfg-") and entry.name.endswith(".json")
+            ]
+    except OSError:
+        return
+    snapshots.sort()
+    for _, path in snapshots[: max(len(snapshots) - _MAX_SNAPSHOTS, 0)]:
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+
+
 # ---------------------------------------------------------------------------
 # Public API
 # ---------------------------------------------------------------------------
@@ -187,17 +324,34 @@ def build_config(
     """Return a merged `MilkBottleConfig`.
 
     Precedence (lowest→highest): defaults < TOML < config file < CLI overrides.
-    """
-    data: dict[str, Any] = {**DEFAULTS}
 
-    # Load TOML from project directory
-    toml_data = _load_toml(project_root)
-    _deep_update(data, toml_data)
-
-    # Load specific config file if provided
+    The merge of defaults and TOML files is cached on disk and reused while
+    none of the source files change.
+    """
+    # Project TOML first, then the specific config file unless it is the
+    # project TOML itself.
+    sources: list[Path] = []
+    toml_path = _find_toml(project_root)
+    if toml_path is not None:
+        sources.append(toml_path)
     if config_file_path:
-        config_data = _load_config_file(config_file_path)
-        _deep_update(data, config_data)
+        config_file = Path(config_file_path)
+        if toml_path is None or config_file.resolve() != toml_path.resolve():
+            sources.append(config_file)
+
+    data: Optional[dict[str, Any]] = None
+    snapshot: Optional[Path] = None
+    stamps = _source_stamps(sources) if sources else None
+    if stamps:
+        snapshot = _snapshot_file(sources)
+        data = _read_snapshot(snapshot, stamps)
+
+    if data is None:
+        data = {**DEFAULTS}
+        for source in sources:
+            _deep_update(data, _load_config_file(source))
+        if snapshot is not None and stamps:
+            _write_snapshot(snapshot, stamps, data)
 
     # Apply CLI overrides last
     _deep_update(data, cli_overrides)
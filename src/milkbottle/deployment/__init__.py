@@ -2,13 +2,29 @@
 
 from __future__ import annotations
 
-from .backup_manager import BackupManager
-from .ci_cd_manager import CICDManager
-from .deployment_manager import DeploymentManager
-from .docker_manager import DockerManager
-from .monitoring_manager import MonitoringManager
-from .scaling_manager import ScalingManager
-from .security_manager import SecurityManager
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .backup_manager import BackupManager
+    from .ci_cd_manager import CICDManager
+    from .deployment_manager import DeploymentManager
+    from .docker_manager import DockerManager
+    from .monitoring_manager import MonitoringManager
+    from .scaling_manager import ScalingManager
+    from .security_manager import SecurityManager
+
+# Managers are resolved on first attribute access (PEP 562) so importing one
+# of them does not drag in the other six modules and their dependencies.
+_LAZY_EXPORTS: dict[str, str] = {
+    "DeploymentManager": ".deployment_manager",
+    "DockerManager": ".docker_manager",
+    "CICDManager": ".ci_cd_manager",
+    "MonitoringManager": ".monitoring_manager",
+    "BackupManager": ".backup_manager",
+    "ScalingManager": ".scaling_manager",
+    "SecurityManager": ".security_manager",
+}
 
 __all__ = [
     "DeploymentManager",
@@ -19,3 +35,17 @@ __all__ = [
     "ScalingManager",
     "SecurityManager",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    """Import the manager class *name* on first access."""
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
@@ -2,21 +2,217 @@
 
 from __future__ import annotations
 
+import asyncio
+import fnmatch
+import functools
 import hashlib
+import io
+import itertools
 import json
 import logging
+import os
+import re
 import shutil
+import stat
+import subprocess
 import tarfile
-from dataclasses import dataclass, field
-from datetime import datetime, timedelta
+import threading
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass, field
+from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, BinaryIO, Dict, Iterator, List, Optional, Set, Tuple
 
 from rich.console import Console
-from rich.progress import Progress, SpinnerColumn, TextColumn
+from rich.progress import Progress, SpinnerColumn, TaskID, TextColumn
 
 from ..config import MilkBottleConfig
 
+try:
+    import blake3
+except ImportError:
+    blake3 = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import grp
+    import pwd
+except ImportError:  # not available on Windows
+    grp = pwd = None
+
+# New backups use BLAKE3 when available, otherwise SHA-256 (hardware
+# accelerated by OpenSSL on CPUs with SHA extensions). Backups written before
+# "hash_algo" was recorded in their metadata were hashed with MD5.
+_CHECKSUM_ALGO = "blake3" if blake3 is not None else "sha256"
+_LEGACY_CHECKSUM_ALGO = "md5"
+
+_LEGACY_TIMESTAMP_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+# Directory scans are latency bound (getdents/stat), so overlap many of them.
+_SCAN_WORKERS = 32
+
+# Small files are read ahead by a thread pool while the single tar writer
+# (tar streams must be written in order) appends them; larger files are
+# streamed by tarfile directly.
+_PREFETCH_WORKERS = 8
+_PREFETCH_WINDOW = 64
+_PREFETCH_MAX_BYTES = 4 << 20
+
+# Buffer size for archive file I/O, tar stream records and member copies;
+# tarfile's defaults (10 KiB records, 16 KiB copies) mean millions of tiny
+# reads and writes on large archives.
+_ARCHIVE_BUFSIZE = 1 << 20
+
+# tarfile's default PAX format writes an extra extended header for every
+# member with a sub-second mtime, i.e. nearly all of them. GNU tar headers
+# still cover long names and large files but keep whole-second mtimes.
+_TAR_FORMAT = tarfile.GNU_FORMAT
+
+# Files with these suffixes are already compressed; gzip gains ~nothing on them.
+_COMPRESSED_SUFFIXES = frozenset(
+    {
+        ".7z",
+        ".bz2",
+        ".gif",
+        ".gz",
+        ".jpeg",
+        ".jpg",
+        ".mp3",
+        ".mp4",
+        ".png",
+        ".webp",
+        ".whl",
+        ".xz",
+        ".zip",
+        ".zst",
+    }
+)
+_COMPRESSED_FILES_RATIO = 0.5
+
+# Every Rich progress update takes a lock and may re-render, so the archive
+# writer reports progress once per this many files (must be a power of two).
+_PROGRESS_BATCH = 1024
+
+
+def _new_hasher(algo: str) -> Any:
+    """Return a fresh hash object for *algo* (``blake3`` or a hashlib name)."""
+    if algo == "blake3":
+        if blake3 is None:
+            raise RuntimeError("blake3 is not installed")
+        return blake3.blake3(max_threads=blake3.blake3.AUTO)
+    return hashlib.new(algo)
+
+
+@functools.lru_cache(maxsize=None)
+def _user_name(uid: int) -> str:
+    """Return the user name for *uid* (looked up once per uid)."""
+    try:
+        return pwd.getpwuid(uid).pw_name if pwd is not None else ""
+    except KeyError:
+        return ""
+
+
+@functools.lru_cache(maxsize=None)
+def _group_name(gid: int) -> str:
+    """Return the group name for *gid* (looked up once per gid)."""
+    try:
+        return grp.getgrgid(gid).gr_name if grp is not None else ""
+    except KeyError:
+        return ""
+
+
+def _prefetch(file_path: str, arcname: str) -> Optional[Tuple[tarfile.TarInfo, bytes]]:
+    """Read a small regular file and build its tar header off the writer thread.
+
+    Returns None for anything tarfile should handle itself (large files,
+    symlinks, hard links, special files, read errors).
+    """
+    try:
+        st = os.lstat(file_path)
+        if (
+            not stat.S_ISREG(st.st_mode)
+            or st.st_nlink > 1
+            or st.st_size > _PREFETCH_MAX_BYTES
+        ):
+            return None
+        with open(file_path, "rb") as f:
+            data = f.read()
+    except OSError:
+        # Let the tar writer retry the file and report the error.
+        return None
+
+    info = tarfile.TarInfo(arcname)
+    info.size = len(data)
+    info.mode = stat.S_IMODE(st.st_mode)
+    info.mtime = st.st_mtime
+    info.uid = st.st_uid
+    info.gid = st.st_gid
+    info.uname = _user_name(st.st_uid)
+    info.gname = _group_name(st.st_gid)
+    return info, data
+
+
+def _archive_order(file_path: str) -> Tuple[str, str, str]:
+    """Sort key placing similar files next to each other in the archive.
+
+    gzip only matches against the previous 32 KiB, so grouping files by
+    extension and name (e.g. every plugin's ``manifest.json``) lets small,
+    near-identical files compress against each other.
+    """
+    name = os.path.basename(file_path)
+    return os.path.splitext(name)[1], name, file_path
+
+
+def _dump_json(data: Any, indent: bool = False) -> bytes:
+    """Serialize *data* to JSON bytes, using orjson when installed."""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 if indent else 0)
+    return json.dumps(data, indent=2 if indent else None).encode()
+
+
+def _load_json(raw: bytes) -> Any:
+    """Parse JSON *raw* bytes, using orjson when installed."""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def _checksum_file(file_path: Path, algo: str) -> str:
+    """Return the hex digest of *file_path* (blocking)."""
+    if algo == "blake3":
+        hasher = _new_hasher(algo)
+        hasher.update_mmap(file_path)
+        return hasher.hexdigest()
+
+    # file_digest reads in large blocks and hashes in C, avoiding a
+    # Python-level loop and bytes allocation per chunk.
+    with open(file_path, "rb", buffering=0) as f:
+        return hashlib.file_digest(f, algo).hexdigest()
+
+
+class _HashingWriter(io.RawIOBase):
+    """Write-only raw stream that hashes bytes on their way to *fileobj*."""
+
+    def __init__(self, fileobj: BinaryIO, hasher: Any):
+        super().__init__()
+        self.fileobj = fileobj
+        self.hasher = hasher
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data: Any) -> int:
+        self.hasher.update(data)
+        self.fileobj.write(data)
+        return len(data)
+
 
 @dataclass
 class BackupConfig:
@@ -25,6 +221,8 @@ class BackupConfig:
     backup_dir: str = "~/.milkbottle/backups"
     retention_days: int = 30
     compression: bool = True
+    compression_algo: str = "pigz"  # pigz (parallel, gzip-compatible) or gzip
+    compression_level: int = 6  # 1 (fastest) .. 9 (smallest)
     encryption: bool = False
     encryption_key: Optional[str] = None
     include_logs: bool = True
@@ -33,12 +231,12 @@ class BackupConfig:
     exclude_patterns: List[str] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class BackupInfo:
     """Backup information."""
 
     backup_id: str
-    timestamp: str
+    timestamp: int  # seconds since the epoch
     size: int
     type: str  # full, incremental, differential
     status: str  # completed, failed, in_progress
@@ -46,6 +244,66 @@ class BackupInfo:
     checksum: str
     metadata: Dict[str, Any] = field(default_factory=dict)
 
+    def __post_init__(self) -> None:
+        # Backups written before epoch timestamps stored a local time string.
+        if isinstance(self.timestamp, str):
+            self.timestamp = int(
+                datetime.strptime(self.timestamp, _LEGACY_TIMESTAMP_FORMAT).timestamp()
+            )
+
+    @property
+    def timestamp_iso(self) -> str:
+        """Local time of the backup, for display."""
+        return datetime.fromtimestamp(self.timestamp).isoformat(
+            sep=" ", timespec="seconds"
+        )
+
+
+def _dependent_backups(backups: List[BackupInfo], backup_id: str) -> List[BackupInfo]:
+    """Return the backups built on *backup_id* via ``parent_id``, deepest first."""
+    children: Dict[str, List[BackupInfo]] = {}
+    for backup in backups:
+        if parent_id := backup.metadata.get("parent_id"):
+            children.setdefault(parent_id, []).append(backup)
+
+    dependents: List[BackupInfo] = []
+    seen = {backup_id}
+    queue = deque([backup_id])
+    while queue:
+        for child in children.get(queue.popleft(), []):
+            if child.backup_id not in seen:
+                seen.add(child.backup_id)
+                dependents.append(child)
+                queue.append(child.backup_id)
+    dependents.reverse()
+    return dependents
+
+
+def _backup_chains(backups: List[BackupInfo], roots: List[BackupInfo]) -> Set[str]:
+    """Return the ids of *roots* and of every backup they build on."""
+    parents = {b.backup_id: b.metadata.get("parent_id") for b in backups}
+    chains: Set[str] = set()
+    for root in roots:
+        backup_id: Optional[str] = root.backup_id
+        while backup_id and backup_id not in chains:
+            chains.add(backup_id)
+            backup_id = parents.get(backup_id)
+    return chains
+
+
+def _chain_depths(backups: List[BackupInfo]) -> Dict[str, int]:
+    """Return how many ``parent_id`` links lead from each backup to its root."""
+    parents = {b.backup_id: b.metadata.get("parent_id") for b in backups}
+    depths: Dict[str, int] = {}
+    for backup_id in parents:
+        depth, parent_id, seen = 0, parents[backup_id], {backup_id}
+        while parent_id in parents and parent_id not in seen:
+            seen.add(parent_id)
+            depth += 1
+            parent_id = parents[parent_id]
+        depths[backup_id] = depth
+    return depths
+
 
 class BackupManager:
     """Data backup and recovery management."""
@@ -57,6 +315,13 @@ class BackupManager:
         self.logger = logging.getLogger("milkbottle.backup")
         self.backup_dir = Path(self.backup_config.backup_dir).expanduser()
         self.backup_dir.mkdir(parents=True, exist_ok=True)
+        self._exclude_re: Optional[re.Pattern[str]] = None
+        self._compile_excludes()
+        # backup_id -> BackupInfo fields, mirrored to index.json so listing
+        # does not have to open every backup_info.json.
+        self._index_path = self.backup_dir / "index.json"
+        self._index: Optional[Dict[str, Dict[str, Any]]] = None
+        self._index_lock = asyncio.Lock()
 
     async def create_backup(
         self, backup_type: str = "full", description: Optional[str] = None
@@ -77,7 +342,10 @@ class BackupManager:
                 status="in_progress",
                 files_count=0,
                 checksum="",
-                metadata={"description": description or ""},
+                metadata={
+                    "description": description or "",
+                    "hash_algo": _CHECKSUM_ALGO,
+                },
             )
 
             # Create backup directory
@@ -86,6 +354,24 @@ class BackupManager:
 
             # Collect files to backup
             files_to_backup = await self._collect_files_to_backup()
+            manifest = await asyncio.to_thread(self._stat_files, files_to_backup)
+
+            # Incremental/differential backups only archive files changed
+            # since their parent backup.
+            if backup_type in ("incremental", "differential"):
+                parent = await self._find_parent_backup(backup_type)
+                if parent is None:
+                    self.logger.info("No previous backup to compare; creating full")
+                    backup_info.type = "full"
+                else:
+                    parent_id, parent_manifest = parent
+                    backup_info.metadata["parent_id"] = parent_id
+                    files_to_backup = [
+                        file_path
+                        for file_path in files_to_backup
+                        if file_path not in manifest
+                        or parent_manifest.get(file_path) != manifest[file_path]
+                    ]
 
             # Create backup
             success = await self._create_backup_archive(
@@ -93,11 +379,16 @@ class BackupManager:
             )
 
             if success:
-                # Update backup info
+                # Update backup info (checksum was computed while writing)
+                archive_path = backup_path / f"{backup_id}.tar.gz"
                 backup_info.status = "completed"
-                backup_info.size = backup_path.stat().st_size
+                backup_info.size = archive_path.stat().st_size
                 backup_info.files_count = len(files_to_backup)
-                backup_info.checksum = await self._calculate_checksum(backup_path)
+
+                # Record the state of every file for the next incremental
+                await asyncio.to_thread(
+                    (backup_path / "manifest.json").write_bytes, _dump_json(manifest)
+                )
 
                 # Save backup info
                 await self._save_backup_info(backup_info)
@@ -131,13 +422,31 @@ class BackupManager:
             restore_dir = Path(target_dir) if target_dir else Path.cwd()
             restore_dir.mkdir(parents=True, exist_ok=True)
 
+            # Incremental backups are restored on top of their parents,
+            # starting from the full backup at the root of the chain.
+            chain = [backup_info]
+            while parent_id := chain[-1].metadata.get("parent_id"):
+                parent_info = await self._load_backup_info(parent_id)
+                if not parent_info:
+                    self.logger.error(f"Parent backup {parent_id} not found")
+                    return False
+                chain.append(parent_info)
+
             # Restore backup
-            backup_path = self.backup_dir / backup_id / f"{backup_id}.tar.gz"
-            if not backup_path.exists():
-                self.logger.error(f"Backup file not found: {backup_path}")
-                return False
+            backup_paths = [
+                self.backup_dir / info.backup_id / f"{info.backup_id}.tar.gz"
+                for info in reversed(chain)
+            ]
+            for backup_path in backup_paths:
+                if not backup_path.exists():
+                    self.logger.error(f"Backup file not found: {backup_path}")
+                    return False
 
-            success = await self._restore_backup_archive(backup_path, restore_dir)
+            success = True
+            for backup_path in backup_paths:
+                success = await self._restore_backup_archive(backup_path, restore_dir)
+                if not success:
+                    break
 
             if success:
                 self.logger.info(
@@ -155,13 +464,8 @@ class BackupManager:
     async def list_backups(self) -> List[BackupInfo]:
         """List all available backups."""
         try:
-            backups = []
-
-            for backup_dir in self.backup_dir.iterdir():
-                if backup_dir.is_dir():
-                    backup_info = await self._load_backup_info(backup_dir.name)
-                    if backup_info:
-                        backups.append(backup_info)
+            index = await asyncio.to_thread(self._read_index)
+            backups = [BackupInfo(**data) for data in index.values()]
 
             # Sort by timestamp (newest first)
             backups.sort(key=lambda x: x.timestamp, reverse=True)
@@ -171,14 +475,43 @@ class BackupManager:
             self.logger.error(f"Failed to list backups: {e}")
             return []
 
-    async def delete_backup(self, backup_id: str) -> bool:
-        """Delete a backup."""
+    async def delete_backup(self, backup_id: str, cascade: bool = False) -> bool:
+        """Delete a backup.
+
+        A backup that incremental or differential backups are built on is
+        only deleted with *cascade*, which deletes those dependents first.
+        """
         try:
             self.logger.info(f"Deleting backup: {backup_id}")
 
+            dependents = _dependent_backups(await self.list_backups(), backup_id)
+            if dependents and not cascade:
+                names = ", ".join(backup.backup_id for backup in dependents)
+                self.logger.error(
+                    f"Backup {backup_id} is needed to restore {names}; "
+                    "delete them first or use cascade"
+                )
+                return False
+            for dependent in dependents:
+                if not await self._remove_backup(dependent.backup_id):
+                    return False
+
+            return await self._remove_backup(backup_id)
+
+        except Exception as e:
+            self.logger.error(f"Failed to delete backup: {e}")
+            return False
+
+    async def _remove_backup(self, backup_id: str) -> bool:
+        """Remove one backup's files and index entry."""
+        try:
             backup_path = self.backup_dir / backup_id
             if backup_path.exists():
-                shutil.rmtree(backup_path)
+                await asyncio.to_thread(shutil.rmtree, backup_path)
+                async with self._index_lock:
+                    index = await asyncio.to_thread(self._read_index)
+                    if index.pop(backup_id, None) is not None:
+                        await asyncio.to_thread(self._write_index)
                 self.logger.info(f"Successfully deleted backup {backup_id}")
                 return True
             else:
@@ -194,17 +527,25 @@ class BackupManager:
         try:
             self.logger.info("Cleaning up old backups")
 
-            cutoff_date = datetime.now() - timedelta(
-                days=self.backup_config.retention_days
-            )
+            cutoff = int(time.time()) - self.backup_config.retention_days * 86400
             deleted_count = 0
 
+            # Expired backups that a retained backup is built on are kept, or
+            # restoring that backup would fail.
             backups = await self.list_backups()
-            for backup in backups:
-                backup_date = datetime.strptime(backup.timestamp, "%Y-%m-%d %H:%M:%S")
-                if backup_date < cutoff_date and await self.delete_backup(
-                    backup.backup_id
-                ):
+            needed = _backup_chains(
+                backups, [b for b in backups if b.timestamp >= cutoff]
+            )
+            expired = [
+                backup
+                for backup in backups
+                if backup.timestamp < cutoff and backup.backup_id not in needed
+            ]
+            # Deepest in a chain first, so no backup outlives its parent.
+            depths = _chain_depths(backups)
+            expired.sort(key=lambda backup: depths[backup.backup_id], reverse=True)
+            for backup in expired:
+                if await self.delete_backup(backup.backup_id):
                     deleted_count += 1
 
             self.logger.info(f"Deleted {deleted_count} old backups")
@@ -232,15 +573,16 @@ class BackupManager:
                 return False
 
             # Verify checksum
-            current_checksum = await self._calculate_checksum(backup_path)
+            hash_algo = backup_info.metadata.get("hash_algo", _LEGACY_CHECKSUM_ALGO)
+            current_checksum = await self._calculate_checksum(backup_path, hash_algo)
             if current_checksum != backup_info.checksum:
                 self.logger.error(f"Backup checksum mismatch for {backup_id}")
                 return False
 
             # Test archive integrity
             try:
-                with tarfile.open(backup_path, "r:gz") as tar:
-                    tar.getmembers()  # This will raise an error if archive is corrupted
+                # This will raise an error if archive is corrupted
+                await asyncio.to_thread(self._read_members, backup_path)
                 self.logger.info(f"Backup {backup_id} verification successful")
                 return True
             except Exception as e:
@@ -251,9 +593,43 @@ class BackupManager:
             self.logger.error(f"Failed to verify backup: {e}")
             return False
 
-    async def _collect_files_to_backup(self) -> List[Path]:
-        """Collect files to include in backup."""
-        files_to_backup = []
+    async def _find_parent_backup(
+        self, backup_type: str
+    ) -> Optional[Tuple[str, Dict[str, List[int]]]]:
+        """Return the id and file manifest an incremental/differential builds on.
+
+        Incremental backups build on the latest completed backup, differential
+        ones on the latest completed full backup.
+        """
+        for backup in await self.list_backups():
+            if backup.status != "completed":
+                continue
+            if backup_type == "differential" and backup.type != "full":
+                continue
+            manifest_file = self.backup_dir / backup.backup_id / "manifest.json"
+            try:
+                manifest = _load_json(await asyncio.to_thread(manifest_file.read_bytes))
+            except (OSError, ValueError):
+                # Written before manifests existed; nothing to compare against.
+                return None
+            return backup.backup_id, manifest
+        return None
+
+    def _stat_files(self, files: List[str]) -> Dict[str, List[int]]:
+        """Return ``[mtime_ns, size, inode]`` for each file that can be stat'ed."""
+        manifest: Dict[str, List[int]] = {}
+        for file_path in files:
+            try:
+                st = os.stat(file_path)
+            except OSError:
+                continue
+            manifest[file_path] = [st.st_mtime_ns, st.st_size, st.st_ino]
+        return manifest
+
+    async def _collect_files_to_backup(self) -> List[str]:
+        """Collect paths of the files to include in backup."""
+        files_to_backup: List[str] = []
+        self._compile_excludes()
 
         # Add configuration files
         if self.backup_config.include_config:
@@ -263,7 +639,7 @@ class BackupManager:
                 Path("requirements.txt"),
             ]
             files_to_backup.extend(
-                config_file for config_file in config_files if config_file.exists()
+                str(config_file) for config_file in config_files if config_file.exists()
             )
         # Add data files
         if self.backup_config.include_data:
@@ -272,30 +648,79 @@ class BackupManager:
                 Path.home() / ".milkbottle" / "plugins",
                 Path.home() / ".milkbottle" / "marketplace_cache",
             ]
-            for data_dir in data_dirs:
-                if data_dir.exists():
-                    files_to_backup.extend(
-                        file_path
-                        for file_path in data_dir.rglob("*")
-                        if file_path.is_file()
-                        and not self._should_exclude_file(file_path)
-                    )
+            existing_dirs = [data_dir for data_dir in data_dirs if data_dir.exists()]
+            if existing_dirs:
+                files_to_backup.extend(
+                    await asyncio.to_thread(self._walk_files, existing_dirs)
+                )
         # Add log files
         if self.backup_config.include_logs:
             log_dirs = [Path.home() / ".milkbottle" / "logs"]
             for log_dir in log_dirs:
                 if log_dir.exists():
-                    files_to_backup.extend(iter(log_dir.glob("*.log")))
+                    files_to_backup.extend(map(str, log_dir.glob("*.log")))
         return files_to_backup
 
-    def _should_exclude_file(self, file_path: Path) -> bool:
-        """Check if file should be excluded from backup."""
-        return any(
-            pattern in str(file_path) for pattern in self.backup_config.exclude_patterns
+    def _walk_files(self, roots: List[Path]) -> List[str]:
+        """Return non-excluded files under *roots*, scanning directories in parallel."""
+        files: List[str] = []
+        with ThreadPoolExecutor(max_workers=_SCAN_WORKERS) as pool:
+            pending: Set[Future[Tuple[List[str], List[str]]]] = {
+                pool.submit(self._scan_dir, str(root)) for root in roots
+            }
+            while pending:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    found, subdirs = future.result()
+                    files.extend(found)
+                    pending.update(pool.submit(self._scan_dir, d) for d in subdirs)
+        files.sort(key=_archive_order)
+        return files
+
+    def _scan_dir(self, path: str) -> Tuple[List[str], List[str]]:
+        """List one directory, returning its kept files and its subdirectories."""
+        files: List[str] = []
+        subdirs: List[str] = []
+        try:
+            with os.scandir(path) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        subdirs.append(entry.path)
+                    elif entry.is_file() and not self._should_exclude_file(entry.path):
+                        files.append(entry.path)
+        except OSError as e:
+            self.logger.warning(f"Failed to scan {path}: {e}")
+        return files, subdirs
+
+    def _compile_excludes(self) -> None:
+        """Fold ``exclude_patterns`` into one regex searched once per file.
+
+        Plain patterns keep their substring meaning; patterns containing glob
+        characters (``*?[``) are matched with fnmatch semantics.
+        """
+        patterns = self.backup_config.exclude_patterns
+        if not patterns:
+            self._exclude_re = None
+            return
+        self._exclude_re = re.compile(
+            "|".join(
+                (
+                    fnmatch.translate(pattern)
+                    if any(char in pattern for char in "*?[")
+                    else re.escape(pattern)
+                )
+                for pattern in patterns
+            )
         )
 
+    def _should_exclude_file(self, file_path: str) -> bool:
+        """Check if file should be excluded from backup."""
+        if self._exclude_re is None:
+            return False
+        return self._exclude_re.search(file_path) is not None
+
     async def _create_backup_archive(
-        self, backup_path: Path, files: List[Path], backup_info: BackupInfo
+        self, backup_path: Path, files: List[str], backup_info: BackupInfo
     ) -> bool:
         """Create backup archive."""
         try:
@@ -308,20 +733,15 @@ class BackupManager:
             ) as progress:
                 task = progress.add_task("Creating backup archive", total=len(files))
 
-                with tarfile.open(archive_path, "w:gz") as tar:
-                    for file_path in files:
-                        try:
-                            # Add file to archive with relative path
-                            arcname = file_path.relative_to(Path.cwd())
-                            tar.add(file_path, arcname=arcname)
-                            progress.update(task, advance=1)
-                        except Exception as e:
-                            self.logger.warning(
-                                f"Failed to add {file_path} to backup: {e}"
-                            )
-                            continue
+                # Hash the compressed stream as it is written so the archive
+                # does not have to be read back to checksum it.
+                hash_algo = backup_info.metadata.get("hash_algo", _CHECKSUM_ALGO)
+                hasher = _new_hasher(hash_algo)
+                await asyncio.to_thread(
+                    self._write_archive, archive_path, hasher, files, progress, task
+                )
 
-                progress.update(task, completed=True)
+                backup_info.checksum = hasher.hexdigest()
 
             return True
 
@@ -329,6 +749,95 @@ class BackupManager:
             self.logger.error(f"Failed to create backup archive: {e}")
             return False
 
+    def _write_archive(
+        self,
+        archive_path: Path,
+        hasher: Any,
+        files: List[str],
+        progress: Progress,
+        task: TaskID,
+    ) -> None:
+        """Write *files* to *archive_path* (blocking; run in a worker thread)."""
+        level = self._compression_level(files)
+        with self._archive_writer(archive_path, hasher, level) as tar:
+            self._write_members(tar, files, progress, task)
+
+    def _compression_level(self, files: List[str]) -> int:
+        """Pick the gzip level for *files*.
+
+        A single gzip stream cannot store some members uncompressed, so when
+        most files are already compressed (images, archives, rotated logs)
+        the fastest level is used: higher levels burn CPU for no gain there.
+        """
+        level = self.backup_config.compression_level
+        if not files:
+            return level
+        compressed = sum(
+            1
+            for file_path in files
+            if os.path.splitext(file_path)[1].lower() in _COMPRESSED_SUFFIXES
+        )
+        if compressed / len(files) >= _COMPRESSED_FILES_RATIO:
+            return 1
+        return level
+
+    def _write_members(
+        self,
+        tar: tarfile.TarFile,
+        files: List[str],
+        progress: Progress,
+        task: TaskID,
+    ) -> None:
+        """Append *files* to *tar* in order, reading ahead on a thread pool.
+
+        Workers stat and read small files and build their ``TarInfo``, so the
+        writer thread only appends ready-made members.
+        """
+        cwd_prefix = os.path.join(os.getcwd(), "")
+        pending_files = iter(files)
+
+        def submit(file_path: str) -> Tuple[str, str, Future[Any]]:
+            # Add file to archive with a path relative to the working directory
+            if not os.path.isabs(file_path):
+                arcname = os.path.normpath(file_path)
+            elif file_path.startswith(cwd_prefix):
+                arcname = file_path[len(cwd_prefix) :]
+            else:
+                future: Future[Any] = Future()
+                future.set_exception(
+                    ValueError(f"{file_path!r} is not in the working directory")
+                )
+                return file_path, "", future
+            return file_path, arcname, pool.submit(_prefetch, file_path, arcname)
+
+        with ThreadPoolExecutor(max_workers=_PREFETCH_WORKERS) as pool:
+            window: deque[Tuple[str, str, Future[Any]]] = deque(
+                submit(file_path)
+                for file_path in itertools.islice(pending_files, _PREFETCH_WINDOW)
+            )
+            processed = 0
+            while window:
+                file_path, arcname, future = window.popleft()
+                next_path = next(pending_files, None)
+                if next_path is not None:
+                    window.append(submit(next_path))
+
+                try:
+                    member = future.result()
+                    if member is not None:
+                        info, data = member
+                        tar.addfile(info, io.BytesIO(data))
+                    else:
+                        tar.add(file_path, arcname=arcname)
+                except Exception as e:
+                    self.logger.warning(f"Failed to add {file_path} to backup: {e}")
+
+                processed += 1
+                if processed & (_PROGRESS_BATCH - 1) == 0:
+                    progress.update(task, completed=processed)
+
+        progress.update(task, completed=len(files))
+
     async def _restore_backup_archive(
         self, archive_path: Path, target_dir: Path
     ) -> bool:
@@ -341,8 +850,7 @@ class BackupManager:
             ) as progress:
                 task = progress.add_task("Restoring backup archive", total=None)
 
-                with tarfile.open(archive_path, "r:gz") as tar:
-                    tar.extractall(target_dir)
+                await asyncio.to_thread(self._extract_archive, archive_path, target_dir)
 
                 progress.update(task, completed=True)
 
@@ -352,14 +860,136 @@ class BackupManager:
             self.logger.error(f"Failed to restore backup archive: {e}")
             return False
 
-    async def _calculate_checksum(self, file_path: Path) -> str:
-        """Calculate file checksum."""
+    def _extract_archive(self, archive_path: Path, target_dir: Path) -> None:
+        """Extract *archive_path* into *target_dir* (blocking)."""
+        with self._archive_reader(archive_path) as tar:
+            tar.extractall(target_dir)
+
+    def _read_members(self, archive_path: Path) -> List[tarfile.TarInfo]:
+        """Read every member header of *archive_path* (blocking)."""
+        with self._archive_reader(archive_path) as tar:
+            return tar.getmembers()
+
+    def _pigz_path(self) -> Optional[str]:
+        """Return the pigz executable if configured and installed."""
+        if self.backup_config.compression_algo != "pigz":
+            return None
+        return shutil.which("pigz")
+
+    @contextmanager
+    def _archive_writer(
+        self, archive_path: Path, hasher: Any, level: int
+    ) -> Iterator[tarfile.TarFile]:
+        """Yield a tar writer for *archive_path*, hashing the compressed bytes.
+
+        Compression runs in a multi-threaded ``pigz`` subprocess when
+        available, otherwise in-process with gzip. Both produce ``.tar.gz``.
+        """
+        with open(archive_path, "wb", buffering=0) as raw:
+            writer = _HashingWriter(raw, hasher)
+            pigz = self._pigz_path()
+            if pigz is None:
+                # Coalesce gzip's many small writes before hashing/writing.
+                buffered = io.BufferedWriter(writer, buffer_size=_ARCHIVE_BUFSIZE)
+                with tarfile.open(
+                    fileobj=buffered,
+                    mode="w:gz",
+                    compresslevel=level,
+                    format=_TAR_FORMAT,
+                ) as tar:
+                    yield tar
+                buffered.flush()
+                return
+
+            proc = subprocess.Popen(
+                [
+                    pigz,
+                    "-c",
+                    f"-{level}",
+                    "-p",
+                    str(os.cpu_count() or 1),
+                ],
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                bufsize=_ARCHIVE_BUFSIZE,
+            )
+            assert proc.stdin is not None and proc.stdout is not None
+            pump_errors: List[BaseException] = []
+
+            def pump() -> None:
+                try:
+                    shutil.copyfileobj(proc.stdout, writer, _ARCHIVE_BUFSIZE)
+                except BaseException as e:
+                    # Nothing drains pigz any more; kill it so the tar
+                    # writer gets EPIPE instead of blocking on a full pipe.
+                    pump_errors.append(e)
+                    proc.kill()
+
+            pump_thread = threading.Thread(target=pump, daemon=True)
+            pump_thread.start()
+            try:
+                with tarfile.open(
+                    fileobj=proc.stdin,
+                    mode="w|",
+                    bufsize=_ARCHIVE_BUFSIZE,
+                    format=_TAR_FORMAT,
+                ) as tar:
+                    yield tar
+            except BrokenPipeError:
+                if not pump_errors:
+                    raise
+            finally:
+                try:
+                    proc.stdin.close()
+                except BrokenPipeError:
+                    if not pump_errors:
+                        raise
+                finally:
+                    pump_thread.join()
+                    returncode = proc.wait()
+            if pump_errors:
+                raise pump_errors[0]
+            if returncode != 0:
+                raise RuntimeError(f"pigz exited with status {returncode}")
+
+    @contextmanager
+    def _archive_reader(self, archive_path: Path) -> Iterator[tarfile.TarFile]:
+        """Yield a streaming tar reader for *archive_path*."""
+        pigz = self._pigz_path()
+        if pigz is None:
+            with open(archive_path, "rb", buffering=_ARCHIVE_BUFSIZE) as raw:
+                with tarfile.open(
+                    fileobj=raw, mode="r:gz", copybufsize=_ARCHIVE_BUFSIZE
+                ) as tar:
+                    yield tar
+            return
+
+        proc = subprocess.Popen(
+            [pigz, "-d", "-c", str(archive_path)],
+            stdout=subprocess.PIPE,
+            bufsize=_ARCHIVE_BUFSIZE,
+        )
+        assert proc.stdout is not None
+        try:
+            with tarfile.open(
+                fileobj=proc.stdout,
+                mode="r|",
+                bufsize=_ARCHIVE_BUFSIZE,
+                copybufsize=_ARCHIVE_BUFSIZE,
+            ) as tar:
+                yield tar
+        finally:
+            proc.stdout.close()
+            returncode = proc.wait()
+        if returncode != 0:
+            raise RuntimeError(f"pigz exited with status {returncode}")
+
+    async def _calculate_checksum(
+        self, file_path: Path, algo: str = _CHECKSUM_ALGO
+    ) -> str:
+        """Calculate file checksum with *algo* (``blake3`` or a hashlib name)."""
         try:
-            hash_md5 = hashlib.md5()
-            with open(file_path, "rb") as f:
-                for chunk in iter(lambda: f.read(4096), b""):
-                    hash_md5.update(chunk)
-            return hash_md5.hexdigest()
+            return await asyncio.to_thread(_checksum_file, file_path, algo)
         except Exception as e:
             self.logger.error(f"Failed to calculate checksum: {e}")
             return ""
@@ -368,29 +998,71 @@ class BackupManager:
         """Save backup information."""
         try:
             info_file = self.backup_dir / backup_info.backup_id / "backup_info.json"
-            with open(info_file, "w") as f:
-                json.dump(backup_info.__dict__, f, indent=2)
+            data = asdict(backup_info)
+            await asyncio.to_thread(
+                info_file.write_bytes, _dump_json(data, indent=True)
+            )
+            async with self._index_lock:
+                index = await asyncio.to_thread(self._read_index)
+                index[backup_info.backup_id] = data
+                await asyncio.to_thread(self._write_index)
         except Exception as e:
             self.logger.error(f"Failed to save backup info: {e}")
 
     async def _load_backup_info(self, backup_id: str) -> Optional[BackupInfo]:
         """Load backup information."""
         try:
-            info_file = self.backup_dir / backup_id / "backup_info.json"
-            if info_file.exists():
-                with open(info_file, "r") as f:
-                    data = json.load(f)
-                    return BackupInfo(**data)
-            return None
+            index = await asyncio.to_thread(self._read_index)
+            data = index.get(backup_id)
+            if data is None:
+                # Not indexed (e.g. written by another process); read it directly.
+                data = await asyncio.to_thread(
+                    self._read_info_file, self.backup_dir / backup_id
+                )
+            return BackupInfo(**data) if data is not None else None
         except Exception as e:
             self.logger.error(f"Failed to load backup info: {e}")
             return None
 
+    def _read_info_file(self, backup_path: Path) -> Optional[Dict[str, Any]]:
+        """Return the parsed backup_info.json in *backup_path*, if any."""
+        info_file = backup_path / "backup_info.json"
+        try:
+            return _load_json(info_file.read_bytes())
+        except (OSError, ValueError):
+            return None
+
+    def _read_index(self) -> Dict[str, Dict[str, Any]]:
+        """Return the backup index, rebuilding it from backup dirs if missing."""
+        if self._index is not None:
+            return self._index
+
+        try:
+            self._index = _load_json(self._index_path.read_bytes())
+        except (OSError, ValueError):
+            self._index = {}
+            for backup_path in self.backup_dir.iterdir():
+                if backup_path.is_dir():
+                    data = self._read_info_file(backup_path)
+                    if data is not None:
+                        self._index[backup_path.name] = data
+            try:
+                self._write_index()
+            except OSError as e:
+                self.logger.warning(f"Failed to write backup index: {e}")
+        return self._index
+
+    def _write_index(self) -> None:
+        """Atomically rewrite index.json from the in-memory index."""
+        tmp_path = self._index_path.with_suffix(".tmp")
+        tmp_path.write_bytes(_dump_json(self._index))
+        os.replace(tmp_path, self._index_path)
+
     def _generate_backup_id(self) -> str:
         """Generate unique backup ID."""
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         return f"backup_{timestamp}"
 
-    def _get_timestamp(self) -> str:
-        """Get current timestamp string."""
-        return datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    def _get_timestamp(self) -> int:
+        """Get current timestamp in seconds since the epoch."""
+        return int(time.time())
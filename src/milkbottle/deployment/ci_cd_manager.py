@@ -2,11 +2,19 @@
 
 from __future__ import annotations
 
+import asyncio
+import functools
+import itertools
 import logging
-import subprocess
-from dataclasses import dataclass, field
+import os
+import shlex
+import shutil
+import time
+from collections import OrderedDict, deque
+from dataclasses import dataclass, field, replace
 from pathlib import Path
-from typing import List, Optional
+from string import Template
+from typing import ClassVar, Deque, Dict, List, Optional, Set, Tuple
 
 import yaml
 from rich.console import Console
@@ -14,8 +22,25 @@ from rich.progress import Progress, SpinnerColumn, TextColumn
 
 from ..config import MilkBottleConfig
 
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader as _YamlLoader  # type: ignore[assignment]
 
-@dataclass
+# Only the tail of a stage command's output is kept for error reporting.
+_OUTPUT_TAIL_LINES = 1000
+# Longest single output line read from a stage command.
+_STREAM_LINE_LIMIT = 1 << 20
+
+# Finished pipelines kept in memory, and log/artifact entries kept per pipeline.
+_MAX_PIPELINE_HISTORY = 500
+_MAX_LOG_ENTRIES = 1000
+
+# Pipeline stages, in execution order.
+_STAGE_NAMES = ("Testing", "Building", "Deploying")
+
+
+@dataclass(slots=True)
 class PipelineConfig:
     """CI/CD pipeline configuration."""
 
@@ -30,7 +55,7 @@ class PipelineConfig:
     notifications: List[str] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class PipelineStatus:
     """Pipeline execution status."""
 
@@ -38,33 +63,278 @@ class PipelineStatus:
     status: str = "pending"
     start_time: Optional[str] = None
     end_time: Optional[str] = None
-    stages_completed: List[str] = field(default_factory=list)
-    stages_failed: List[str] = field(default_factory=list)
-    logs: List[str] = field(default_factory=list)
-    artifacts: List[str] = field(default_factory=list)
+    stages_completed: Set[str] = field(default_factory=set)
+    stages_failed: Set[str] = field(default_factory=set)
+    logs: Deque[str] = field(default_factory=lambda: deque(maxlen=_MAX_LOG_ENTRIES))
+    artifacts: Deque[str] = field(
+        default_factory=lambda: deque(maxlen=_MAX_LOG_ENTRIES)
+    )
+
+    def __post_init__(self) -> None:
+        # Cap logs/artifacts however they were passed in.
+        if not isinstance(self.logs, deque) or self.logs.maxlen != _MAX_LOG_ENTRIES:
+            self.logs = deque(self.logs, maxlen=_MAX_LOG_ENTRIES)
+        if (
+            not isinstance(self.artifacts, deque)
+            or self.artifacts.maxlen != _MAX_LOG_ENTRIES
+        ):
+            self.artifacts = deque(self.artifacts, maxlen=_MAX_LOG_ENTRIES)
 
     def items(self):
         """Return items as dict for CLI compatibility."""
         return {
-            "Testing": {
-                "status": "success" if "Testing" in self.stages_completed else "failed",
+            stage: {
+                "status": "success" if stage in self.stages_completed else "failed",
                 "duration": 0.0,
-            },
-            "Building": {
-                "status": (
-                    "success" if "Building" in self.stages_completed else "failed"
-                ),
-                "duration": 0.0,
-            },
-            "Deploying": {
-                "status": (
-                    "success" if "Deploying" in self.stages_completed else "failed"
-                ),
-                "duration": 0.0,
-            },
+            }
+            for stage in _STAGE_NAMES
         }.items()
 
 
+# Generated CI files, relative to the working directory.
+_WORKFLOW_DIR = Path(".github/workflows")
+_GITLAB_CI_FILE = Path(".gitlab-ci.yml")
+_JENKINSFILE = Path("Jenkinsfile")
+
+# Their contents; $name-style fields come from PipelineConfig.
+_GITHUB_WORKFLOW_TEMPLATE = Template("""name: $name
+
+on:
+  push:
+    branches: [ $trigger_branch ]
+  pull_request:
+    branches: [ $trigger_branch ]
+
+jobs:
+  test:
+    runs-on: ubuntu-latest
+    steps:
+    - uses: actions/checkout@v3
+    - name: Set up Python
+      uses: actions/setup-python@v4
+      with:
+        python-version: '3.11'
+    - name: Install dependencies
+      run: |
+        python -m pip install --upgrade pip
+        pip install -r requirements.txt
+    - name: Run tests
+      run: $test_command
+
+  build:
+    needs: test
+    runs-on: ubuntu-latest
+    steps:
+    - uses: actions/checkout@v3
+    - name: Set up Python
+      uses: actions/setup-python@v4
+      with:
+        python-version: '3.11'
+    - name: Install dependencies
+      run: |
+        python -m pip install --upgrade pip
+        pip install -r requirements.txt
+    - name: Build package
+      run: $build_command
+
+  deploy:
+    needs: build
+    if: github.ref == 'refs/heads/$trigger_branch'
+    runs-on: ubuntu-latest
+    steps:
+    - uses: actions/checkout@v3
+    - name: Set up Python
+      uses: actions/setup-python@v4
+      with:
+        python-version: '3.11'
+    - name: Install dependencies
+      run: |
+        python -m pip install --upgrade pip
+        pip install -r requirements.txt
+    - name: Deploy
+      run: $deploy_command
+      env:
+        ENVIRONMENT: $environment
+""")
+
+_GITLAB_CI_TEMPLATE = Template("""stages:
+  - test
+  - build
+  - deploy
+
+test:
+  stage: test
+  image: python:3.11
+  script:
+    - pip install -r requirements.txt
+    - $test_command
+  only:
+    - $trigger_branch
+
+build:
+  stage: build
+  image: python:3.11
+  script:
+    - pip install -r requirements.txt
+    - $build_command
+  artifacts:
+    paths:
+      - dist/
+  only:
+    - $trigger_branch
+
+deploy:
+  stage: deploy
+  image: python:3.11
+  script:
+    - pip install -r requirements.txt
+    - $deploy_command
+  environment:
+    name: $environment
+  only:
+    - $trigger_branch
+""")
+
+_JENKINSFILE_TEMPLATE = Template("""pipeline {
+    agent any
+    
+    environment {
+        ENVIRONMENT = '$environment'
+    }
+    
+    stages {
+        stage('Test') {
+            steps {
+                sh 'pip install -r requirements.txt'
+                sh '$test_command'
+            }
+        }
+        
+        stage('Build') {
+            steps {
+                sh 'pip install -r requirements.txt'
+                sh '$build_command'
+            }
+        }
+        
+        stage('Deploy') {
+            when {
+                branch '$trigger_branch'
+            }
+            steps {
+                sh 'pip install -r requirements.txt'
+                sh '$deploy_command'
+            }
+        }
+    }
+    
+    post {
+        always {
+            cleanWs()
+        }
+    }
+}
+""")
+
+
+def _render(template: Template, pipeline_config: PipelineConfig) -> bytes:
+    """Fill *template* from *pipeline_config*'s fields, as UTF-8 bytes."""
+    return _render_fields(
+        template,
+        pipeline_config.name,
+        pipeline_config.trigger_branch,
+        pipeline_config.test_command,
+        pipeline_config.build_command,
+        pipeline_config.deploy_command,
+        pipeline_config.environment,
+    )
+
+
+@functools.lru_cache(maxsize=32)
+def _render_fields(
+    template: Template,
+    name: str,
+    trigger_branch: str,
+    test_command: str,
+    build_command: str,
+    deploy_command: str,
+    environment: str,
+) -> bytes:
+    # Memoised so regenerating an unchanged pipeline reuses the encoded bytes.
+    return template.substitute(
+        name=name,
+        trigger_branch=trigger_branch,
+        test_command=test_command,
+        build_command=build_command,
+        deploy_command=deploy_command,
+        environment=environment,
+    ).encode("utf-8")
+
+
+def _write_if_changed(path: Path, data: bytes) -> bool:
+    """Write *data* to *path* unless the file already holds exactly that.
+
+    Skipping identical rewrites keeps the file's mtime stable for tools that
+    watch it. Returns True if the file was written.
+    """
+    try:
+        if path.read_bytes() == data:
+            return False
+    except OSError:
+        pass
+    path.write_bytes(data)
+    return True
+
+
+@functools.lru_cache(maxsize=64)
+def _command_argv(command: str) -> Tuple[str, ...]:
+    """Split a stage *command* shell-style and resolve its executable once."""
+    argv = shlex.split(command)
+    if argv:
+        argv[0] = shutil.which(argv[0]) or argv[0]
+    return tuple(argv)
+
+
+# Parsed pipeline configs keyed by path, with the (mtime_ns, size) stamp they
+# were parsed at; least recently used first, at most _PIPELINE_CACHE_SIZE.
+_PIPELINE_CACHE_SIZE = 8
+_pipeline_configs: OrderedDict[str, Tuple[Tuple[int, int], PipelineConfig]] = (
+    OrderedDict()
+)
+
+
+def _load_pipeline_config(config_file: str) -> Optional[PipelineConfig]:
+    """Load *config_file*, reusing the parsed result while it is unchanged.
+
+    Returns None if the file does not exist. Callers get their own copy, so
+    they may modify it without affecting the cache.
+    """
+    try:
+        st = os.stat(config_file)
+    except FileNotFoundError:
+        return None
+    path = os.path.abspath(config_file)
+    stamp = (st.st_mtime_ns, st.st_size)
+    cached = _pipeline_configs.get(path)
+    if cached is not None and cached[0] == stamp:
+        pipeline_config = cached[1]
+        _pipeline_configs.move_to_end(path)
+    else:
+        with open(config_file, "rb") as f:
+            config_data = yaml.load(f, Loader=_YamlLoader)
+        pipeline_config = PipelineConfig(**config_data)
+        # A rewritten file replaces its stale entry.
+        _pipeline_configs[path] = (stamp, pipeline_config)
+        _pipeline_configs.move_to_end(path)
+        if len(_pipeline_configs) > _PIPELINE_CACHE_SIZE:
+            _pipeline_configs.popitem(last=False)
+    return replace(
+        pipeline_config,
+        stages=list(pipeline_config.stages),
+        notifications=list(pipeline_config.notifications),
+    )
+
+
 class CICDManager:
     """Continuous Integration and Deployment pipeline management."""
 
@@ -74,7 +344,11 @@ class CICDManager:
         self.console = Console()
         self.logger = logging.getLogger("milkbottle.cicd")
         self.current_pipeline: Optional[PipelineStatus] = None
-        self.pipeline_history: List[PipelineStatus] = []
+        self.pipeline_history: Deque[PipelineStatus] = deque(
+            maxlen=_MAX_PIPELINE_HISTORY
+        )
+        # pipeline_id -> status, for O(1) lookups by id
+        self._pipeline_index: Dict[str, PipelineStatus] = {}
 
     async def create_pipeline(
         self, pipeline_name: Optional[str] = None, config_file: Optional[str] = None
@@ -84,18 +358,22 @@ class CICDManager:
             self.logger.info("Creating CI/CD pipeline")
 
             # Load configuration
-            if config_file and Path(config_file).exists():
-                with open(config_file, "r") as f:
-                    config_data = yaml.safe_load(f)
-                    self.pipeline_config = PipelineConfig(**config_data)
+            if config_file:
+                pipeline_config = _load_pipeline_config(config_file)
+                if pipeline_config is not None:
+                    self.pipeline_config = pipeline_config
 
             if pipeline_name:
                 self.pipeline_config.name = pipeline_name
 
-            # Create pipeline files
-            await self._create_github_workflow()
-            await self._create_gitlab_ci()
-            await self._create_jenkins_pipeline()
+            # Create pipeline files; they are independent, so write them
+            # concurrently once the workflow directory exists.
+            await asyncio.to_thread(_WORKFLOW_DIR.mkdir, parents=True, exist_ok=True)
+            await asyncio.gather(
+                self._create_github_workflow(),
+                self._create_gitlab_ci(),
+                self._create_jenkins_pipeline(),
+            )
 
             self.logger.info(
                 f"Successfully created pipeline: {self.pipeline_config.name}"
@@ -120,42 +398,43 @@ class CICDManager:
                 status="running",
                 start_time=self._get_timestamp(),
             )
+            self._pipeline_index[pipeline_id] = self.current_pipeline
 
             # Set environment
             env = environment or self.pipeline_config.environment
 
             # Execute pipeline stages
-            stages = [
-                ("Testing", self._run_tests),
-                ("Building", self._run_build),
-                ("Deploying", self._run_deploy),
-            ]
-
             with Progress(
                 SpinnerColumn(),
                 TextColumn("[progress.description]{task.description}"),
                 console=self.console,
+                transient=True,
             ) as progress:
-                for stage_name, stage_func in stages:
-                    task = progress.add_task(stage_name, total=None)
+                # Lay out every stage row once; rows start as each stage runs.
+                task_ids = {
+                    stage_name: progress.add_task(stage_name, total=1, start=False)
+                    for stage_name in _STAGE_NAMES
+                }
+                for stage_name in _STAGE_NAMES:
+                    stage_func = getattr(self, self._STAGE_METHODS[stage_name])
+                    task = task_ids[stage_name]
+                    progress.start_task(task)
 
                     try:
                         success = await stage_func(env)
                         if success:
-                            self.current_pipeline.stages_completed.append(stage_name)
-                            progress.update(task, completed=True)
+                            self.current_pipeline.stages_completed.add(stage_name)
+                            progress.update(task, advance=1)
                         else:
-                            self.current_pipeline.stages_failed.append(stage_name)
-                            progress.update(task, completed=False)
+                            self.current_pipeline.stages_failed.add(stage_name)
                             self.current_pipeline.status = "failed"
                             break
 
                     except Exception as e:
                         error_msg = f"Stage '{stage_name}' failed: {e}"
                         self.logger.error(error_msg)
-                        self.current_pipeline.stages_failed.append(stage_name)
+                        self.current_pipeline.stages_failed.add(stage_name)
                         self.current_pipeline.logs.append(error_msg)
-                        progress.update(task, completed=False)
                         self.current_pipeline.status = "failed"
                         break
 
@@ -165,7 +444,10 @@ class CICDManager:
 
             self.current_pipeline.end_time = self._get_timestamp()
 
-            # Add to history
+            # Add to history, forgetting the oldest pipeline once it is full
+            if len(self.pipeline_history) == self.pipeline_history.maxlen:
+                evicted = self.pipeline_history[0]
+                self._pipeline_index.pop(evicted.pipeline_id, None)
             self.pipeline_history.append(self.current_pipeline)
 
             # Send notifications
@@ -188,19 +470,15 @@ class CICDManager:
     ) -> Optional[PipelineStatus]:
         """Get current or specific pipeline status."""
         if pipeline_id:
-            return next(
-                (
-                    pipeline
-                    for pipeline in self.pipeline_history
-                    if pipeline.pipeline_id == pipeline_id
-                ),
-                None,
-            )
+            return self._pipeline_index.get(pipeline_id)
         return self.current_pipeline
 
     async def list_pipelines(self, limit: int = 10) -> List[PipelineStatus]:
         """List recent pipeline executions."""
-        return self.pipeline_history[-limit:] if self.pipeline_history else []
+        # Walk from the newest end so only *limit* entries are touched.
+        recent = list(itertools.islice(reversed(self.pipeline_history), limit))
+        recent.reverse()
+        return recent
 
     async def cancel_pipeline(self, pipeline_id: str) -> bool:
         """Cancel a running pipeline."""
@@ -223,231 +501,123 @@ class CICDManager:
 
     async def _run_tests(self, environment: str) -> bool:
         """Run test stage."""
-        try:
-            self.logger.info("Running tests")
+        self.logger.info("Running tests")
 
-            # Run test command
-            cmd = self.pipeline_config.test_command.split()
-            result = subprocess.run(cmd, capture_output=True, text=True)
-
-            if result.returncode == 0:
-                self.logger.info("Tests passed")
-                return True
-            else:
-                self.logger.error(f"Tests failed: {result.stderr}")
-                return False
-
-        except Exception as e:
+        # Run test command
+        try:
+            cmd = list(_command_argv(self.pipeline_config.test_command))
+            returncode, output = await self._run_command(cmd)
+        except (OSError, ValueError) as e:
             self.logger.error(f"Test execution failed: {e}")
             return False
 
+        if returncode == 0:
+            self.logger.info("Tests passed")
+            return True
+        self.logger.error(f"Tests failed: {output}")
+        return False
+
     async def _run_build(self, environment: str) -> bool:
         """Run build stage."""
-        try:
-            self.logger.info("Building application")
-
-            # Run build command
-            cmd = self.pipeline_config.build_command.split()
-            result = subprocess.run(cmd, capture_output=True, text=True)
+        self.logger.info("Building application")
 
-            if result.returncode == 0:
-                self.logger.info("Build completed")
-                return True
-            else:
-                self.logger.error(f"Build failed: {result.stderr}")
-                return False
-
-        except Exception as e:
+        # Run build command
+        try:
+            cmd = list(_command_argv(self.pipeline_config.build_command))
+            returncode, output = await self._run_command(cmd)
+        except (OSError, ValueError) as e:
             self.logger.error(f"Build execution failed: {e}")
             return False
 
+        if returncode == 0:
+            self.logger.info("Build completed")
+            return True
+        self.logger.error(f"Build failed: {output}")
+        return False
+
     async def _run_deploy(self, environment: str) -> bool:
         """Run deploy stage."""
-        try:
-            self.logger.info(f"Deploying to {environment}")
+        self.logger.info(f"Deploying to {environment}")
 
-            # Run deploy command
-            cmd = self.pipeline_config.deploy_command.split()
+        # Run deploy command
+        try:
+            cmd = list(_command_argv(self.pipeline_config.deploy_command))
             cmd.extend(["--environment", environment])
-
-            result = subprocess.run(cmd, capture_output=True, text=True)
-
-            if result.returncode == 0:
-                self.logger.info("Deployment completed")
-                return True
-            else:
-                self.logger.error(f"Deployment failed: {result.stderr}")
-                return False
-
-        except Exception as e:
+            returncode, output = await self._run_command(cmd)
+        except (OSError, ValueError) as e:
             self.logger.error(f"Deployment execution failed: {e}")
             return False
 
-    async def _create_github_workflow(self) -> None:
-        """Create GitHub Actions workflow."""
-        workflow_content = f"""name: {self.pipeline_config.name}
-
-on:
-  push:
-    branches: [ {self.pipeline_config.trigger_branch} ]
-  pull_request:
-    branches: [ {self.pipeline_config.trigger_branch} ]
-
-jobs:
-  test:
-    runs-on: ubuntu-latest
-    steps:
-    - uses: actions/checkout@v3
-    - name: Set up Python
-      uses: actions/setup-python@v4
-      with:
-        python-version: '3.11'
-    - name: Install dependencies
-      run: |
-        python -m pip install --upgrade pip
-        pip install -r requirements.txt
-    - name: Run tests
-      run: {self.pipeline_config.test_command}
-
-  build:
-    needs: test
-    runs-on: ubuntu-latest
-    steps:
-    - uses: actions/checkout@v3
-    - name: Set up Python
-      uses: actions/setup-python@v4
-      with:
-        python-version: '3.11'
-    - name: Install dependencies
-      run: |
-        python -m pip install --upgrade pip
-        pip install -r requirements.txt
-    - name: Build package
-      run: {self.pipeline_config.build_command}
-
-  deploy:
-    needs: build
-    if: github.ref == 'refs/heads/{self.pipeline_config.trigger_branch}'
-    runs-on: ubuntu-latest
-    steps:
-    - uses: actions/checkout@v3
-    - name: Set up Python
-      uses: actions/setup-python@v4
-      with:
-        python-version: '3.11'
-    - name: Install dependencies
-      run: |
-        python -m pip install --upgrade pip
-        pip install -r requirements.txt
-    - name: Deploy
-      run: {self.pipeline_config.deploy_command}
-      env:
-        ENVIRONMENT: {self.pipeline_config.environment}
-"""
+        if returncode == 0:
+            self.logger.info("Deployment completed")
+            return True
+        self.logger.error(f"Deployment failed: {output}")
+        return False
+
+    async def _run_command(self, cmd: List[str]) -> Tuple[int, str]:
+        """Run *cmd* without blocking the event loop.
+
+        Output is streamed line by line and only the last
+        ``_OUTPUT_TAIL_LINES`` lines of stdout/stderr are kept, so verbose
+        commands do not buffer everything in memory. Returns the exit status
+        and that tail; on failure the tail is also added to the pipeline logs.
+        """
+        proc = await asyncio.create_subprocess_exec(
+            *cmd,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+            limit=_STREAM_LINE_LIMIT,
+        )
+        tail: Deque[str] = deque(maxlen=_OUTPUT_TAIL_LINES)
 
-        workflow_dir = Path(".github/workflows")
-        workflow_dir.mkdir(parents=True, exist_ok=True)
+        async def drain(stream: asyncio.StreamReader) -> None:
+            async for line in stream:
+                tail.append(line.decode(errors="replace").rstrip("\n"))
 
-        workflow_file = workflow_dir / f"{self.pipeline_config.name}.yml"
-        with open(workflow_file, "w") as f:
-            f.write(workflow_content)
+        assert proc.stdout is not None and proc.stderr is not None
+        try:
+            await asyncio.gather(drain(proc.stdout), drain(proc.stderr))
+            returncode = await proc.wait()
+        except BaseException:
+            # Cancelled or a stream error (e.g. an over-long line): don't
+            # leave the stage process running behind us.
+            if proc.returncode is None:
+                proc.kill()
+                await proc.wait()
+            raise
+
+        if returncode != 0 and self.current_pipeline is not None:
+            self.current_pipeline.logs.extend(tail)
+        return returncode, "\n".join(tail)
 
-        self.logger.info(f"Created GitHub workflow: {workflow_file}")
+    async def _create_github_workflow(self) -> None:
+        """Create GitHub Actions workflow."""
+        workflow_content = _render(_GITHUB_WORKFLOW_TEMPLATE, self.pipeline_config)
+        workflow_file = _WORKFLOW_DIR / f"{self.pipeline_config.name}.yml"
+        if await asyncio.to_thread(_write_if_changed, workflow_file, workflow_content):
+            self.logger.info(f"Created GitHub workflow: {workflow_file}")
+        else:
+            self.logger.info(f"GitHub workflow unchanged: {workflow_file}")
 
     async def _create_gitlab_ci(self) -> None:
         """Create GitLab CI configuration."""
-        gitlab_ci_content = f"""stages:
-  - test
-  - build
-  - deploy
-
-test:
-  stage: test
-  image: python:3.11
-  script:
-    - pip install -r requirements.txt
-    - {self.pipeline_config.test_command}
-  only:
-    - {self.pipeline_config.trigger_branch}
-
-build:
-  stage: build
-  image: python:3.11
-  script:
-    - pip install -r requirements.txt
-    - {self.pipeline_config.build_command}
-  artifacts:
-    paths:
-      - dist/
-  only:
-    - {self.pipeline_config.trigger_branch}
-
-deploy:
-  stage: deploy
-  image: python:3.11
-  script:
-    - pip install -r requirements.txt
-    - {self.pipeline_config.deploy_command}
-  environment:
-    name: {self.pipeline_config.environment}
-  only:
-    - {self.pipeline_config.trigger_branch}
-"""
-
-        gitlab_ci_file = Path(".gitlab-ci.yml")
-        with open(gitlab_ci_file, "w") as f:
-            f.write(gitlab_ci_content)
-
-        self.logger.info(f"Created GitLab CI configuration: {gitlab_ci_file}")
+        gitlab_ci_content = _render(_GITLAB_CI_TEMPLATE, self.pipeline_config)
+        if await asyncio.to_thread(
+            _write_if_changed, _GITLAB_CI_FILE, gitlab_ci_content
+        ):
+            self.logger.info(f"Created GitLab CI configuration: {_GITLAB_CI_FILE}")
+        else:
+            self.logger.info(f"GitLab CI configuration unchanged: {_GITLAB_CI_FILE}")
 
     async def _create_jenkins_pipeline(self) -> None:
         """Create Jenkins pipeline."""
-        jenkins_pipeline_content = f"""pipeline {{
-    agent any
-    
-    environment {{
-        ENVIRONMENT = '{self.pipeline_config.environment}'
-    }}
-    
-    stages {{
-        stage('Test') {{
-            steps {{
-                sh 'pip install -r requirements.txt'
-                sh '{self.pipeline_config.test_command}'
-            }}
-        }}
-        
-        stage('Build') {{
-            steps {{
-                sh 'pip install -r requirements.txt'
-                sh '{self.pipeline_config.build_command}'
-            }}
-        }}
-        
-        stage('Deploy') {{
-            when {{
-                branch '{self.pipeline_config.trigger_branch}'
-            }}
-            steps {{
-                sh 'pip install -r requirements.txt'
-                sh '{self.pipeline_config.deploy_command}'
-            }}
-        }}
-    }}
-    
-    post {{
-        always {{
-            cleanWs()
-        }}
-    }}
-}}
-"""
-
-        jenkins_file = Path("Jenkinsfile")
-        with open(jenkins_file, "w") as f:
-            f.write(jenkins_pipeline_content)
-
-        self.logger.info(f"Created Jenkins pipeline: {jenkins_file}")
+        jenkins_pipeline_content = _render(_JENKINSFILE_TEMPLATE, self.pipeline_config)
+        if await asyncio.to_thread(
+            _write_if_changed, _JENKINSFILE, jenkins_pipeline_content
+        ):
+            self.logger.info(f"Created Jenkins pipeline: {_JENKINSFILE}")
+        else:
+            self.logger.info(f"Jenkins pipeline unchanged: {_JENKINSFILE}")
 
     async def _send_notifications(self) -> None:
         """Send pipeline notifications."""
@@ -458,13 +628,14 @@ deploy:
             status = self.current_pipeline.status
             pipeline_id = self.current_pipeline.pipeline_id
 
-            for notification in self.pipeline_config.notifications:
-                if notification == "email":
-                    await self._send_email_notification(status, pipeline_id)
-                elif notification == "slack":
-                    await self._send_slack_notification(status, pipeline_id)
-                elif notification == "webhook":
-                    await self._send_webhook_notification(status, pipeline_id)
+            # Unknown notification kinds are ignored.
+            await asyncio.gather(
+                *(
+                    getattr(self, self._NOTIFIERS[notification])(status, pipeline_id)
+                    for notification in self.pipeline_config.notifications
+                    if notification in self._NOTIFIERS
+                )
+            )
 
         except Exception as e:
             self.logger.error(f"Failed to send notifications: {e}")
@@ -490,15 +661,31 @@ deploy:
             f"Webhook notification sent for pipeline {pipeline_id}: {status}"
         )
 
+    # Stage name -> runner method, for run_pipeline.
+    _STAGE_METHODS: ClassVar[Dict[str, str]] = {
+        "Testing": "_run_tests",
+        "Building": "_run_build",
+        "Deploying": "_run_deploy",
+    }
+
+    # Notification kind -> name of the sender method, for _send_notifications.
+    _NOTIFIERS: ClassVar[Dict[str, str]] = {
+        "email": "_send_email_notification",
+        "slack": "_send_slack_notification",
+        "webhook": "_send_webhook_notification",
+    }
+
     def _generate_pipeline_id(self) -> str:
         """Generate unique pipeline ID."""
-        from datetime import datetime
-
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        return f"{self.pipeline_config.name}_{timestamp}"
+        timestamp = time.strftime("%Y%m%d_%H%M%S")
+        pipeline_id = base_id = f"{self.pipeline_config.name}_{timestamp}"
+        # Pipelines started within the same second get a sequence suffix.
+        seq = 1
+        while pipeline_id in self._pipeline_index:
+            seq += 1
+            pipeline_id = f"{base_id}_{seq}"
+        return pipeline_id
 
     def _get_timestamp(self) -> str:
         """Get current timestamp string."""
-        from datetime import datetime
-
-        return datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        return time.strftime("%Y-%m-%d %H:%M:%S")
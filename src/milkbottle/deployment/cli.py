@@ -1,23 +1,217 @@
 """CLI commands for the deployment system."""
 
+from __future__ import annotations
+
 import asyncio
+import contextlib
+import functools
+import json
+import signal
+from dataclasses import asdict
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Awaitable,
+    Callable,
+    Coroutine,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    TypeVar,
+    Union,
+)
 
 import click
 from rich.console import Console
 from rich.progress import Progress, SpinnerColumn, TextColumn
+from rich.style import Style
 from rich.table import Table
+from rich.text import Text
 
 from ..config import MilkBottleConfig
-from .backup_manager import BackupManager
-from .ci_cd_manager import CICDManager
-from .deployment_manager import DeploymentManager
-from .docker_manager import DockerManager
-from .monitoring_manager import MonitoringManager
-from .scaling_manager import ScalingManager
-from .security_manager import SecurityManager
+from ..utils import run_async
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+if TYPE_CHECKING:
+    from .backup_manager import BackupManager
+    from .ci_cd_manager import CICDManager
+    from .deployment_manager import DeploymentManager
+    from .docker_manager import DockerManager
+    from .monitoring_manager import MonitoringManager
+    from .scaling_manager import ScalingManager
+    from .security_manager import SecurityManager
 
 console = Console()
 
+T = TypeVar("T")
+
+# Status cells are styled Text rather than markup strings, which Rich would
+# otherwise re-parse for every row.
+_OK = Style(color="green")
+_BAD = Style(color="red")
+
+# Two-column (Metric, Value) layout shared by the key/value reports.
+_METRIC_COLUMNS = (("Metric", "cyan"), ("Value", "green"))
+
+
+def _async_command(func: Callable[..., Coroutine[Any, Any, Any]]) -> Callable[..., Any]:
+    """Turn an ``async def`` command handler into a plain Click callback."""
+
+    @functools.wraps(func)
+    def wrapper(*args: Any, **kwargs: Any) -> Any:
+        # The process-wide CLI loop, shared with `milk repl` and `milk`.
+        return run_async(func(*args, **kwargs))
+
+    return wrapper
+
+
+async def _until_signalled(task: asyncio.Task[Any]) -> bool:
+    """Wait for *task* or SIGINT/SIGTERM; return True if a signal came first."""
+    loop = asyncio.get_running_loop()
+    stop = asyncio.Event()
+    handled = []
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        try:
+            loop.add_signal_handler(sig, stop.set)
+        except (NotImplementedError, RuntimeError):  # Windows, non-main thread
+            continue
+        handled.append(sig)
+
+    waiter = asyncio.create_task(stop.wait())
+    try:
+        await asyncio.wait({task, waiter}, return_when=asyncio.FIRST_COMPLETED)
+    finally:
+        # The loop is shared with later commands; leave no handlers behind.
+        for sig in handled:
+            loop.remove_signal_handler(sig)
+        waiter.cancel()
+    return stop.is_set()
+
+
+# Status lines are plain strings, so they go straight to click rather than
+# through Rich's markup and rendering pipeline.
+def _ok(message: str) -> None:
+    click.secho(f"✅ {message}", fg="green")
+
+
+def _err(message: str) -> None:
+    click.secho(f"❌ {message}", fg="red")
+
+
+def _render_table(
+    title: str,
+    columns: Sequence[Tuple[str, str]],
+    rows: Sequence[Sequence[Union[str, Text]]],
+) -> None:
+    """Print a table of *rows* under *columns* given as ``(header, style)``."""
+    # Widths come from one pass over the cells, so Rich does not measure every
+    # cell again when it lays the table out. If the table would not fit the
+    # terminal, Rich's own measuring decides how to squeeze it.
+    widths: List[Optional[int]] = [
+        max([len(header), *(len(row[index]) for row in rows)])
+        for index, (header, _) in enumerate(columns)
+    ]
+    if sum(widths) + 3 * len(widths) + 1 > console.width:
+        widths = [None] * len(widths)
+
+    table = Table(title=title)
+    for (header, style), width in zip(columns, widths):
+        table.add_column(header, style=style, width=width)
+    for row in rows:
+        table.add_row(*row)
+    console.print(table)
+
+
+def _echo_json(data: Any) -> None:
+    """Write *data* to stdout as JSON, bypassing Rich entirely."""
+    if orjson is not None:
+        click.echo(orjson.dumps(data))
+    else:
+        click.echo(json.dumps(data))
+
+
+async def _spin(description: str, awaitable: Awaitable[T]) -> T:
+    """Await *awaitable* behind a transient spinner labelled *description*."""
+    # A spinner needs no more than a few frames a second; the default of ten
+    # wakes the refresh thread more often than the display is worth.
+    with Progress(
+        SpinnerColumn(),
+        TextColumn("[progress.description]{task.description}"),
+        console=console,
+        transient=True,
+        refresh_per_second=4,
+    ) as progress:
+        progress.add_task(description, total=None)
+        return await awaitable
+
+
+@functools.lru_cache(maxsize=1)
+def _config() -> MilkBottleConfig:
+    """Return the configuration shared by every deployment command."""
+    return MilkBottleConfig()
+
+
+# Managers are imported and built on first use, once per process, so a
+# command only loads the manager module it actually needs.
+@functools.lru_cache(maxsize=1)
+def _backup_manager() -> BackupManager:
+    from .backup_manager import BackupManager
+
+    return BackupManager(_config())
+
+
+@functools.lru_cache(maxsize=1)
+def _cicd_manager() -> CICDManager:
+    from .ci_cd_manager import CICDManager
+
+    return CICDManager(_config())
+
+
+@functools.lru_cache(maxsize=1)
+def _deployment_manager() -> DeploymentManager:
+    from .deployment_manager import DeploymentManager
+
+    return DeploymentManager(_config())
+
+
+@functools.lru_cache(maxsize=1)
+def _docker_manager() -> DockerManager:
+    from .docker_manager import DockerManager
+
+    return DockerManager(_config())
+
+
+@functools.lru_cache(maxsize=1)
+def _monitoring_manager() -> MonitoringManager:
+    from .monitoring_manager import MonitoringManager
+
+    return MonitoringManager(_config())
+
+
+@functools.lru_cache(maxsize=1)
+def _scaling_manager() -> ScalingManager:
+    from .scaling_manager import ScalingManager
+
+    return ScalingManager(_config())
+
+
+@functools.lru_cache(maxsize=1)
+def _security_manager() -> SecurityManager:
+    from .security_manager import SecurityManager
+
+    return SecurityManager(_config())
+
+
+# Reporting commands can emit JSON for scripts instead of rendering a table.
+_json_option = click.option(
+    "--json", "as_json", is_flag=True, help="Output JSON instead of a table"
+)
+
 
 @click.group()
 def deployment():
@@ -34,95 +228,79 @@ def scaling():
 @scaling.command()
 @click.option("--count", default=1, help="Number of instances to add")
 @click.option("--reason", default="manual", help="Reason for scaling")
-def scale_up(count: int, reason: str):
+@_async_command
+async def scale_up(count: int, reason: str):
     """Scale up the application by adding instances."""
+    scaling_manager = _scaling_manager()
 
-    async def _scale_up():
-        config = MilkBottleConfig()
-        scaling_manager = ScalingManager(config)
+    result = await _spin("Scaling up...", scaling_manager.scale_up(count, reason))
 
-        with Progress(
-            SpinnerColumn(),
-            TextColumn("[progress.description]{task.description}"),
-            console=console,
-        ) as progress:
-            _task = progress.add_task("Scaling up...", total=None)
-
-            result = await scaling_manager.scale_up(count, reason)
-
-            if result:
-                console.print(f"✅ Successfully scaled up by {count} instances")
-            else:
-                console.print("❌ Failed to scale up")
-
-    asyncio.run(_scale_up())
+    if result:
+        _ok(f"Successfully scaled up by {count} instances")
+    else:
+        _err("Failed to scale up")
 
 
 @scaling.command()
 @click.option("--count", default=1, help="Number of instances to remove")
 @click.option("--reason", default="manual", help="Reason for scaling")
-def scale_down(count: int, reason: str):
+@_async_command
+async def scale_down(count: int, reason: str):
     """Scale down the application by removing instances."""
+    scaling_manager = _scaling_manager()
 
-    async def _scale_down():
-        config = MilkBottleConfig()
-        scaling_manager = ScalingManager(config)
-
-        with Progress(
-            SpinnerColumn(),
-            TextColumn("[progress.description]{task.description}"),
-            console=console,
-        ) as progress:
-            _task = progress.add_task("Scaling down...", total=None)
-
-            result = await scaling_manager.scale_down(count, reason)
-
-            if result:
-                console.print(f"✅ Successfully scaled down by {count} instances")
-            else:
-                console.print("❌ Failed to scale down")
+    result = await _spin("Scaling down...", scaling_manager.scale_down(count, reason))
 
-    asyncio.run(_scale_down())
+    if result:
+        _ok(f"Successfully scaled down by {count} instances")
+    else:
+        _err("Failed to scale down")
 
 
 @scaling.command()
-def list_instances():
+@_json_option
+@_async_command
+async def list_instances(as_json: bool):
     """List all application instances."""
-
-    async def _list_instances():
-        config = MilkBottleConfig()
-        scaling_manager = ScalingManager(config)
-
-        instances = await scaling_manager.get_instances()
-
-        if not instances:
-            console.print("No instances found")
-            return
-
-        table = Table(title="Application Instances")
-        table.add_column("Instance ID", style="cyan")
-        table.add_column("Host", style="green")
-        table.add_column("Port", style="yellow")
-        table.add_column("Status", style="blue")
-        table.add_column("CPU %", style="red")
-        table.add_column("Memory %", style="red")
-        table.add_column("Health", style="green")
-
-        for instance in instances:
-            health_color = "green" if instance.health_status == "healthy" else "red"
-            table.add_row(
+    scaling_manager = _scaling_manager()
+
+    instances = await scaling_manager.get_instances()
+
+    if as_json:
+        _echo_json([asdict(instance) for instance in instances])
+        return
+
+    if not instances:
+        console.print("No instances found")
+        return
+
+    _render_table(
+        "Application Instances",
+        (
+            ("Instance ID", "cyan"),
+            ("Host", "green"),
+            ("Port", "yellow"),
+            ("Status", "blue"),
+            ("CPU %", "red"),
+            ("Memory %", "red"),
+            ("Health", "green"),
+        ),
+        [
+            (
                 instance.instance_id,
                 instance.host,
                 str(instance.port),
                 instance.status,
                 f"{instance.cpu_usage:.1f}",
                 f"{instance.memory_usage:.1f}",
-                f"[{health_color}]{instance.health_status}[/{health_color}]",
+                Text(
+                    instance.health_status,
+                    style=_OK if instance.health_status == "healthy" else _BAD,
+                ),
             )
-
-        console.print(table)
-
-    asyncio.run(_list_instances())
+            for instance in instances
+        ],
+    )
 
 
 @deployment.group()
@@ -136,66 +314,54 @@ def security():
 @click.argument("email")
 @click.argument("password")
 @click.option("--role", default="user", help="User role (admin, user, guest)")
-def create_user(username: str, email: str, password: str, role: str):
+@_async_command
+async def create_user(username: str, email: str, password: str, role: str):
     """Create a new user."""
+    security_manager = _security_manager()
 
-    async def _create_user():
-        config = MilkBottleConfig()
-        security_manager = SecurityManager(config)
-
-        result = await security_manager.create_user(username, email, password, role)
-
-        if result:
-            console.print(f"✅ Successfully created user: {username}")
-        else:
-            console.print("❌ Failed to create user")
+    result = await security_manager.create_user(username, email, password, role)
 
-    asyncio.run(_create_user())
+    if result:
+        _ok(f"Successfully created user: {username}")
+    else:
+        _err("Failed to create user")
 
 
 @security.command()
 @click.argument("username")
 @click.argument("password")
-def authenticate(username: str, password: str):
+@_async_command
+async def authenticate(username: str, password: str):
     """Authenticate a user."""
+    security_manager = _security_manager()
 
-    async def _authenticate():
-        config = MilkBottleConfig()
-        security_manager = SecurityManager(config)
-
-        result = await security_manager.authenticate_user(username, password)
-
-        if result:
-            console.print(f"✅ Authentication successful for: {username}")
-        else:
-            console.print("❌ Authentication failed")
+    result = await security_manager.authenticate_user(username, password)
 
-    asyncio.run(_authenticate())
+    if result:
+        _ok(f"Authentication successful for: {username}")
+    else:
+        _err("Authentication failed")
 
 
 @security.command()
-def security_report():
+@_json_option
+@_async_command
+async def security_report(as_json: bool):
     """Generate security report."""
+    security_manager = _security_manager()
 
-    async def _security_report():
-        config = MilkBottleConfig()
-        security_manager = SecurityManager(config)
+    report = await security_manager.generate_security_report()
 
-        report = await security_manager.generate_security_report()
-
-        if report:
-            table = Table(title="Security Report")
-            table.add_column("Metric", style="cyan")
-            table.add_column("Value", style="green")
-
-            for key, value in report.items():
-                table.add_row(key, str(value))
-
-            console.print(table)
-        else:
-            console.print("❌ Failed to generate security report")
-
-    asyncio.run(_security_report())
+    if report and as_json:
+        _echo_json(report)
+    elif report:
+        _render_table(
+            "Security Report",
+            _METRIC_COLUMNS,
+            [(key, str(value)) for key, value in report.items()],
+        )
+    else:
+        _err("Failed to generate security report")
 
 
 @deployment.group()
@@ -205,48 +371,51 @@ def monitoring():
 
 
 @monitoring.command()
-def start_monitoring():
-    """Start system monitoring."""
-
-    async def _start_monitoring():
-        config = MilkBottleConfig()
-        monitoring_manager = MonitoringManager(config)
+@_async_command
+async def start_monitoring():
+    """Start system monitoring and keep it running until interrupted."""
+    monitoring_manager = _monitoring_manager()
 
-        result = await monitoring_manager.start_monitoring()
+    monitor = asyncio.create_task(monitoring_manager.start_monitoring())
+    _ok("Monitoring started, press Ctrl-C to stop")
+    stopped = await _until_signalled(monitor)
 
-        if result:
-            console.print("✅ Monitoring started successfully")
-        else:
-            console.print("❌ Failed to start monitoring")
+    if not stopped:
+        # The monitoring loop only returns on its own when it failed.
+        _err("Failed to start monitoring")
+        return
 
-    asyncio.run(_start_monitoring())
+    await monitoring_manager.stop_monitoring()
+    monitor.cancel()
+    with contextlib.suppress(asyncio.CancelledError):
+        await monitor
+    _ok("Monitoring stopped")
 
 
 @monitoring.command()
-def system_metrics():
+@_json_option
+@_async_command
+async def system_metrics(as_json: bool):
     """Get current system metrics."""
-
-    async def _system_metrics():
-        config = MilkBottleConfig()
-        monitoring_manager = MonitoringManager(config)
-
-        metrics = await monitoring_manager.collect_system_metrics()
-
-        if metrics:
-            table = Table(title="System Metrics")
-            table.add_column("Metric", style="cyan")
-            table.add_column("Value", style="green")
-
-            table.add_row("CPU Usage", f"{metrics.cpu_percent:.1f}%")
-            table.add_row("Memory Usage", f"{metrics.memory_percent:.1f}%")
-            table.add_row("Disk Usage", f"{metrics.disk_usage_percent:.1f}%")
-            table.add_row("Uptime", f"{metrics.uptime:.1f} seconds")
-
-            console.print(table)
-        else:
-            console.print("❌ Failed to collect system metrics")
-
-    asyncio.run(_system_metrics())
+    monitoring_manager = _monitoring_manager()
+
+    metrics = await monitoring_manager.collect_system_metrics()
+
+    if metrics and as_json:
+        _echo_json(asdict(metrics))
+    elif metrics:
+        _render_table(
+            "System Metrics",
+            _METRIC_COLUMNS,
+            [
+                ("CPU Usage", f"{metrics.cpu_percent:.1f}%"),
+                ("Memory Usage", f"{metrics.memory_percent:.1f}%"),
+                ("Disk Usage", f"{metrics.disk_usage_percent:.1f}%"),
+                ("Uptime", f"{metrics.uptime:.1f} seconds"),
+            ],
+        )
+    else:
+        _err("Failed to collect system metrics")
 
 
 @deployment.group()
@@ -256,54 +425,34 @@ def backup():
 
 
 @backup.command()
-def create_backup():
+@_async_command
+async def create_backup():
     """Create a new backup."""
+    backup_manager = _backup_manager()
 
-    async def _create_backup():
-        config = MilkBottleConfig()
-        backup_manager = BackupManager(config)
-
-        with Progress(
-            SpinnerColumn(),
-            TextColumn("[progress.description]{task.description}"),
-            console=console,
-        ) as progress:
-            _task = progress.add_task("Creating backup...", total=None)
-
-            result = await backup_manager.create_backup()
+    result = await _spin("Creating backup...", backup_manager.create_backup())
 
-            if result:
-                console.print("✅ Backup created successfully")
-            else:
-                console.print("❌ Failed to create backup")
-
-    asyncio.run(_create_backup())
+    if result:
+        _ok("Backup created successfully")
+    else:
+        _err("Failed to create backup")
 
 
 @backup.command()
 @click.argument("backup_id")
-def restore_backup(backup_id: str):
+@_async_command
+async def restore_backup(backup_id: str):
     """Restore from a backup."""
+    backup_manager = _backup_manager()
 
-    async def _restore_backup():
-        config = MilkBottleConfig()
-        backup_manager = BackupManager(config)
-
-        with Progress(
-            SpinnerColumn(),
-            TextColumn("[progress.description]{task.description}"),
-            console=console,
-        ) as progress:
-            _task = progress.add_task("Restoring backup...", total=None)
-
-            result = await backup_manager.restore_backup(backup_id)
+    result = await _spin(
+        "Restoring backup...", backup_manager.restore_backup(backup_id)
+    )
 
-            if result:
-                console.print("✅ Backup restored successfully")
-            else:
-                console.print("❌ Failed to restore backup")
-
-    asyncio.run(_restore_backup())
+    if result:
+        _ok("Backup restored successfully")
+    else:
+        _err("Failed to restore backup")
 
 
 @deployment.group()
@@ -313,53 +462,31 @@ def docker():
 
 
 @docker.command()
-def build_image():
+@_async_command
+async def build_image():
     """Build Docker image."""
+    docker_manager = _docker_manager()
 
-    async def _build_image():
-        config = MilkBottleConfig()
-        docker_manager = DockerManager(config)
-
-        with Progress(
-            SpinnerColumn(),
-            TextColumn("[progress.description]{task.description}"),
-            console=console,
-        ) as progress:
-            _task = progress.add_task("Building Docker image...", total=None)
-
-            result = await docker_manager.build_image()
-
-            if result:
-                console.print("✅ Docker image built successfully")
-            else:
-                console.print("❌ Failed to build Docker image")
+    result = await _spin("Building Docker image...", docker_manager.build_image())
 
-    asyncio.run(_build_image())
+    if result:
+        _ok("Docker image built successfully")
+    else:
+        _err("Failed to build Docker image")
 
 
 @docker.command()
-def run_container():
+@_async_command
+async def run_container():
     """Run Docker container."""
+    docker_manager = _docker_manager()
 
-    async def _run_container():
-        config = MilkBottleConfig()
-        docker_manager = DockerManager(config)
-
-        with Progress(
-            SpinnerColumn(),
-            TextColumn("[progress.description]{task.description}"),
-            console=console,
-        ) as progress:
-            _task = progress.add_task("Running Docker container...", total=None)
-
-            result = await docker_manager.run_container()
-
-            if result:
-                console.print("✅ Docker container started successfully")
-            else:
-                console.print("❌ Failed to start Docker container")
+    result = await _spin("Running Docker container...", docker_manager.run_container())
 
-    asyncio.run(_run_container())
+    if result:
+        _ok("Docker container started successfully")
+    else:
+        _err("Failed to start Docker container")
 
 
 @deployment.group()
@@ -369,106 +496,97 @@ def cicd():
 
 
 @cicd.command()
-def run_pipeline():
+@_async_command
+async def run_pipeline():
     """Run CI/CD pipeline."""
+    cicd_manager = _cicd_manager()
 
-    async def _run_pipeline():
-        config = MilkBottleConfig()
-        cicd_manager = CICDManager(config)
+    result = await _spin("Running CI/CD pipeline...", cicd_manager.run_pipeline())
 
-        with Progress(
-            SpinnerColumn(),
-            TextColumn("[progress.description]{task.description}"),
-            console=console,
-        ) as progress:
-            _task = progress.add_task("Running CI/CD pipeline...", total=None)
-
-            result = await cicd_manager.run_pipeline()
-
-            if result:
-                console.print("✅ CI/CD pipeline completed successfully")
-            else:
-                console.print("❌ CI/CD pipeline failed")
-
-    asyncio.run(_run_pipeline())
+    if result:
+        _ok("CI/CD pipeline completed successfully")
+    else:
+        _err("CI/CD pipeline failed")
 
 
 @cicd.command()
-def pipeline_status():
+@_json_option
+@_async_command
+async def pipeline_status(as_json: bool):
     """Get CI/CD pipeline status."""
-
-    async def _pipeline_status():
-        config = MilkBottleConfig()
-        cicd_manager = CICDManager(config)
-
-        status = await cicd_manager.get_pipeline_status()
-
-        if status:
-            table = Table(title="CI/CD Pipeline Status")
-            table.add_column("Stage", style="cyan")
-            table.add_column("Status", style="green")
-            table.add_column("Duration", style="yellow")
-
-            for stage, info in status.items():
-                status_color = "green" if info.get("status") == "success" else "red"
-                table.add_row(
+    cicd_manager = _cicd_manager()
+
+    status = await cicd_manager.get_pipeline_status()
+
+    if status and as_json:
+        _echo_json(dict(status.items()))
+    elif status:
+        _render_table(
+            "CI/CD Pipeline Status",
+            (("Stage", "cyan"), ("Status", "green"), ("Duration", "yellow")),
+            [
+                (
                     stage,
-                    f"[{status_color}]{info.get('status', 'unknown')}[/{status_color}]",
+                    Text(
+                        info.get("status", "unknown"),
+                        style=_OK if info.get("status") == "success" else _BAD,
+                    ),
                     f"{info.get('duration', 0):.1f}s",
                 )
-
-            console.print(table)
-        else:
-            console.print("❌ Failed to get pipeline status")
-
-    asyncio.run(_pipeline_status())
+                for stage, info in status.items()
+            ],
+        )
+    else:
+        _err("Failed to get pipeline status")
 
 
 @deployment.command()
-def deploy():
+@click.option(
+    "--build-image",
+    is_flag=True,
+    help="Build the Docker image alongside the deployment",
+)
+@_async_command
+async def deploy(build_image: bool):
     """Deploy the application."""
+    deployment_manager = _deployment_manager()
+
+    if build_image:
+        # The image build does not depend on the deployment steps, so both
+        # run concurrently and the command takes as long as the slower one.
+        image_built, result = await _spin(
+            "Deploying application...",
+            asyncio.gather(
+                _docker_manager().build_image(),
+                deployment_manager.deploy_application(),
+            ),
+        )
+        if image_built:
+            _ok("Docker image built successfully")
+        else:
+            _err("Failed to build Docker image")
+    else:
+        result = await _spin(
+            "Deploying application...", deployment_manager.deploy_application()
+        )
 
-    async def _deploy():
-        config = MilkBottleConfig()
-        deployment_manager = DeploymentManager(config)
-
-        with Progress(
-            SpinnerColumn(),
-            TextColumn("[progress.description]{task.description}"),
-            console=console,
-        ) as progress:
-            _task = progress.add_task("Deploying application...", total=None)
-
-            result = await deployment_manager.deploy_application()
-
-            if result:
-                console.print("✅ Application deployed successfully")
-            else:
-                console.print("❌ Deployment failed")
-
-    asyncio.run(_deploy())
+    if result:
+        _ok("Application deployed successfully")
+    else:
+        _err("Deployment failed")
 
 
 @deployment.command()
-def rollback():
+@_async_command
+async def rollback():
     """Rollback the deployment."""
+    deployment_manager = _deployment_manager()
 
-    async def _rollback():
-        config = MilkBottleConfig()
-        deployment_manager = DeploymentManager(config)
-
-        with Progress(
-            SpinnerColumn(),
-            TextColumn("[progress.description]{task.description}"),
-            console=console,
-        ) as progress:
-            _task = progress.add_task("Rolling back deployment...", total=None)
-
-            result = await deployment_manager.rollback_deployment()
-
-            if result:
-                console.print("✅ Deployment rolled back successfully")
-            else:
-                console.print("❌ Rollback failed")
+    result = await _spin(
+        "Rolling back deployment...", deployment_manager.rollback_deployment()
+    )
 
-    asyncio.run(_rollback())
+    if result:
+        _ok("Deployment rolled back successfully")
+    else:
+        _err("Rollback failed")
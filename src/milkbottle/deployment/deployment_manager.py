@@ -3,22 +3,182 @@
 from __future__ import annotations
 
 import asyncio
+import contextlib
+import json
 import logging
 import os
+import shlex
 import shutil
 import subprocess
 import sys
+import threading
+import time
+from collections import deque
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import (
+    IO,
+    TYPE_CHECKING,
+    Any,
+    Awaitable,
+    Callable,
+    Deque,
+    Dict,
+    List,
+    Optional,
+    Tuple,
+)
 
-import yaml
 from rich.console import Console
-from rich.progress import Progress, SpinnerColumn, TextColumn
 
 from ..config import MilkBottleConfig
 from ..utils import ErrorHandler, InputValidator
 
+if TYPE_CHECKING:
+    from rich.progress import Progress, TaskID
+
+# Health endpoint of a freshly started service, polled with exponential
+# backoff (seconds) until it answers or the deadline passes.
+_HEALTH_CHECK_URL = "http://localhost:8000/health"
+_HEALTH_CHECK_FIRST_DELAY = 0.2
+_HEALTH_CHECK_MAX_DELAY = 2.0
+_HEALTH_CHECK_DEADLINE = 15.0
+
+# Hosts whose target path is checked on the local filesystem; any other host
+# is checked over ssh.
+_LOCAL_HOSTS = frozenset({"localhost", "127.0.0.1", "::1"})
+
+# Seconds a target that passed the host and path probes is trusted before
+# the next deploy to it probes again.
+_VALIDATION_TTL = 30.0
+
+# Number of deployments kept in the deployment history.
+_MAX_DEPLOYMENT_HISTORY = 10
+
+# Environment variables a deployment target must define.
+_REQUIRED_ENV_VARS = ("DATABASE_URL", "SECRET_KEY", "LOG_LEVEL")
+
+# A deployment step: an argument-less coroutine method of DeploymentManager.
+StepFunc = Callable[[], Awaitable[None]]
+
+
+# PyYAML and rich.progress are imported on first use, so importing this
+# module (e.g. only for DeploymentConfig) does not pay for them.
+def _yaml_load(stream: IO[bytes]) -> Any:
+    """Parse YAML from *stream* with the C loader when PyYAML has one."""
+    import yaml
+
+    try:
+        from yaml import CSafeLoader as Loader
+    except ImportError:  # PyYAML built without libyaml
+        from yaml import SafeLoader as Loader  # type: ignore[assignment]
+    return yaml.load(stream, Loader=Loader)
+
+
+def _yaml_dump(data: Any, stream: IO[str]) -> None:
+    """Serialize *data* as YAML to *stream* with the C dumper when available."""
+    import yaml
+
+    try:
+        from yaml import CSafeDumper as Dumper
+    except ImportError:  # PyYAML built without libyaml
+        from yaml import SafeDumper as Dumper  # type: ignore[assignment]
+    yaml.dump(data, stream, Dumper=Dumper)
+
+
+def _step_progress(console: Console) -> Progress:
+    """Return the spinner display shown while deployment steps run."""
+    from rich.progress import Progress, SpinnerColumn, TextColumn
+
+    return Progress(
+        SpinnerColumn(),
+        TextColumn("[progress.description]{task.description}"),
+        console=console,
+        refresh_per_second=4,
+    )
+
+
+async def _run_command(
+    cmd: List[str],
+    cwd: Optional[str] = None,
+    capture_output: bool = False,
+    check: bool = True,
+) -> int:
+    """Run *cmd* without blocking the event loop and return its exit code.
+
+    Mirrors ``subprocess.run``: with *check*, a non-zero exit raises
+    ``CalledProcessError``. If the awaiting step is cancelled the child is
+    killed rather than left running.
+    """
+    pipe = asyncio.subprocess.PIPE if capture_output else None
+    proc = await asyncio.create_subprocess_exec(*cmd, cwd=cwd, stdout=pipe, stderr=pipe)
+    try:
+        stdout, stderr = await proc.communicate()
+    except asyncio.CancelledError:
+        if proc.returncode is None:
+            proc.kill()
+            await proc.wait()
+        raise
+
+    if check and proc.returncode:
+        raise subprocess.CalledProcessError(proc.returncode, cmd, stdout, stderr)
+    return proc.returncode
+
+
+def _copytree_until(src: Path, dst: Path, stop: threading.Event) -> None:
+    """``shutil.copytree`` that gives up before the next file once *stop* is set."""
+
+    def copy(source: str, destination: str) -> str:
+        if stop.is_set():
+            raise RuntimeError(f"copy of {src} cancelled")
+        return shutil.copy2(source, destination)
+
+    shutil.copytree(src, dst, copy_function=copy)
+
+
+def _load_legacy_history(history_file: Path) -> List[Dict[str, Any]]:
+    """Return the records in the YAML history written by older releases.
+
+    Returns an empty list if the file does not exist.
+    """
+    try:
+        with open(history_file, "rb") as f:
+            return _yaml_load(f) or []
+    except FileNotFoundError:
+        return []
+
+
+# The history log is compacted to its last _MAX_DEPLOYMENT_HISTORY records
+# once it grows past this many bytes.
+_HISTORY_LOG_COMPACT_BYTES = 64 * 1024
+
+
+def _read_history_log(history_log: Path) -> List[Dict[str, Any]]:
+    """Return the last _MAX_DEPLOYMENT_HISTORY records in *history_log*.
+
+    The log holds one JSON record per line, oldest first. It is streamed, so
+    only the retained records are ever held in memory.
+    """
+    records: Deque[Dict[str, Any]] = deque(maxlen=_MAX_DEPLOYMENT_HISTORY)
+    with open(history_log, "rb") as f:
+        records.extend(json.loads(line) for line in f if line.strip())
+    return list(records)
+
+
+def _append_history_log(history_log: Path, records: List[Dict[str, Any]]) -> None:
+    """Append *records* to *history_log*, compacting it once it grows large."""
+    history_log.parent.mkdir(parents=True, exist_ok=True)
+    with open(history_log, "a", encoding="utf-8") as f:
+        f.writelines(json.dumps(record) + "\n" for record in records)
+        size = f.tell()
+
+    if size > _HISTORY_LOG_COMPACT_BYTES:
+        kept = _read_history_log(history_log)
+        tmp = history_log.with_suffix(".tmp")
+        with open(tmp, "w", encoding="utf-8") as f:
+            f.writelines(json.dumps(record) + "\n" for record in kept)
+        os.replace(tmp, history_log)
+
 
 @dataclass
 class DeploymentConfig:
@@ -46,11 +206,38 @@ class DeploymentStatus:
     errors: List[str] = field(default_factory=list)
     warnings: List[str] = field(default_factory=list)
     metrics: Dict[str, Any] = field(default_factory=dict)
+    deployment_id: Optional[str] = None
 
 
 class DeploymentManager:
     """Main deployment orchestration system."""
 
+    # Deployment steps as (name, method, dependencies). Preparing, building
+    # and backing up are independent and run concurrently; everything after
+    # them is a chain.
+    _DEPLOY_STEPS: Tuple[Tuple[str, str, Tuple[str, ...]], ...] = (
+        ("Preparing deployment", "_prepare_deployment", ()),
+        ("Building application", "_build_application", ()),
+        ("Creating backup", "_create_backup", ()),
+        (
+            "Deploying application",
+            "_deploy_application",
+            ("Preparing deployment", "Building application", "Creating backup"),
+        ),
+        ("Configuring services", "_configure_services", ("Deploying application",)),
+        ("Starting services", "_start_services", ("Configuring services",)),
+        ("Running health checks", "_run_health_checks", ("Starting services",)),
+        ("Finalizing deployment", "_finalize_deployment", ("Running health checks",)),
+    )
+
+    # Rollback steps as (name, method), run in order.
+    _ROLLBACK_STEPS: Tuple[Tuple[str, str], ...] = (
+        ("Stopping current services", "_stop_services"),
+        ("Restoring previous version", "_restore_previous_version"),
+        ("Starting previous services", "_start_services"),
+        ("Running health checks", "_run_health_checks"),
+    )
+
     def __init__(self, config: MilkBottleConfig):
         self.config = config
         self.deployment_config = DeploymentConfig()
@@ -59,6 +246,16 @@ class DeploymentManager:
         self.error_handler = ErrorHandler()
         self.validator = InputValidator()
         self.current_deployment: Optional[DeploymentStatus] = None
+        # (host, port, path, environment) -> monotonic time of the last
+        # successful host and path probe.
+        self._validated_targets: Dict[Tuple[str, int, str, str], float] = {}
+
+        # Resolved once; every step derives its directories from these.
+        self._root = Path.home() / ".milkbottle"
+        self.history_log = self._root / "deployment_history.jsonl"
+        self.history_file = self._root / "deployment_history.yaml"
+        self.deployments_root = self._root / "deployments"
+        self.backups_root = self._root / "backups"
 
     async def deploy(
         self,
@@ -70,9 +267,11 @@ class DeploymentManager:
         try:
             self.logger.info(f"Starting deployment to {environment}")
 
-            # Initialize deployment
+            # Initialize deployment. The start timestamp doubles as the
+            # deployment id, which every step derives its directories from.
+            started = self._get_timestamp()
             self.current_deployment = DeploymentStatus(
-                status="running", start_time=self._get_timestamp()
+                status="running", deployment_id=started, start_time=started
             )
 
             # Update deployment config
@@ -87,37 +286,18 @@ class DeploymentManager:
                 self.logger.error("Deployment configuration validation failed")
                 return False
 
+            # The per-deployment directories below these are created by the
+            # steps themselves, without walking the tree again.
+            os.makedirs(self.deployments_root, exist_ok=True)
+            os.makedirs(self.backups_root, exist_ok=True)
+
             # Execute deployment steps
-            deployment_steps = [
-                ("Preparing deployment", self._prepare_deployment),
-                ("Building application", self._build_application),
-                ("Creating backup", self._create_backup),
-                ("Deploying application", self._deploy_application),
-                ("Configuring services", self._configure_services),
-                ("Starting services", self._start_services),
-                ("Running health checks", self._run_health_checks),
-                ("Finalizing deployment", self._finalize_deployment),
-            ]
-
-            with Progress(
-                SpinnerColumn(),
-                TextColumn("[progress.description]{task.description}"),
-                console=self.console,
-            ) as progress:
-                for step_name, step_func in deployment_steps:
-                    task = progress.add_task(step_name, total=None)
-
-                    try:
-                        await step_func()
-                        self.current_deployment.steps_completed.append(step_name)
-                        progress.update(task, completed=True)
-
-                    except Exception as e:
-                        error_msg = f"Step '{step_name}' failed: {e}"
-                        self.logger.error(error_msg)
-                        self.current_deployment.errors.append(error_msg)
-                        progress.update(task, completed=False)
-                        return False
+            deployment_steps = {
+                name: (getattr(self, method_name), deps)
+                for name, method_name, deps in self._DEPLOY_STEPS
+            }
+            if not await self._run_steps(deployment_steps, self.current_deployment):
+                return False
 
             # Mark deployment as successful
             self.current_deployment.status = "completed"
@@ -145,31 +325,14 @@ class DeploymentManager:
                 self.logger.error("No previous deployment found for rollback")
                 return False
 
-            # Execute rollback steps
-            rollback_steps = [
-                ("Stopping current services", self._stop_services),
-                ("Restoring previous version", self._restore_previous_version),
-                ("Starting previous services", self._start_services),
-                ("Running health checks", self._run_health_checks),
-            ]
-
-            with Progress(
-                SpinnerColumn(),
-                TextColumn("[progress.description]{task.description}"),
-                console=self.console,
-            ) as progress:
-                for step_name, step_func in rollback_steps:
-                    task = progress.add_task(step_name, total=None)
-
-                    try:
-                        await step_func()
-                        progress.update(task, completed=True)
-
-                    except Exception as e:
-                        error_msg = f"Rollback step '{step_name}' failed: {e}"
-                        self.logger.error(error_msg)
-                        progress.update(task, completed=False)
-                        return False
+            # Execute rollback steps, each one waiting for the one before it
+            rollback_steps: Dict[str, Tuple[StepFunc, Tuple[str, ...]]] = {}
+            previous: Tuple[str, ...] = ()
+            for name, method_name in self._ROLLBACK_STEPS:
+                rollback_steps[name] = (getattr(self, method_name), previous)
+                previous = (name,)
+            if not await self._run_steps(rollback_steps):
+                return False
 
             self.logger.info("Rollback completed successfully")
             return True
@@ -195,36 +358,117 @@ class DeploymentManager:
         deployments = []
 
         # Read deployment history from file
-        deployment_history_file = (
-            Path.home() / ".milkbottle" / "deployment_history.yaml"
-        )
-
-        if deployment_history_file.exists():
-            try:
-                with open(deployment_history_file, "r") as f:
-                    history = yaml.safe_load(f) or []
-                    deployments.extend(history)
-            except Exception as e:
-                self.logger.error(f"Failed to read deployment history: {e}")
+        try:
+            deployments.extend(await asyncio.to_thread(self._read_deployment_history))
+        except Exception as e:
+            self.logger.error(f"Failed to read deployment history: {e}")
 
         return deployments
 
-    async def _validate_deployment_config(self) -> bool:
-        """Validate deployment configuration."""
+    async def _run_steps(
+        self,
+        steps: Dict[str, Tuple[StepFunc, Tuple[str, ...]]],
+        record: Optional[DeploymentStatus] = None,
+    ) -> bool:
+        """Run *steps* with the step spinner display; see `_run_step_graph`."""
+        with _step_progress(self.console) as progress:
+            return await self._run_step_graph(steps, progress, record)
+
+    async def _run_step_graph(
+        self,
+        steps: Dict[str, Tuple[StepFunc, Tuple[str, ...]]],
+        progress: Progress,
+        record: Optional[DeploymentStatus] = None,
+    ) -> bool:
+        """Run *steps* as soon as their dependencies have completed.
+
+        Steps are scheduled in topological order (Kahn's algorithm), so
+        independent steps overlap and the wall time follows the critical
+        path. The first failing step cancels every step still running and
+        makes the whole run fail.
+
+        Every step gets its progress row up front; rows are only started and
+        advanced while the graph runs. Completed steps and the failure, if
+        any, are recorded on *record*.
+        """
+        pending = {name: set(deps) for name, (_, deps) in steps.items()}
+        dependents: Dict[str, List[str]] = {name: [] for name in steps}
+        for name, (_, deps) in steps.items():
+            for dep in deps:
+                dependents[dep].append(name)
+
+        progress_tasks: Dict[str, TaskID] = {
+            name: progress.add_task(name, total=1, start=False) for name in steps
+        }
+        running: Dict[asyncio.Task[None], str] = {}
+
+        def launch_ready() -> None:
+            for name in [name for name, deps in pending.items() if not deps]:
+                del pending[name]
+                running[asyncio.create_task(steps[name][0]())] = name
+                progress.start_task(progress_tasks[name])
+
+        launch_ready()
         try:
-            # Check if target host is reachable
-            if not await self._check_host_connectivity():
-                self.logger.error(
-                    f"Cannot connect to target host: {self.deployment_config.target_host}"
+            while running:
+                done, _ = await asyncio.wait(
+                    running, return_when=asyncio.FIRST_COMPLETED
                 )
-                return False
+                for task in done:
+                    step_name = running.pop(task)
+                    error = task.exception()
+                    if error is not None:
+                        error_msg = f"Step '{step_name}' failed: {error}"
+                        self.logger.error(error_msg)
+                        if record is not None:
+                            record.errors.append(error_msg)
+                        progress.stop_task(progress_tasks[step_name])
+                        return False
 
-            # Check if target path exists and is writable
-            if not await self._check_target_path():
-                self.logger.error(
-                    f"Target path not accessible: {self.deployment_config.target_path}"
-                )
-                return False
+                    if record is not None:
+                        record.steps_completed.append(step_name)
+                    progress.advance(progress_tasks[step_name])
+                    for dependent in dependents[step_name]:
+                        pending[dependent].discard(step_name)
+                launch_ready()
+        finally:
+            for task in running:
+                task.cancel()
+            if running:
+                await asyncio.gather(*running, return_exceptions=True)
+
+        return True
+
+    async def _validate_deployment_config(self) -> bool:
+        """Validate deployment configuration."""
+        try:
+            config = self.deployment_config
+            target = (
+                config.target_host,
+                config.target_port,
+                config.target_path,
+                config.environment,
+            )
+            validated_at = self._validated_targets.get(target)
+            if (
+                validated_at is None
+                or time.monotonic() - validated_at >= _VALIDATION_TTL
+            ):
+                # Check if target host is reachable
+                if not await self._check_host_connectivity():
+                    self.logger.error(
+                        f"Cannot connect to target host: {config.target_host}"
+                    )
+                    return False
+
+                # Check if target path exists and is writable
+                if not await self._check_target_path():
+                    self.logger.error(
+                        f"Target path not accessible: {config.target_path}"
+                    )
+                    return False
+
+                self._validated_targets[target] = time.monotonic()
 
             # Validate environment configuration
             if not self._validate_environment_config():
@@ -242,10 +486,8 @@ class DeploymentManager:
         self.logger.info("Preparing deployment environment")
 
         # Create deployment directory
-        deployment_dir = (
-            Path.home() / ".milkbottle" / "deployments" / self._get_timestamp()
-        )
-        deployment_dir.mkdir(parents=True, exist_ok=True)
+        deployment_dir = self.deployments_root / self._deployment_id
+        deployment_dir.mkdir(exist_ok=True)
 
         # Copy application files
         app_files = [
@@ -255,28 +497,30 @@ class DeploymentManager:
             "README.md",
         ]
 
+        # File copies run in worker threads so concurrent steps keep going.
         for file_path in app_files:
             source_path = Path(file_path)
             if source_path.exists():
                 if source_path.is_dir():
-                    shutil.copytree(source_path, deployment_dir / source_path.name)
+                    await asyncio.to_thread(
+                        shutil.copytree, source_path, deployment_dir / source_path.name
+                    )
                 else:
-                    shutil.copy2(source_path, deployment_dir)
+                    await asyncio.to_thread(shutil.copy2, source_path, deployment_dir)
 
     async def _build_application(self) -> None:
         """Build application for deployment."""
         self.logger.info("Building application")
 
         # Install dependencies
-        subprocess.run(
+        await _run_command(
             [sys.executable, "-m", "pip", "install", "-r", "requirements.txt"],
-            check=True,
             capture_output=True,
         )
 
         # Run tests
-        subprocess.run(
-            [sys.executable, "-m", "pytest", "tests/"], check=True, capture_output=True
+        await _run_command(
+            [sys.executable, "-m", "pytest", "tests/"], capture_output=True
         )
 
     async def _create_backup(self) -> None:
@@ -288,12 +532,65 @@ class DeploymentManager:
         self.logger.info("Creating backup of current deployment")
 
         # Create backup directory
-        backup_dir = Path.home() / ".milkbottle" / "backups" / self._get_timestamp()
-        backup_dir.mkdir(parents=True, exist_ok=True)
+        backup_dir = self.backups_root / self._deployment_id
+        backup_dir.mkdir(exist_ok=True)
 
         # Backup current deployment
-        if Path(self.deployment_config.target_path).exists():
-            shutil.copytree(self.deployment_config.target_path, backup_dir / "current")
+        target_path = Path(self.deployment_config.target_path)
+        if not target_path.exists():
+            return
+
+        # The snapshot is copied under a scratch name and renamed to
+        # "current" only once complete. This step runs alongside the build,
+        # so it can fail or be cancelled mid-copy; rollback and --link-dest
+        # must never pick up a partial snapshot.
+        snapshot = backup_dir / "current"
+        partial = backup_dir / "current.partial"
+        try:
+            # With rsync, files unchanged since the previous backup are
+            # hard-linked to it, so only changed files are copied or stored.
+            rsync = shutil.which("rsync")
+            if rsync:
+                cmd = [rsync, "-a"]
+                previous = self._previous_backup(backup_dir)
+                if previous is not None:
+                    cmd.append(f"--link-dest={previous}")
+                cmd += [f"{target_path}/", f"{partial}/"]
+                await _run_command(cmd, capture_output=True)
+            else:
+                stop = threading.Event()
+                copy = asyncio.ensure_future(
+                    asyncio.to_thread(_copytree_until, target_path, partial, stop)
+                )
+                try:
+                    await asyncio.shield(copy)
+                except asyncio.CancelledError:
+                    # The worker thread cannot be cancelled; stop it and
+                    # wait so nothing is written after this step ends.
+                    stop.set()
+                    await asyncio.gather(copy, return_exceptions=True)
+                    raise
+            os.replace(partial, snapshot)
+        except BaseException:
+            shutil.rmtree(partial, ignore_errors=True)
+            with contextlib.suppress(OSError):
+                backup_dir.rmdir()
+            raise
+
+    def _previous_backup(self, backup_dir: Path) -> Optional[Path]:
+        """Return the newest backup snapshot older than *backup_dir*, if any."""
+        snapshots = sorted(
+            (
+                entry / "current"
+                for entry in backup_dir.parent.iterdir()
+                if entry.name < backup_dir.name
+            ),
+            reverse=True,
+        )
+        for snapshot in snapshots:
+            if snapshot.is_dir():
+                return snapshot.resolve()
+        return None
 
     async def _deploy_application(self) -> None:
         """Deploy application to target."""
@@ -306,11 +603,11 @@ class DeploymentManager:
         target_path.mkdir(parents=True, exist_ok=True)
 
         # Copy application files
-        deployment_dir = (
-            Path.home() / ".milkbottle" / "deployments" / self._get_timestamp()
-        )
+        deployment_dir = self.deployments_root / self._deployment_id
         if deployment_dir.exists():
-            shutil.copytree(deployment_dir, target_path, dirs_exist_ok=True)
+            await asyncio.to_thread(
+                shutil.copytree, deployment_dir, target_path, dirs_exist_ok=True
+            )
 
     async def _configure_services(self) -> None:
         """Configure application services."""
@@ -327,7 +624,7 @@ class DeploymentManager:
 
         config_file = Path(self.deployment_config.target_path) / "service_config.yaml"
         with open(config_file, "w") as f:
-            yaml.dump(service_config, f)
+            _yaml_dump(service_config, f)
 
     async def _start_services(self) -> None:
         """Start application services."""
@@ -337,33 +634,58 @@ class DeploymentManager:
         service_file = Path(self.deployment_config.target_path) / "milkbottle.service"
 
         if service_file.exists():
-            subprocess.run(["systemctl", "start", "milkbottle"], check=True)
+            await _run_command(["systemctl", "start", "milkbottle"])
         else:
             # Fallback to direct start
-            subprocess.run(
+            await _run_command(
                 [sys.executable, "-m", "milkbottle"],
                 cwd=self.deployment_config.target_path,
-                check=True,
             )
 
     async def _run_health_checks(self) -> None:
         """Run health checks on deployed application."""
         self.logger.info("Running health checks")
 
-        # Wait for services to start
-        await asyncio.sleep(5)
-
         # Check if application is responding
         try:
-            import requests
-
-            response = requests.get("http://localhost:8000/health", timeout=10)
-            if response.status_code != 200:
-                raise Exception(f"Health check failed: {response.status_code}")
+            await self._poll_health()
         except Exception as e:
             self.logger.error(f"Health check failed: {e}")
             raise
 
+    async def _poll_health(self) -> None:
+        """Poll the health endpoint until it answers 200 or time runs out.
+
+        Polling backs off exponentially from a short first delay instead of
+        waiting a fixed five seconds, so a service that starts quickly is
+        confirmed quickly.
+        """
+        import aiohttp
+
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + _HEALTH_CHECK_DEADLINE
+        delay = _HEALTH_CHECK_FIRST_DELAY
+        failure = "no response"
+
+        async with aiohttp.ClientSession() as session:
+            while True:
+                await asyncio.sleep(delay)
+                remaining = deadline - loop.time()
+                timeout = aiohttp.ClientTimeout(total=max(min(10.0, remaining), 0.1))
+                try:
+                    async with session.get(
+                        _HEALTH_CHECK_URL, timeout=timeout
+                    ) as response:
+                        if response.status == 200:
+                            return
+                        failure = str(response.status)
+                except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                    failure = str(e) or type(e).__name__
+
+                delay = min(delay * 2, _HEALTH_CHECK_MAX_DELAY)
+                if loop.time() + delay >= deadline:
+                    raise Exception(f"{_HEALTH_CHECK_URL} is not healthy: {failure}")
+
     async def _finalize_deployment(self) -> None:
         """Finalize deployment."""
         self.logger.info("Finalizing deployment")
@@ -372,54 +694,71 @@ class DeploymentManager:
         await self._update_deployment_history()
 
         # Clean up temporary files
-        deployment_dir = (
-            Path.home() / ".milkbottle" / "deployments" / self._get_timestamp()
-        )
+        deployment_dir = self.deployments_root / self._deployment_id
         if deployment_dir.exists():
-            shutil.rmtree(deployment_dir)
+            await asyncio.to_thread(shutil.rmtree, deployment_dir)
 
     async def _stop_services(self) -> None:
         """Stop current services."""
         self.logger.info("Stopping current services")
 
         try:
-            subprocess.run(["systemctl", "stop", "milkbottle"], check=True)
+            await _run_command(["systemctl", "stop", "milkbottle"])
         except subprocess.CalledProcessError:
             # Fallback to process termination
-            subprocess.run(["pkill", "-f", "milkbottle"])
+            await _run_command(["pkill", "-f", "milkbottle"], check=False)
 
     async def _restore_previous_version(self) -> None:
         """Restore previous version."""
         self.logger.info("Restoring previous version")
 
-        # Find latest backup
-        backup_dir = Path.home() / ".milkbottle" / "backups"
-        if backup_dir.exists():
-            if backups := sorted(
-                backup_dir.iterdir(), key=lambda x: x.name, reverse=True
-            ):
-                latest_backup = backups[0] / "current"
-                if latest_backup.exists():
-                    shutil.rmtree(self.deployment_config.target_path)
-                    shutil.copytree(latest_backup, self.deployment_config.target_path)
+        # Find the latest complete backup. Backup names are zero-padded
+        # timestamps, so the greatest name is the newest one.
+        try:
+            with os.scandir(self.backups_root) as entries:
+                latest = max(
+                    (
+                        entry
+                        for entry in entries
+                        if os.path.isdir(os.path.join(entry.path, "current"))
+                    ),
+                    key=lambda entry: entry.name,
+                    default=None,
+                )
+        except FileNotFoundError:
+            return
+
+        if latest is not None:
+            latest_backup = Path(latest.path) / "current"
+            await asyncio.to_thread(shutil.rmtree, self.deployment_config.target_path)
+            await asyncio.to_thread(
+                shutil.copytree,
+                latest_backup,
+                self.deployment_config.target_path,
+            )
 
     async def _check_host_connectivity(self) -> bool:
         """Check if target host is reachable."""
         try:
-            import socket
-
-            sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-            sock.settimeout(5)
-            result = sock.connect_ex(
-                (self.deployment_config.target_host, self.deployment_config.target_port)
+            _, writer = await asyncio.wait_for(
+                asyncio.open_connection(
+                    self.deployment_config.target_host,
+                    self.deployment_config.target_port,
+                ),
+                timeout=5,
             )
-            sock.close()
-            return result == 0
-        except Exception:
+        except (asyncio.TimeoutError, OSError):
             return False
+        writer.close()
+        with contextlib.suppress(OSError):
+            await writer.wait_closed()
+        return True
 
     async def _check_target_path(self) -> bool:
         """Check if target path is accessible."""
+        if self.deployment_config.target_host not in _LOCAL_HOSTS:
+            return await self._check_remote_path()
+
         try:
             target_path = Path(self.deployment_config.target_path)
             if target_path.exists():
@@ -430,14 +769,34 @@ class DeploymentManager:
         except Exception:
             return False
 
+    async def _check_remote_path(self) -> bool:
+        """Check over ssh that the target path can be created and written."""
+        config = self.deployment_config
+        path = shlex.quote(config.target_path)
+        cmd = [
+            "ssh",
+            "-o",
+            "BatchMode=yes",
+            "-o",
+            "ConnectTimeout=5",
+            "-p",
+            str(config.target_port),
+            f"{config.target_user}@{config.target_host}",
+            f"mkdir -p -- {path} && test -w {path}",
+        ]
+        try:
+            returncode = await asyncio.wait_for(
+                _run_command(cmd, capture_output=True, check=False), timeout=15
+            )
+        except (OSError, asyncio.TimeoutError):
+            return False
+        return returncode == 0
+
     def _validate_environment_config(self) -> bool:
         """Validate environment configuration."""
-        required_vars = ["DATABASE_URL", "SECRET_KEY", "LOG_LEVEL"]
-
-        for var in required_vars:
-            if not os.getenv(var):
-                self.logger.warning(f"Environment variable {var} not set")
-                return False
+        if missing := [var for var in _REQUIRED_ENV_VARS if not os.environ.get(var)]:
+            self.logger.warning(f"Environment variables not set: {', '.join(missing)}")
+            return False
 
         return True
 
@@ -456,47 +815,52 @@ class DeploymentManager:
 
         return None
 
+    def _read_deployment_history(self) -> List[Dict[str, Any]]:
+        """Return the recorded deployments, oldest first (blocking)."""
+        try:
+            return _read_history_log(self.history_log)
+        except FileNotFoundError:
+            # Older releases only wrote the YAML history.
+            return _load_legacy_history(self.history_file)
+
     async def _update_deployment_history(self) -> None:
-        """Update deployment history."""
-        deployment_history_file = (
-            Path.home() / ".milkbottle" / "deployment_history.yaml"
-        )
+        """Append the current deployment to the deployment history."""
+        if not self.current_deployment:
+            return
 
-        history = []
-        if deployment_history_file.exists():
-            try:
-                with open(deployment_history_file, "r") as f:
-                    history = yaml.safe_load(f) or []
-            except Exception:
-                history = []
-
-        # Add current deployment
-        if self.current_deployment:
-            deployment_record = {
-                "id": self._get_timestamp(),
-                "status": self.current_deployment.status,
-                "start_time": self.current_deployment.start_time,
-                "end_time": self.current_deployment.end_time,
-                "environment": self.deployment_config.environment,
-                "target_host": self.deployment_config.target_host,
-                "steps_completed": self.current_deployment.steps_completed,
-                "errors": self.current_deployment.errors,
-                "warnings": self.current_deployment.warnings,
-            }
+        record = {
+            "id": self._deployment_id,
+            "status": self.current_deployment.status,
+            "start_time": self.current_deployment.start_time,
+            "end_time": self.current_deployment.end_time,
+            "environment": self.deployment_config.environment,
+            "target_host": self.deployment_config.target_host,
+            "steps_completed": self.current_deployment.steps_completed,
+            "errors": self.current_deployment.errors,
+            "warnings": self.current_deployment.warnings,
+        }
+        await asyncio.to_thread(self._append_deployment_record, record)
 
-            history.append(deployment_record)
+    def _append_deployment_record(self, record: Dict[str, Any]) -> None:
+        """Append *record* to the history log (blocking)."""
+        records = [record]
 
-            # Keep only last 10 deployments
-            if len(history) > 10:
-                history = history[-10:]
+        # The first append carries the legacy YAML history over into the log.
+        if not self.history_log.exists():
+            try:
+                records[:0] = _load_legacy_history(self.history_file)
+            except Exception as e:
+                self.logger.warning(f"Could not migrate deployment history: {e}")
+
+        _append_history_log(self.history_log, records)
 
-        # Write updated history
-        deployment_history_file.parent.mkdir(parents=True, exist_ok=True)
-        with open(deployment_history_file, "w") as f:
-            yaml.dump(history, f)
+    @property
+    def _deployment_id(self) -> str:
+        """Id of the running deployment, fixed when it started."""
+        if self.current_deployment and self.current_deployment.deployment_id:
+            return self.current_deployment.deployment_id
+        return self._get_timestamp()
 
     def _get_timestamp(self) -> str:
         """Get current timestamp string."""
-        from datetime import datetime
-
-        return datetime.now().strftime("%Y%m%d_%H%M%S")
+        return time.strftime("%Y%m%d_%H%M%S")
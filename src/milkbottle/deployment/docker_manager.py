@@ -2,18 +2,68 @@
 
 from __future__ import annotations
 
+import asyncio
+import json
 import logging
-import subprocess
+import time
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from string import Template
+from typing import Any, Dict, List, Optional, Set, Tuple
 
-import yaml
 from rich.console import Console
 from rich.progress import Progress, SpinnerColumn, TextColumn
 
 from ..config import MilkBottleConfig
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Parser for docker's JSON lines; orjson's C decoder when it is installed.
+_json_loads = orjson.loads if orjson is not None else json.loads
+
+# `docker ps` status reported for a container after each lifecycle event.
+_EVENT_STATUS = {
+    "create": "Created",
+    "start": "Up",
+    "restart": "Up",
+    "unpause": "Up",
+    "pause": "Up (Paused)",
+}
+
+# Most docker CLI processes a DockerManager runs at once, so concurrent
+# callers do not swamp the daemon.
+_DOCKER_CONCURRENCY = 8
+
+# Seconds a successful docker listing is reused before the daemon is asked
+# again.
+_LISTING_TTL = 1.0
+
+# Longest single line of docker JSON output; containers with many labels
+# easily exceed asyncio's 64 KiB default.
+_STREAM_LINE_LIMIT = 1 << 20
+
+
+# docker-compose.yml written by create_docker_compose; the values are filled
+# in as JSON.
+_COMPOSE_TEMPLATE = Template("""version: "3.8"
+services:
+  milkbottle:
+    build: .
+    container_name: $container_name
+    ports: $ports
+    volumes: $volumes
+    environment: $environment
+    restart: unless-stopped
+    healthcheck:
+      test: ["CMD", "curl", "-f", "http://localhost:8000/health"]
+      interval: 30s
+      timeout: 10s
+      retries: "3"
+""")
+
 
 @dataclass
 class DockerConfig:
@@ -36,6 +86,31 @@ class DockerManager:
         self.docker_config = DockerConfig()
         self.console = Console()
         self.logger = logging.getLogger("milkbottle.docker")
+        self._docker_sem = asyncio.Semaphore(_DOCKER_CONCURRENCY)
+        # Read-only command -> (monotonic time, records) of its last success.
+        self._cache: Dict[Tuple[str, ...], Tuple[float, List[Dict[str, Any]]]] = {}
+        self._cache_ttl = _LISTING_TTL
+        # Inside `async with`, container listings are served from a map kept
+        # current by a `docker events` stream instead of polling `docker ps`.
+        self._watch_events = False
+        self._events_task: Optional[asyncio.Task[None]] = None
+        self._container_state: Optional[Dict[str, Dict[str, Any]]] = None
+        # Followers dropped by invalidate() that are still shutting down.
+        self._retired_tasks: Set[asyncio.Task[None]] = set()
+
+    async def __aenter__(self) -> DockerManager:
+        self._watch_events = True
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.close()
+
+    async def close(self) -> None:
+        """Stop following docker events."""
+        self._watch_events = False
+        self._drop_container_state()
+        if self._retired_tasks:
+            await asyncio.gather(*self._retired_tasks, return_exceptions=True)
 
     async def build_image(
         self,
@@ -65,15 +140,16 @@ class DockerManager:
             ) as progress:
                 task = progress.add_task("Building Docker image", total=None)
 
-                result = subprocess.run(cmd, capture_output=True, text=True)
+                returncode, _, stderr = await self._run(cmd)
+                self.invalidate()
 
-                if result.returncode == 0:
+                if returncode == 0:
                     progress.update(task, completed=True)
                     self.logger.info(f"Successfully built image: {name}:{tag}")
                     return True
                 else:
                     progress.update(task, completed=False)
-                    self.logger.error(f"Docker build failed: {result.stderr}")
+                    self.logger.error(f"Docker build failed: {stderr}")
                     return False
 
         except Exception as e:
@@ -128,15 +204,16 @@ class DockerManager:
             ) as progress:
                 task = progress.add_task("Starting Docker container", total=None)
 
-                result = subprocess.run(cmd, capture_output=True, text=True)
+                returncode, _, stderr = await self._run(cmd)
+                self.invalidate()
 
-                if result.returncode == 0:
+                if returncode == 0:
                     progress.update(task, completed=True)
                     self.logger.info(f"Successfully started container: {name}")
                     return True
                 else:
                     progress.update(task, completed=False)
-                    self.logger.error(f"Docker run failed: {result.stderr}")
+                    self.logger.error(f"Docker run failed: {stderr}")
                     return False
 
         except Exception as e:
@@ -150,16 +227,15 @@ class DockerManager:
 
             # Check if container exists and is running
             cmd = ["docker", "ps", "-q", "-f", f"name={name}"]
-            result = subprocess.run(cmd, capture_output=True, text=True)
+            _, stdout, _ = await self._run(cmd)
 
-            if result.stdout.strip():
+            if stdout.strip():
                 # Container is running, stop it
-                stop_cmd = ["docker", "stop", name]
-                subprocess.run(stop_cmd, capture_output=True)
+                await self._run(["docker", "stop", name])
 
                 # Remove container
-                rm_cmd = ["docker", "rm", name]
-                subprocess.run(rm_cmd, capture_output=True)
+                await self._run(["docker", "rm", name])
+                self.invalidate()
 
                 self.logger.info(f"Stopped and removed container: {name}")
 
@@ -176,13 +252,15 @@ class DockerManager:
         try:
             name = container_name or self.docker_config.container_name
 
-            cmd = ["docker", "ps", "-a", "--format", "json", "-f", f"name={name}"]
-            result = subprocess.run(cmd, capture_output=True, text=True)
-
-            if result.stdout.strip():
-                import json
+            if (state := self._live_containers()) is not None:
+                # Same substring match as `docker ps -f name=...`.
+                records = [info for names, info in state.items() if name in names]
+            else:
+                cmd = ["docker", "ps", "-a", "--format", "json", "-f", f"name={name}"]
+                records = await self._docker_json(cmd)
 
-                container_info = json.loads(result.stdout.strip())
+            if records:
+                container_info = records[0]
                 return {
                     "name": container_info.get("Names", ""),
                     "status": container_info.get("Status", ""),
@@ -199,26 +277,22 @@ class DockerManager:
     async def list_containers(self) -> List[Dict[str, Any]]:
         """List all containers."""
         try:
-            cmd = ["docker", "ps", "-a", "--format", "json"]
-            result = subprocess.run(cmd, capture_output=True, text=True)
-
-            containers = []
-            if result.stdout.strip():
-                import json
-
-                for line in result.stdout.strip().split("\n"):
-                    if line:
-                        container_info = json.loads(line)
-                        containers.append(
-                            {
-                                "name": container_info.get("Names", ""),
-                                "status": container_info.get("Status", ""),
-                                "ports": container_info.get("Ports", ""),
-                                "image": container_info.get("Image", ""),
-                            }
-                        )
-
-            return containers
+            if (state := self._live_containers()) is not None:
+                records = list(state.values())
+            else:
+                records = await self._docker_json(
+                    ["docker", "ps", "-a", "--format", "json"]
+                )
+
+            return [
+                {
+                    "name": container_info.get("Names", ""),
+                    "status": container_info.get("Status", ""),
+                    "ports": container_info.get("Ports", ""),
+                    "image": container_info.get("Image", ""),
+                }
+                for container_info in records
+            ]
 
         except Exception as e:
             self.logger.error(f"Failed to list containers: {e}")
@@ -228,30 +302,28 @@ class DockerManager:
         """List all images."""
         try:
             cmd = ["docker", "images", "--format", "json"]
-            result = subprocess.run(cmd, capture_output=True, text=True)
-
-            images = []
-            if result.stdout.strip():
-                import json
-
-                for line in result.stdout.strip().split("\n"):
-                    if line:
-                        image_info = json.loads(line)
-                        images.append(
-                            {
-                                "repository": image_info.get("Repository", ""),
-                                "tag": image_info.get("Tag", ""),
-                                "size": image_info.get("Size", ""),
-                                "created": image_info.get("CreatedAt", ""),
-                            }
-                        )
-
-            return images
+
+            return [
+                {
+                    "repository": image_info.get("Repository", ""),
+                    "tag": image_info.get("Tag", ""),
+                    "size": image_info.get("Size", ""),
+                    "created": image_info.get("CreatedAt", ""),
+                }
+                for image_info in await self._docker_json(cmd)
+            ]
 
         except Exception as e:
             self.logger.error(f"Failed to list images: {e}")
             return []
 
+    async def refresh_all(self) -> Dict[str, Any]:
+        """Fetch containers, images and the managed container's status at once."""
+        containers, images, status = await asyncio.gather(
+            self.list_containers(), self.list_images(), self.get_container_status()
+        )
+        return {"containers": containers, "images": images, "status": status}
+
     async def clean_up(
         self, remove_containers: bool = True, remove_images: bool = False
     ) -> bool:
@@ -259,16 +331,20 @@ class DockerManager:
         try:
             self.logger.info("Cleaning up Docker resources")
 
+            # The prunes are independent, so they run concurrently.
+            prunes = []
             if remove_containers:
                 # Remove stopped containers
-                subprocess.run(
-                    ["docker", "container", "prune", "-f"], capture_output=True
-                )
-                self.logger.info("Removed stopped containers")
-
+                prunes.append(self._run(["docker", "container", "prune", "-f"]))
             if remove_images:
                 # Remove unused images
-                subprocess.run(["docker", "image", "prune", "-f"], capture_output=True)
+                prunes.append(self._run(["docker", "image", "prune", "-f"]))
+            await asyncio.gather(*prunes)
+            self.invalidate()
+
+            if remove_containers:
+                self.logger.info("Removed stopped containers")
+            if remove_images:
                 self.logger.info("Removed unused images")
 
             return True
@@ -277,6 +353,175 @@ class DockerManager:
             self.logger.error(f"Failed to clean up Docker resources: {e}")
             return False
 
+    async def _run(self, cmd: List[str]) -> Tuple[int, str, str]:
+        """Run *cmd* without blocking the event loop.
+
+        Returns the exit status with the decoded stdout and stderr. If the
+        caller is cancelled the child process is killed, not left running.
+        At most ``_DOCKER_CONCURRENCY`` commands run at the same time.
+        """
+        async with self._docker_sem:
+            proc = await asyncio.create_subprocess_exec(
+                *cmd, stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.PIPE
+            )
+            try:
+                stdout, stderr = await proc.communicate()
+            except asyncio.CancelledError:
+                if proc.returncode is None:
+                    proc.kill()
+                    await proc.wait()
+                raise
+
+        return (
+            proc.returncode,
+            stdout.decode(errors="replace"),
+            stderr.decode(errors="replace"),
+        )
+
+    async def _docker_json(self, cmd: List[str]) -> List[Dict[str, Any]]:
+        """Return the records printed by the read-only *cmd*.
+
+        A successful result is reused until it is older than the cache TTL.
+        Callers must not modify the returned records.
+        """
+        key = tuple(cmd)
+        cached = self._cache.get(key)
+        if cached is not None and time.monotonic() - cached[0] < self._cache_ttl:
+            return cached[1]
+
+        returncode, records = await self._stream_json(cmd)
+        if returncode == 0:
+            self._cache[key] = (time.monotonic(), records)
+        return records
+
+    async def _stream_json(self, cmd: List[str]) -> Tuple[int, List[Dict[str, Any]]]:
+        """Run *cmd* and parse each line of its stdout as a JSON object.
+
+        Lines are decoded as they arrive, so the full output is never held
+        as one string. Returns the exit status and the parsed records.
+        """
+        async with self._docker_sem:
+            proc = await asyncio.create_subprocess_exec(
+                *cmd,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.DEVNULL,
+                limit=_STREAM_LINE_LIMIT,
+            )
+            assert proc.stdout is not None
+            records: List[Dict[str, Any]] = []
+            try:
+                async for line in proc.stdout:
+                    if line.strip():
+                        records.append(_json_loads(line))
+                returncode = await proc.wait()
+            except BaseException:
+                if proc.returncode is None:
+                    proc.kill()
+                    await proc.wait()
+                raise
+
+        return returncode, records
+
+    def _live_containers(self) -> Optional[Dict[str, Dict[str, Any]]]:
+        """Return the event-driven container map, or None if it is not ready.
+
+        The first call inside `async with` starts the event stream; until it
+        has loaded the initial `docker ps` snapshot callers fall back to
+        polling.
+        """
+        if self._watch_events and self._events_task is None:
+            self._events_task = asyncio.create_task(self._follow_events())
+        return self._container_state
+
+    async def _follow_events(self) -> None:
+        """Keep ``_container_state`` in step with `docker events`.
+
+        The stream is opened before the `docker ps` snapshot is taken, so no
+        change between the two is lost. It is long-lived and does not count
+        against the docker concurrency limit.
+        """
+        proc = None
+        try:
+            proc = await asyncio.create_subprocess_exec(
+                "docker",
+                "events",
+                "--filter",
+                "type=container",
+                "--format",
+                "{{json .}}",
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.DEVNULL,
+                limit=_STREAM_LINE_LIMIT,
+            )
+            returncode, records = await self._stream_json(
+                ["docker", "ps", "-a", "--format", "json"]
+            )
+            if returncode != 0:
+                return
+
+            self._container_state = {
+                record.get("Names", ""): dict(record) for record in records
+            }
+            assert proc.stdout is not None
+            async for line in proc.stdout:
+                if line.strip():
+                    self._apply_event(_json_loads(line))
+        except Exception as e:
+            self.logger.warning(f"Stopped following docker events: {e}")
+        finally:
+            # Let the next listing start a new stream, unless invalidate()
+            # has already replaced this one.
+            if self._events_task is asyncio.current_task():
+                self._events_task = None
+                self._container_state = None
+            if proc is not None and proc.returncode is None:
+                proc.kill()
+                await proc.wait()
+
+    def _apply_event(self, event: Dict[str, Any]) -> None:
+        """Update the container map from one `docker events` record."""
+        state = self._container_state
+        if state is None:
+            return
+
+        action = event.get("Action") or event.get("status") or ""
+        attributes = event.get("Actor", {}).get("Attributes", {})
+        name = attributes.get("name", "")
+        if action == "destroy":
+            state.pop(name, None)
+            return
+
+        if action == "die":
+            status = f"Exited ({attributes.get('exitCode', '0')})"
+        elif action in _EVENT_STATUS:
+            status = _EVENT_STATUS[action]
+        else:
+            return
+
+        record = state.setdefault(
+            name, {"Names": name, "Image": attributes.get("image", ""), "Ports": ""}
+        )
+        record["Status"] = status
+
+    def invalidate(self) -> None:
+        """Forget cached listings after containers or images have changed.
+
+        The event-driven container map is dropped as well: the events for the
+        change may not have arrived yet. The next listing polls `docker ps`
+        and starts a fresh event stream.
+        """
+        self._cache.clear()
+        self._drop_container_state()
+
+    def _drop_container_state(self) -> None:
+        """Discard the container map and cancel the stream that maintains it."""
+        task, self._events_task = self._events_task, None
+        self._container_state = None
+        if task is not None and not task.done():
+            task.cancel()
+            self._retired_tasks.add(task)
+            task.add_done_callback(self._retired_tasks.discard)
+
     async def _create_dockerfile(self, dockerfile_path: str) -> None:
         """Create a default Dockerfile."""
         dockerfile_content = """# MilkBottle Dockerfile
@@ -323,33 +568,17 @@ CMD ["python", "-m", "milkbottle"]
     ) -> bool:
         """Create Docker Compose configuration."""
         try:
-            compose_config = {
-                "version": "3.8",
-                "services": {
-                    "milkbottle": {
-                        "build": ".",
-                        "container_name": self.docker_config.container_name,
-                        "ports": [self.docker_config.port_mapping],
-                        "volumes": [self.docker_config.volume_mapping],
-                        "environment": self.docker_config.environment_vars or [],
-                        "restart": "unless-stopped",
-                        "healthcheck": {
-                            "test": [
-                                "CMD",
-                                "curl",
-                                "-f",
-                                "http://localhost:8000/health",
-                            ],
-                            "interval": "30s",
-                            "timeout": "10s",
-                            "retries": "3",
-                        },
-                    }
-                },
-            }
+            # JSON scalars and lists are valid YAML, so the substituted values
+            # are quoted correctly whatever characters they contain.
+            compose_content = _COMPOSE_TEMPLATE.substitute(
+                container_name=json.dumps(self.docker_config.container_name),
+                ports=json.dumps([self.docker_config.port_mapping]),
+                volumes=json.dumps([self.docker_config.volume_mapping]),
+                environment=json.dumps(self.docker_config.environment_vars or []),
+            )
 
             with open(compose_file, "w") as f:
-                yaml.dump(compose_config, f, default_flow_style=False)
+                f.write(compose_content)
 
             self.logger.info(f"Created Docker Compose file: {compose_file}")
             return True
@@ -377,15 +606,16 @@ CMD ["python", "-m", "milkbottle"]
             ) as progress:
                 task = progress.add_task("Starting with Docker Compose", total=None)
 
-                result = subprocess.run(cmd, capture_output=True, text=True)
+                returncode, _, stderr = await self._run(cmd)
+                self.invalidate()
 
-                if result.returncode == 0:
+                if returncode == 0:
                     progress.update(task, completed=True)
                     self.logger.info("Successfully started with Docker Compose")
                     return True
                 else:
                     progress.update(task, completed=False)
-                    self.logger.error(f"Docker Compose failed: {result.stderr}")
+                    self.logger.error(f"Docker Compose failed: {stderr}")
                     return False
 
         except Exception as e:
@@ -248,42 +248,9 @@ class MonitoringManager:
     async def _collect_system_metrics(self) -> None:
         """Collect system performance metrics."""
         try:
-            # CPU usage
-            cpu_percent = psutil.cpu_percent(interval=1)
-
-            # Memory usage
-            memory = psutil.virtual_memory()
-            memory_percent = memory.percent
-
-            # Disk usage
-            disk = psutil.disk_usage("/")
-            disk_usage_percent = disk.percent
-
-            # Network I/O
-            network_io = psutil.net_io_counters()
-            network_data = {
-                "bytes_sent": float(network_io.bytes_sent),
-                "bytes_recv": float(network_io.bytes_recv),
-                "packets_sent": float(network_io.packets_sent),
-                "packets_recv": float(network_io.packets_recv),
-            }
-
-            # Load average
-            load_average = list(psutil.getloadavg())
-
-            # Uptime
-            uptime = time.time() - psutil.boot_time()
-
-            # Create metrics object
-            metrics = SystemMetrics(
-                timestamp=self._get_timestamp(),
-                cpu_percent=cpu_percent,
-                memory_percent=memory_percent,
-                disk_usage_percent=disk_usage_percent,
-                network_io=network_data,
-                load_average=load_average,
-                uptime=uptime,
-            )
+            # Sampling blocks for a full second on the CPU counter, so it runs
+            # in a worker thread and leaves the event loop free meanwhile.
+            metrics = await asyncio.to_thread(self._sample_system_metrics)
 
             self.system_metrics.append(metrics)
 
@@ -294,6 +261,45 @@ class MonitoringManager:
         except Exception as e:
             self.logger.error(f"Failed to collect system metrics: {e}")
 
+    def _sample_system_metrics(self) -> SystemMetrics:
+        """Take one blocking sample of system performance metrics."""
+        # CPU usage
+        cpu_percent = psutil.cpu_percent(interval=1)
+
+        # Memory usage
+        memory = psutil.virtual_memory()
+        memory_percent = memory.percent
+
+        # Disk usage
+        disk = psutil.disk_usage("/")
+        disk_usage_percent = disk.percent
+
+        # Network I/O
+        network_io = psutil.net_io_counters()
+        network_data = {
+            "bytes_sent": float(network_io.bytes_sent),
+            "bytes_recv": float(network_io.bytes_recv),
+            "packets_sent": float(network_io.packets_sent),
+            "packets_recv": float(network_io.packets_recv),
+        }
+
+        # Load average
+        load_average = list(psutil.getloadavg())
+
+        # Uptime
+        uptime = time.time() - psutil.boot_time()
+
+        # Create metrics object
+        return SystemMetrics(
+            timestamp=self._get_timestamp(),
+            cpu_percent=cpu_percent,
+            memory_percent=memory_percent,
+            disk_usage_percent=disk_usage_percent,
+            network_io=network_data,
+            load_average=load_average,
+            uptime=uptime,
+        )
+
     async def _collect_application_metrics(self) -> None:
         """Collect application performance metrics."""
         try:
@@ -13,6 +13,9 @@ from rich.console import Console
 
 from ..config import MilkBottleConfig
 
+# Upper bound on instances probed at once during a health sweep.
+_HEALTH_CHECK_CONCURRENCY = 32
+
 
 @dataclass
 class ScalingConfig:
@@ -299,31 +302,49 @@ class ScalingManager:
     async def _update_instance_health(self) -> None:
         """Update health status of all instances."""
         try:
-            for instance_id, instance in self.instances.items():
-                # Check if instance is still running
-                if not await self._is_instance_running(instance_id):
-                    instance.status = "stopped"
-                    instance.health_status = "unhealthy"
-                    continue
-
-                # Update metrics
-                instance.cpu_usage = await self._get_instance_cpu_usage(instance_id)
-                instance.memory_usage = await self._get_instance_memory_usage(
-                    instance_id
-                )
-                instance.active_connections = await self._get_instance_connections(
-                    instance_id
+            # Instances are probed concurrently, so a sweep takes as long as
+            # the slowest instance rather than the sum of all of them.
+            semaphore = asyncio.Semaphore(_HEALTH_CHECK_CONCURRENCY)
+            await asyncio.gather(
+                *(
+                    self._refresh_instance(instance_id, instance, semaphore)
+                    for instance_id, instance in list(self.instances.items())
                 )
-
-                # Update health status
-                if await self._check_instance_health(instance_id):
-                    instance.health_status = "healthy"
-                else:
-                    instance.health_status = "unhealthy"
+            )
 
         except Exception as e:
             self.logger.error(f"Failed to update instance health: {e}")
 
+    async def _refresh_instance(
+        self,
+        instance_id: str,
+        instance: InstanceInfo,
+        semaphore: asyncio.Semaphore,
+    ) -> None:
+        """Refresh metrics and health status of a single instance."""
+        async with semaphore:
+            # Check if instance is still running
+            if not await self._is_instance_running(instance_id):
+                instance.status = "stopped"
+                instance.health_status = "unhealthy"
+                return
+
+            # Update metrics
+            (
+                instance.cpu_usage,
+                instance.memory_usage,
+                instance.active_connections,
+                healthy,
+            ) = await asyncio.gather(
+                self._get_instance_cpu_usage(instance_id),
+                self._get_instance_memory_usage(instance_id),
+                self._get_instance_connections(instance_id),
+                self._check_instance_health(instance_id),
+            )
+
+            # Update health status
+            instance.health_status = "healthy" if healthy else "unhealthy"
+
     async def _create_instance(self) -> Optional[str]:
         """Create a new application instance."""
         try:
@@ -2,9 +2,11 @@
 
 from __future__ import annotations
 
+import asyncio
+import atexit
 import hashlib
 import logging
-from typing import Any, Optional
+from typing import Any, Coroutine, Optional
 
 from rich.box import MINIMAL_DOUBLE_HEAD
 from rich.console import Console, RenderableType
@@ -120,6 +122,40 @@ def get_console() -> Console:
     return Console()
 
 
+# One event loop serves every async CLI command in the process, whether run
+# from ``milk``, ``milk deployment`` or inside a ``milk repl`` session.
+_cli_loop: Optional[asyncio.AbstractEventLoop] = None
+
+
+def new_event_loop() -> asyncio.AbstractEventLoop:
+    """
+    Create an event loop, preferring uvloop when it is installed.
+    """
+    try:
+        import uvloop
+    except ImportError:
+        return asyncio.new_event_loop()
+    return uvloop.new_event_loop()
+
+
+def cli_event_loop() -> asyncio.AbstractEventLoop:
+    """
+    Return the process-wide CLI event loop, creating it on first use.
+    """
+    global _cli_loop
+    if _cli_loop is None or _cli_loop.is_closed():
+        _cli_loop = new_event_loop()
+        atexit.register(_cli_loop.close)
+    return _cli_loop
+
+
+def run_async(coro: Coroutine[Any, Any, Any]) -> Any:
+    """
+    Run *coro* to completion on the process-wide CLI event loop.
+    """
+    return cli_event_loop().run_until_complete(coro)
+
+
 def slugify(value: str) -> str:
     """
     Slugify a string for safe folder or file names using python-slugify.
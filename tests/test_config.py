@@ -0,0 +1,97 @@
+"""Tests for the core MilkBottle configuration loader."""
+
+from pathlib import Path
+
+import pytest
+
+from milkbottle import config as config_module
+from milkbottle.config import _find_toml, build_config
+
+
+@pytest.fixture(autouse=True)
+def snapshot_dir(tmp_path: Path, monkeypatch) -> Path:
+    """Keep config snapshots out of the real ~/.milkbottle."""
+    cache = tmp_path / "cache"
+    monkeypatch.setattr(config_module, "_SNAPSHOT_DIR", cache)
+    return cache
+
+
+class TestConfigLoader:
+    """Test TOML discovery and merging."""
+
+    def test_finds_toml_in_ancestor(self, tmp_path: Path):
+        """Test that milkbottle.toml is found above the start directory."""
+        (tmp_path / "milkbottle.toml").write_text('log_level = "debug"\n')
+        start = tmp_path / "a" / "b"
+        start.mkdir(parents=True)
+
+        assert _find_toml(start) == tmp_path / "milkbottle.toml"
+        assert build_config(start, {}).log_level == "debug"
+
+    def test_search_stops_at_project_root(self, tmp_path: Path):
+        """Test that the search does not climb past a project root marker."""
+        (tmp_path / "milkbottle.toml").write_text('log_level = "debug"\n')
+        project = tmp_path / "project"
+        (project / "src").mkdir(parents=True)
+        (project / "pyproject.toml").write_text("")
+
+        assert _find_toml(project / "src") is None
+        assert build_config(project / "src", {}).log_level == "info"
+
+    def test_finds_toml_created_later(self, tmp_path: Path):
+        """Test that a milkbottle.toml added after a lookup is found."""
+        (tmp_path / ".git").mkdir()
+        assert _find_toml(tmp_path) is None
+
+        (tmp_path / "milkbottle.toml").write_text('log_level = "debug"\n')
+        assert _find_toml(tmp_path) == tmp_path / "milkbottle.toml"
+
+        (tmp_path / "milkbottle.toml").unlink()
+        assert _find_toml(tmp_path) is None
+
+    def test_cli_overrides_win(self, tmp_path: Path):
+        """Test that CLI overrides take precedence over the TOML file."""
+        (tmp_path / "milkbottle.toml").write_text('log_level = "debug"\n')
+        (tmp_path / ".git").mkdir()
+
+        config = build_config(tmp_path, {"log_level": "warning"})
+
+        assert config.log_level == "warning"
+
+    def test_snapshot_cache_tracks_source_changes(self, tmp_path: Path):
+        """Test that cached merges are reused and invalidated on edit."""
+        toml_file = tmp_path / "milkbottle.toml"
+        toml_file.write_text('log_level = "debug"\n')
+        (tmp_path / ".git").mkdir()
+
+        assert build_config(tmp_path, {}).log_level == "debug"
+        assert len(list((tmp_path / "cache").glob("cfg-*.json"))) == 1
+        assert build_config(tmp_path, {}).log_level == "debug"
+
+        toml_file.write_text('log_level = "warning"\n')
+        assert build_config(tmp_path, {}).log_level == "warning"
+
+    def test_snapshot_cache_is_pruned(
+        self, tmp_path: Path, snapshot_dir: Path, monkeypatch
+    ):
+        """Test that only the newest snapshots are kept."""
+        monkeypatch.setattr(config_module, "_MAX_SNAPSHOTS", 2)
+        for index in range(4):
+            project = tmp_path / f"project{index}"
+            (project / ".git").mkdir(parents=True)
+            (project / "milkbottle.toml").write_text('log_level = "debug"\n')
+            build_config(project, {})
+
+        assert len(list(snapshot_dir.glob("cfg-*.json"))) == 2
+
+    def test_snapshot_dir_follows_home(self, tmp_path: Path, monkeypatch):
+        """Test that the default snapshot directory is resolved on each use."""
+        monkeypatch.setattr(config_module, "_SNAPSHOT_DIR", None)
+        monkeypatch.setenv("HOME", str(tmp_path / "home"))
+        (tmp_path / ".git").mkdir()
+        (tmp_path / "milkbottle.toml").write_text('log_level = "debug"\n')
+
+        build_config(tmp_path, {})
+
+        cache = tmp_path / "home" / ".milkbottle" / "config_cache"
+        assert len(list(cache.glob("cfg-*.json"))) == 1
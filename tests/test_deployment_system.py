@@ -1,8 +1,20 @@
 """Tests for the deployment system."""
 
-from unittest.mock import Mock, patch
+import asyncio
+import hashlib
+import io
+import json
+import os
+import shutil
+import subprocess
+import sys
+import time
+from unittest.mock import AsyncMock, Mock, patch
 
 import pytest
+import yaml
+from rich.console import Console
+from rich.progress import Progress
 
 from src.milkbottle.config import MilkBottleConfig
 from src.milkbottle.deployment import (
@@ -13,7 +25,21 @@ from src.milkbottle.deployment import (
     MonitoringManager,
     ScalingManager,
     SecurityManager,
+    cli,
 )
+from src.milkbottle.deployment.backup_manager import BackupInfo, _HashingWriter
+from src.milkbottle.deployment.ci_cd_manager import (
+    _PIPELINE_CACHE_SIZE,
+    PipelineStatus,
+    _load_pipeline_config,
+    _pipeline_configs,
+)
+from src.milkbottle.deployment.deployment_manager import (
+    DeploymentStatus,
+    _run_command,
+)
+from src.milkbottle.deployment.scaling_manager import InstanceInfo
+from src.milkbottle.utils import cli_event_loop
 
 
 class TestDeploymentManager:
@@ -54,6 +80,272 @@ class TestDeploymentManager:
             result = await deployment_manager.rollback_deployment()
             assert result is True
 
+    @pytest.mark.asyncio
+    async def test_rollback_stops_at_failed_step(self, deployment_manager):
+        """Test that rollback steps run in order and stop at the first failure."""
+        calls = []
+
+        def step(name, error=None):
+            async def run():
+                calls.append(name)
+                if error:
+                    raise error
+
+            return run
+
+        deployment_manager._find_previous_deployment = AsyncMock(
+            return_value={"id": "previous"}
+        )
+        deployment_manager._stop_services = step("stop")
+        deployment_manager._restore_previous_version = step(
+            "restore", RuntimeError("no backup")
+        )
+        deployment_manager._start_services = step("start")
+
+        assert await deployment_manager.rollback() is False
+        assert calls == ["stop", "restore"]
+
+    @pytest.mark.asyncio
+    async def test_step_graph_runs_independent_steps_concurrently(
+        self, deployment_manager
+    ):
+        """Test that steps without dependencies between them overlap."""
+        started = []
+        released = asyncio.Event()
+
+        async def first():
+            started.append("first")
+            await released.wait()
+
+        async def second():
+            started.append("second")
+            released.set()
+
+        async def last():
+            started.append("last")
+
+        steps = {
+            "first": (first, ()),
+            "second": (second, ()),
+            "last": (last, ("first", "second")),
+        }
+        with Progress(disable=True) as progress:
+            assert await deployment_manager._run_step_graph(steps, progress)
+
+        assert started == ["first", "second", "last"]
+        assert [task.finished for task in progress.tasks] == [True, True, True]
+
+    def test_step_tables_reference_known_steps(self, deployment_manager):
+        """Test that every step names an existing method and earlier steps."""
+        seen = set()
+        for name, method_name, deps in DeploymentManager._DEPLOY_STEPS:
+            assert callable(getattr(deployment_manager, method_name))
+            assert seen.issuperset(deps)
+            seen.add(name)
+        for _, method_name in DeploymentManager._ROLLBACK_STEPS:
+            assert callable(getattr(deployment_manager, method_name))
+
+    @pytest.mark.asyncio
+    async def test_step_graph_fails_fast(self, deployment_manager):
+        """Test that a failing step cancels its siblings and skips dependents."""
+        cancelled = []
+        never_released = asyncio.Event()
+
+        async def slow():
+            try:
+                await never_released.wait()
+            except asyncio.CancelledError:
+                cancelled.append("slow")
+                raise
+
+        async def broken():
+            raise RuntimeError("boom")
+
+        dependent = AsyncMock()
+        steps = {
+            "slow": (slow, ()),
+            "broken": (broken, ()),
+            "dependent": (dependent, ("slow", "broken")),
+        }
+        with Progress(disable=True) as progress:
+            assert not await deployment_manager._run_step_graph(steps, progress)
+
+        assert cancelled == ["slow"]
+        dependent.assert_not_called()
+        assert not any(task.finished for task in progress.tasks)
+        assert not progress.tasks[2].started
+
+    @pytest.mark.asyncio
+    async def test_run_command_checks_exit_code(self):
+        """Test that the async command runner behaves like subprocess.run."""
+        failing = [sys.executable, "-c", "import sys; sys.exit(3)"]
+
+        with pytest.raises(subprocess.CalledProcessError) as excinfo:
+            await _run_command(failing, capture_output=True)
+        assert excinfo.value.returncode == 3
+        assert await _run_command(failing, check=False) == 3
+
+    @pytest.mark.asyncio
+    async def test_create_backup_links_previous_snapshot(
+        self, config, tmp_path, monkeypatch
+    ):
+        """Test that backups copy the target and find the previous snapshot."""
+        monkeypatch.setenv("HOME", str(tmp_path))
+        deployment_manager = DeploymentManager(config)
+        target = tmp_path / "target"
+        target.mkdir()
+        (target / "app.py").write_text("print('v1')\n")
+        deployment_manager.deployment_config.target_path = str(target)
+        backups = tmp_path / ".milkbottle" / "backups"
+        backups.mkdir(parents=True)
+
+        with patch("shutil.which", return_value=None):
+            with patch.object(DeploymentManager, "_deployment_id", "20240101_000000"):
+                await deployment_manager._create_backup()
+            with patch.object(DeploymentManager, "_deployment_id", "20240102_000000"):
+                await deployment_manager._create_backup()
+
+        assert (backups / "20240102_000000" / "current" / "app.py").exists()
+        assert (
+            deployment_manager._previous_backup(backups / "20240102_000000")
+            == (backups / "20240101_000000" / "current").resolve()
+        )
+        assert deployment_manager._previous_backup(backups / "20240101_000000") is None
+
+    @pytest.mark.asyncio
+    async def test_cancelled_backup_leaves_no_snapshot(
+        self, config, tmp_path, monkeypatch
+    ):
+        """Test that a backup cancelled mid-copy leaves nothing to restore."""
+        monkeypatch.setenv("HOME", str(tmp_path))
+        deployment_manager = DeploymentManager(config)
+        target = tmp_path / "target"
+        target.mkdir()
+        for index in range(50):
+            (target / f"file{index}.txt").write_text("data\n")
+        deployment_manager.deployment_config.target_path = str(target)
+        backups = tmp_path / ".milkbottle" / "backups"
+        backups.mkdir(parents=True)
+        copy2 = shutil.copy2
+        copied = 0
+
+        def slow_copy(source, destination):
+            nonlocal copied
+            time.sleep(0.01)
+            copied += 1
+            return copy2(source, destination)
+
+        with (
+            patch("shutil.which", return_value=None),
+            patch("shutil.copy2", slow_copy),
+            patch.object(DeploymentManager, "_deployment_id", "20240101_000000"),
+        ):
+            task = asyncio.create_task(deployment_manager._create_backup())
+            while not copied and not task.done():
+                await asyncio.sleep(0.01)
+            task.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await task
+            stopped_at = copied
+            await asyncio.sleep(0.05)
+
+        assert copied == stopped_at < 50
+        assert not (backups / "20240101_000000").exists()
+
+    @pytest.mark.asyncio
+    async def test_remote_target_path_checked_over_ssh(self, deployment_manager):
+        """Test that a remote target path is probed on the remote host."""
+        deployment_manager.deployment_config.target_host = "deploy.example.com"
+
+        with patch(
+            "src.milkbottle.deployment.deployment_manager._run_command",
+            new=AsyncMock(return_value=0),
+        ) as mock_run:
+            assert await deployment_manager._check_target_path()
+
+        cmd = mock_run.call_args.args[0]
+        assert cmd[0] == "ssh"
+        assert "deploy@deploy.example.com" in cmd
+        assert cmd[-1].endswith("test -w /opt/milkbottle")
+
+    @pytest.mark.asyncio
+    async def test_validation_probes_are_cached(self, deployment_manager, monkeypatch):
+        """Test that a validated target is not probed again within the TTL."""
+        for var in ("DATABASE_URL", "SECRET_KEY", "LOG_LEVEL"):
+            monkeypatch.setenv(var, "set")
+        deployment_manager._check_host_connectivity = AsyncMock(return_value=True)
+        deployment_manager._check_target_path = AsyncMock(return_value=True)
+
+        assert await deployment_manager._validate_deployment_config()
+        assert await deployment_manager._validate_deployment_config()
+        assert deployment_manager._check_host_connectivity.await_count == 1
+
+        deployment_manager.deployment_config.target_path = "/srv/milkbottle"
+        assert await deployment_manager._validate_deployment_config()
+        assert deployment_manager._check_host_connectivity.await_count == 2
+
+        monkeypatch.delenv("SECRET_KEY")
+        assert not await deployment_manager._validate_deployment_config()
+
+    @pytest.mark.asyncio
+    async def test_restore_uses_newest_backup(self, config, tmp_path, monkeypatch):
+        """Test that rollback restores the most recent backup snapshot."""
+        monkeypatch.setenv("HOME", str(tmp_path))
+        deployment_manager = DeploymentManager(config)
+        for name in ("20240101_000000", "20240102_000000"):
+            snapshot = deployment_manager.backups_root / name / "current"
+            snapshot.mkdir(parents=True)
+            (snapshot / "version.txt").write_text(name)
+        (deployment_manager.backups_root / "notes.txt").write_text("not a backup")
+        target = tmp_path / "target"
+        target.mkdir()
+        deployment_manager.deployment_config.target_path = str(target)
+
+        await deployment_manager._restore_previous_version()
+
+        assert (target / "version.txt").read_text() == "20240102_000000"
+
+    @pytest.mark.asyncio
+    async def test_history_keeps_last_ten_deployments(
+        self, config, tmp_path, monkeypatch
+    ):
+        """Test that recording a deployment evicts the oldest record."""
+        monkeypatch.setenv("HOME", str(tmp_path))
+        deployment_manager = DeploymentManager(config)
+        history_file = tmp_path / ".milkbottle" / "deployment_history.yaml"
+        history_file.parent.mkdir()
+        history_file.write_text(
+            yaml.safe_dump([{"id": f"old_{index}"} for index in range(10)])
+        )
+        deployment_manager.current_deployment = DeploymentStatus(
+            status="completed", deployment_id="new"
+        )
+
+        await deployment_manager._update_deployment_history()
+
+        ids = [record["id"] for record in await deployment_manager.list_deployments()]
+        assert len(ids) == 10
+        assert ids[0] == "old_1"
+        assert ids[-1] == "new"
+
+    @pytest.mark.asyncio
+    async def test_history_log_appends_records(self, config, tmp_path, monkeypatch):
+        """Test that each deployment appends one line to the JSONL history."""
+        monkeypatch.setenv("HOME", str(tmp_path))
+        deployment_manager = DeploymentManager(config)
+
+        for deployment_id in ("first", "second"):
+            deployment_manager.current_deployment = DeploymentStatus(
+                status="completed", deployment_id=deployment_id
+            )
+            await deployment_manager._update_deployment_history()
+
+        assert len(deployment_manager.history_log.read_text().splitlines()) == 2
+        assert not deployment_manager.history_file.exists()
+        assert [
+            record["id"] for record in await deployment_manager.list_deployments()
+        ] == ["first", "second"]
+
 
 class TestScalingManager:
     """Test ScalingManager functionality."""
@@ -99,6 +391,35 @@ class TestScalingManager:
         instances = await scaling_manager.get_instances()
         assert isinstance(instances, list)
 
+    @pytest.mark.asyncio
+    async def test_update_instance_health(self, scaling_manager):
+        """Test that every instance is refreshed by a health sweep."""
+        for index, status in enumerate(["running", "running", "stopped"]):
+            scaling_manager.instances[f"instance_{index}"] = InstanceInfo(
+                instance_id=f"instance_{index}",
+                host="localhost",
+                port=8000 + index,
+                status=status,
+                cpu_usage=0.0,
+                memory_usage=0.0,
+                active_connections=0,
+                start_time="",
+                health_status="unknown",
+            )
+
+        await scaling_manager._update_instance_health()
+
+        health = {
+            instance_id: instance.health_status
+            for instance_id, instance in scaling_manager.instances.items()
+        }
+        assert health == {
+            "instance_0": "healthy",
+            "instance_1": "healthy",
+            "instance_2": "unhealthy",
+        }
+        assert scaling_manager.instances["instance_0"].cpu_usage > 0
+
 
 class TestSecurityManager:
     """Test SecurityManager functionality."""
@@ -242,6 +563,193 @@ class TestBackupManager:
             result = await backup_manager.restore_backup("backup_123")
             assert result is True
 
+    def test_archive_writer_fails_when_output_write_fails(
+        self, backup_manager, tmp_path
+    ):
+        """Test that a failing archive write aborts pigz instead of hanging."""
+        fake_pigz = tmp_path / "pigz"
+        fake_pigz.write_text("#!/bin/sh\nexec cat\n")
+        fake_pigz.chmod(0o755)
+        payload = tmp_path / "payload.bin"
+        payload.write_bytes(os.urandom(4 << 20))
+
+        def full_disk(self, data):
+            raise OSError(28, "No space left on device")
+
+        with (
+            patch.object(backup_manager, "_pigz_path", return_value=str(fake_pigz)),
+            patch.object(_HashingWriter, "write", full_disk),
+            pytest.raises(OSError, match="No space left"),
+        ):
+            with backup_manager._archive_writer(
+                tmp_path / "out.tar.gz", hashlib.sha256(), 6
+            ) as tar:
+                tar.add(payload, arcname="payload.bin")
+
+    def test_exclude_patterns(self, backup_manager):
+        """Test substring and glob exclude patterns."""
+        backup_manager.backup_config.exclude_patterns = ["__pycache__", "*.pyc"]
+        backup_manager._compile_excludes()
+
+        assert backup_manager._should_exclude_file("/data/__pycache__/mod.py")
+        assert backup_manager._should_exclude_file("/data/mod.pyc")
+        assert not backup_manager._should_exclude_file("/data/mod.py")
+
+    def test_compressed_files_use_fast_level(self, backup_manager):
+        """Test that mostly pre-compressed trees are gzipped at level 1."""
+        backup_manager.backup_config.compression_level = 6
+        images = [f"/data/img{i}.JPG" for i in range(3)]
+
+        assert backup_manager._compression_level(images + ["/data/a.txt"]) == 1
+        assert backup_manager._compression_level(["a.txt", "b.py"]) == 6
+
+    @pytest.mark.asyncio
+    async def test_backup_round_trip_verifies(self, config, tmp_path, monkeypatch):
+        """Test that a created backup verifies and restores."""
+        monkeypatch.setenv("HOME", str(tmp_path / "home"))
+        monkeypatch.chdir(tmp_path)
+        (tmp_path / "milkbottle.toml").write_text('log_level = "info"\n')
+        data_dir = tmp_path / "home" / ".milkbottle" / "data"
+        data_dir.mkdir(parents=True)
+        (data_dir / "state.json").write_text("{}")
+
+        backup_manager = BackupManager(config)
+        backup_id = await backup_manager.create_backup()
+        assert backup_id is not None
+
+        backup_info = await backup_manager._load_backup_info(backup_id)
+        assert backup_info.files_count == 2
+        assert backup_info.checksum
+        assert await backup_manager.verify_backup(backup_id) is True
+
+        restore_dir = tmp_path / "restored"
+        assert await backup_manager.restore_backup(backup_id, str(restore_dir))
+        assert (restore_dir / "home" / ".milkbottle" / "data" / "state.json").exists()
+        assert (restore_dir / "milkbottle.toml").exists()
+
+    @pytest.mark.asyncio
+    async def test_list_and_delete_use_index(self, config, tmp_path, monkeypatch):
+        """Test that listing reads the index and deletion updates it."""
+        monkeypatch.setenv("HOME", str(tmp_path / "home"))
+        monkeypatch.chdir(tmp_path)
+
+        backup_manager = BackupManager(config)
+        backup_id = await backup_manager.create_backup()
+        assert (backup_manager.backup_dir / "index.json").exists()
+
+        # A fresh manager loads the index instead of scanning every backup.
+        other_manager = BackupManager(config)
+        assert [b.backup_id for b in await other_manager.list_backups()] == [backup_id]
+
+        assert await other_manager.delete_backup(backup_id) is True
+        assert await BackupManager(config).list_backups() == []
+
+    @pytest.mark.asyncio
+    async def test_incremental_backup_archives_changes(
+        self, config, tmp_path, monkeypatch
+    ):
+        """Test that incremental backups hold only changed files and restore."""
+        monkeypatch.setenv("HOME", str(tmp_path / "home"))
+        monkeypatch.chdir(tmp_path)
+        data_dir = tmp_path / "home" / ".milkbottle" / "data"
+        data_dir.mkdir(parents=True)
+        (data_dir / "kept.json").write_text("{}")
+        (data_dir / "changed.json").write_text("{}")
+
+        backup_manager = BackupManager(config)
+        with patch.object(
+            backup_manager,
+            "_generate_backup_id",
+            side_effect=["backup_full", "backup_incr"],
+        ):
+            assert await backup_manager.create_backup() == "backup_full"
+            (data_dir / "changed.json").write_text('{"changed": true}')
+            (data_dir / "new.json").write_text("{}")
+            assert await backup_manager.create_backup("incremental") == "backup_incr"
+
+        backup_info = await backup_manager._load_backup_info("backup_incr")
+        assert backup_info.files_count == 2
+        assert backup_info.metadata["parent_id"] == "backup_full"
+
+        restore_dir = tmp_path / "restored"
+        assert await backup_manager.restore_backup("backup_incr", str(restore_dir))
+        restored = restore_dir / "home" / ".milkbottle" / "data"
+        assert sorted(p.name for p in restored.iterdir()) == [
+            "changed.json",
+            "kept.json",
+            "new.json",
+        ]
+        assert (restored / "changed.json").read_text() == '{"changed": true}'
+
+    @staticmethod
+    async def _expire(backup_manager, *backup_ids):
+        """Backdate *backup_ids*, oldest first, to well past retention."""
+        for age, backup_id in enumerate(backup_ids):
+            info = await backup_manager._load_backup_info(backup_id)
+            info.timestamp = age
+            await backup_manager._save_backup_info(info)
+
+    @pytest.mark.asyncio
+    async def test_cleanup_keeps_parents_of_retained_backups(
+        self, config, tmp_path, monkeypatch
+    ):
+        """Test that retention never breaks the chain of a kept incremental."""
+        monkeypatch.setenv("HOME", str(tmp_path / "home"))
+        monkeypatch.chdir(tmp_path)
+        data_dir = tmp_path / "home" / ".milkbottle" / "data"
+        data_dir.mkdir(parents=True)
+        (data_dir / "app.json").write_text("{}")
+
+        backup_manager = BackupManager(config)
+        with patch.object(
+            backup_manager,
+            "_generate_backup_id",
+            side_effect=["old_full", "old_incr", "full", "incr"],
+        ):
+            assert await backup_manager.create_backup() == "old_full"
+            (data_dir / "app.json").write_text('{"v": 1}')
+            assert await backup_manager.create_backup("incremental") == "old_incr"
+            await self._expire(backup_manager, "old_full", "old_incr")
+            assert await backup_manager.create_backup() == "full"
+            (data_dir / "app.json").write_text('{"v": 2}')
+            assert await backup_manager.create_backup("incremental") == "incr"
+
+        # Everything but the newest incremental is past retention.
+        await self._expire(backup_manager, "full")
+
+        assert await backup_manager.cleanup_old_backups() == 2
+        assert sorted(b.backup_id for b in await backup_manager.list_backups()) == [
+            "full",
+            "incr",
+        ]
+
+        restore_dir = tmp_path / "restored"
+        assert await backup_manager.restore_backup("incr", str(restore_dir))
+        restored = restore_dir / "home" / ".milkbottle" / "data" / "app.json"
+        assert restored.read_text() == '{"v": 2}'
+
+        assert await backup_manager.delete_backup("full") is False
+        assert await backup_manager.delete_backup("full", cascade=True) is True
+        assert await backup_manager.list_backups() == []
+
+    @pytest.mark.asyncio
+    async def test_cleanup_uses_epoch_timestamps(self, config, tmp_path, monkeypatch):
+        """Test legacy timestamps are parsed and expired backups removed."""
+        monkeypatch.setenv("HOME", str(tmp_path / "home"))
+        monkeypatch.chdir(tmp_path)
+
+        legacy = BackupInfo("old", "2000-01-01 00:00:00", 0, "full", "completed", 0, "")
+        assert isinstance(legacy.timestamp, int)
+        assert legacy.timestamp_iso == "2000-01-01 00:00:00"
+
+        backup_manager = BackupManager(config)
+        (backup_manager.backup_dir / "old").mkdir()
+        await backup_manager._save_backup_info(legacy)
+        backup_id = await backup_manager.create_backup()
+
+        assert await backup_manager.cleanup_old_backups() == 1
+        assert [b.backup_id for b in await backup_manager.list_backups()] == [backup_id]
+
 
 class TestDockerManager:
     """Test DockerManager functionality."""
@@ -257,23 +765,228 @@ class TestDockerManager:
         return DockerManager(config)
 
     @pytest.mark.asyncio
-    async def test_build_image(self, docker_manager):
+    async def test_build_image(self, docker_manager, tmp_path, monkeypatch):
         """Test Docker image building."""
-        with patch("subprocess.run") as mock_run:
-            mock_run.return_value.returncode = 0
-
+        monkeypatch.chdir(tmp_path)
+        with patch.object(
+            docker_manager, "_run", new=AsyncMock(return_value=(0, "", ""))
+        ):
             result = await docker_manager.build_image()
             assert result is True
+        assert (tmp_path / "Dockerfile").exists()
 
     @pytest.mark.asyncio
     async def test_run_container(self, docker_manager):
         """Test container running."""
-        with patch("subprocess.run") as mock_run:
-            mock_run.return_value.returncode = 0
-
+        with patch.object(
+            docker_manager, "_run", new=AsyncMock(return_value=(0, "", ""))
+        ):
             result = await docker_manager.run_container()
             assert result is True
 
+    @pytest.mark.asyncio
+    async def test_refresh_all_runs_listings_concurrently(self, docker_manager):
+        """Test that the refresh fans out all three docker listings at once."""
+        in_flight = 0
+        peak = 0
+
+        async def fake_stream(cmd):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return 0, []
+
+        with patch.object(docker_manager, "_stream_json", new=fake_stream):
+            snapshot = await docker_manager.refresh_all()
+
+        assert peak == 3
+        assert snapshot == {
+            "containers": [],
+            "images": [],
+            "status": {"status": "not_found"},
+        }
+
+    @pytest.mark.asyncio
+    async def test_listings_are_cached_until_invalidated(self, docker_manager):
+        """Test that repeated listings reuse docker output until a change."""
+        record = {"Names": "web", "Status": "Up", "Ports": "", "Image": "nginx"}
+        fake_stream = AsyncMock(return_value=(0, [record]))
+
+        with (
+            patch.object(docker_manager, "_stream_json", new=fake_stream),
+            patch.object(docker_manager, "_run", new=AsyncMock()),
+        ):
+            first = await docker_manager.list_containers()
+            assert await docker_manager.list_containers() == first
+            assert fake_stream.await_count == 1
+
+            await docker_manager.clean_up()
+            await docker_manager.list_containers()
+
+        assert fake_stream.await_count == 2
+        assert first[0]["name"] == "web"
+
+    @pytest.mark.asyncio
+    async def test_stream_json_parses_each_line(self, docker_manager):
+        """Test that JSON-lines output is parsed record by record."""
+        script = 'print(\'{"Names": "a"}\'); print(); print(\'{"Names": "b"}\')'
+
+        returncode, records = await docker_manager._stream_json(
+            [sys.executable, "-c", script]
+        )
+
+        assert returncode == 0
+        assert records == [{"Names": "a"}, {"Names": "b"}]
+
+    @pytest.mark.asyncio
+    async def test_container_events_update_listing(self, config, tmp_path, monkeypatch):
+        """Test that inside `async with` listings follow `docker events`."""
+        fake_docker = tmp_path / "docker"
+        container = {
+            "Names": "web",
+            "Status": "Up",
+            "Ports": "80/tcp",
+            "Image": "nginx",
+        }
+        died = {
+            "Action": "die",
+            "Actor": {"Attributes": {"name": "web", "exitCode": "1"}},
+        }
+        fake_docker.write_text(
+            "#!/bin/sh\n"
+            'case "$1" in\n'
+            f"  ps) echo '{json.dumps(container)}' ;;\n"
+            f"  events) echo '{json.dumps(died)}'; exec sleep 30 ;;\n"
+            "esac\n"
+        )
+        fake_docker.chmod(0o755)
+        monkeypatch.setenv("PATH", f"{tmp_path}{os.pathsep}{os.environ['PATH']}")
+
+        async with DockerManager(config) as docker:
+            await docker.list_containers()
+            for _ in range(100):
+                status = await docker.get_container_status("web")
+                if status["status"].startswith("Exited"):
+                    break
+                await asyncio.sleep(0.05)
+            events_task = docker._events_task
+
+        assert status == {
+            "name": "web",
+            "status": "Exited (1)",
+            "ports": "80/tcp",
+            "image": "nginx",
+        }
+        assert events_task.done()
+        assert docker._container_state is None
+
+    @pytest.mark.asyncio
+    async def test_invalidate_refreshes_container_listing(
+        self, config, tmp_path, monkeypatch
+    ):
+        """Test that a listing after a change does not serve the old map."""
+        fake_docker = tmp_path / "docker"
+        ps_output = tmp_path / "ps.json"
+        ps_output.write_text(json.dumps({"Names": "web", "Status": "Up"}) + "\n")
+        fake_docker.write_text(
+            "#!/bin/sh\n"
+            'case "$1" in\n'
+            f"  ps) cat '{ps_output}' ;;\n"
+            "  events) exec sleep 30 ;;\n"
+            "esac\n"
+        )
+        fake_docker.chmod(0o755)
+        monkeypatch.setenv("PATH", f"{tmp_path}{os.pathsep}{os.environ['PATH']}")
+
+        async with DockerManager(config) as docker:
+            await docker.list_containers()
+            for _ in range(100):
+                if docker._container_state is not None:
+                    break
+                await asyncio.sleep(0.05)
+            first_task = docker._events_task
+
+            # As after stop_container: docker has changed, no event seen yet.
+            ps_output.write_text(
+                json.dumps({"Names": "web", "Status": "Exited (0)"}) + "\n"
+            )
+            docker.invalidate()
+            status = await docker.get_container_status("web")
+
+            assert status["status"] == "Exited (0)"
+            assert docker._events_task is not first_task
+            await asyncio.gather(first_task, return_exceptions=True)
+            assert first_task.cancelled()
+
+    @pytest.mark.asyncio
+    async def test_events_stream_restarts_after_it_ends(
+        self, config, tmp_path, monkeypatch
+    ):
+        """Test that a finished `docker events` stream is started again."""
+        fake_docker = tmp_path / "docker"
+        fake_docker.write_text(
+            "#!/bin/sh\n"
+            'case "$1" in\n'
+            '  ps) echo \'{"Names": "web", "Status": "Up"}\' ;;\n'
+            "  events) exit 0 ;;\n"
+            "esac\n"
+        )
+        fake_docker.chmod(0o755)
+        monkeypatch.setenv("PATH", f"{tmp_path}{os.pathsep}{os.environ['PATH']}")
+
+        async with DockerManager(config) as docker:
+            await docker.list_containers()
+            first_task = docker._events_task
+            await first_task
+
+            assert docker._events_task is None
+            await docker.list_containers()
+            assert docker._events_task not in (None, first_task)
+
+    def test_apply_container_events(self, docker_manager):
+        """Test that lifecycle events add, update and drop containers."""
+        docker_manager._container_state = {}
+
+        def event(action, name):
+            return {"Action": action, "Actor": {"Attributes": {"name": name}}}
+
+        docker_manager._apply_event(event("create", "api"))
+        docker_manager._apply_event(event("start", "api"))
+        docker_manager._apply_event(event("create", "job"))
+        docker_manager._apply_event(event("destroy", "job"))
+        docker_manager._apply_event(event("exec_start", "api"))
+
+        assert list(docker_manager._container_state) == ["api"]
+        assert docker_manager._container_state["api"]["Status"] == "Up"
+
+    @pytest.mark.asyncio
+    async def test_create_docker_compose(self, docker_manager, tmp_path):
+        """Test that the rendered compose file parses to the expected config."""
+        docker_manager.docker_config.environment_vars = ["MODE=prod: fast"]
+        compose_file = tmp_path / "docker-compose.yml"
+
+        assert await docker_manager.create_docker_compose(str(compose_file))
+
+        service = yaml.safe_load(compose_file.read_text())["services"]["milkbottle"]
+        assert service["container_name"] == "milkbottle-app"
+        assert service["ports"] == ["8000:8000"]
+        assert service["volumes"] == ["./data:/app/data"]
+        assert service["environment"] == ["MODE=prod: fast"]
+        assert service["healthcheck"]["retries"] == "3"
+
+    @pytest.mark.asyncio
+    async def test_run_returns_exit_code_and_output(self, docker_manager):
+        """Test that docker commands run as async subprocesses."""
+        script = "import sys; print('out'); print('err', file=sys.stderr); sys.exit(4)"
+
+        returncode, stdout, stderr = await docker_manager._run(
+            [sys.executable, "-c", script]
+        )
+
+        assert (returncode, stdout.strip(), stderr.strip()) == (4, "out", "err")
+
 
 class TestCICDManager:
     """Test CICDManager functionality."""
@@ -302,3 +1015,135 @@ class TestCICDManager:
         """Test pipeline status retrieval."""
         status = await cicd_manager.get_pipeline_status()
         assert isinstance(status, dict)
+
+    @pytest.mark.asyncio
+    async def test_run_command_keeps_output_tail(self, cicd_manager):
+        """Test that stage output is streamed and only its tail is kept."""
+        cicd_manager.current_pipeline = PipelineStatus("pipeline_1")
+        script = "import sys\nfor i in range(1500): print(i)\nsys.exit(2)"
+
+        returncode, output = await cicd_manager._run_command(
+            [sys.executable, "-c", script]
+        )
+
+        assert returncode == 2
+        lines = output.splitlines()
+        assert len(lines) == 1000 and lines[-1] == "1499"
+        assert list(cicd_manager.current_pipeline.logs) == lines
+
+    def test_pipeline_config_cache(self, tmp_path):
+        """Test that pipeline configs are parsed once per file version."""
+        config_file = tmp_path / "pipeline.yml"
+        config_file.write_text("name: first\n")
+
+        first = _load_pipeline_config(str(config_file))
+        first.name = "modified"
+        assert _load_pipeline_config(str(config_file)).name == "first"
+
+        config_file.write_text("name: second-version\n")
+        assert _load_pipeline_config(str(config_file)).name == "second-version"
+        assert _load_pipeline_config(str(tmp_path / "missing.yml")) is None
+
+    def test_pipeline_config_cache_is_bounded(self, tmp_path):
+        """Test that rewrites replace entries and old paths are evicted."""
+        _pipeline_configs.clear()
+        config_file = tmp_path / "pipeline.yml"
+        config_file.write_text("name: first\n")
+        _load_pipeline_config(str(config_file))
+        config_file.write_text("name: second-version\n")
+        _load_pipeline_config(str(config_file))
+        assert len(_pipeline_configs) == 1
+
+        for i in range(_PIPELINE_CACHE_SIZE):
+            other = tmp_path / f"pipeline{i}.yml"
+            other.write_text(f"name: p{i}\n")
+            _load_pipeline_config(str(other))
+        assert len(_pipeline_configs) == _PIPELINE_CACHE_SIZE
+        assert str(config_file) not in _pipeline_configs
+
+    @pytest.mark.asyncio
+    async def test_stage_command_handles_quoting(self, cicd_manager):
+        """Test that stage commands are split shell-style."""
+        cicd_manager.pipeline_config.test_command = (
+            f"{sys.executable} -c 'import sys; sys.exit(0)'"
+        )
+
+        assert await cicd_manager._run_tests("production") is True
+
+    @pytest.mark.asyncio
+    async def test_notifications_use_instance_senders(self, cicd_manager):
+        """Test that notifications dispatch through the instance's methods."""
+        cicd_manager.pipeline_config.notifications = ["slack", "pager"]
+        cicd_manager.current_pipeline = Mock(status="success", pipeline_id="p1")
+
+        with patch.object(
+            cicd_manager, "_send_slack_notification", new=AsyncMock()
+        ) as mock_slack:
+            await cicd_manager._send_notifications()
+
+        mock_slack.assert_awaited_once_with("success", "p1")
+
+    @pytest.mark.asyncio
+    async def test_run_command_kills_process_on_cancel(self, cicd_manager):
+        """Test that cancelling a stage kills its process."""
+        procs = []
+        spawn = asyncio.create_subprocess_exec
+
+        async def tracking_spawn(*args, **kwargs):
+            proc = await spawn(*args, **kwargs)
+            procs.append(proc)
+            return proc
+
+        with patch("asyncio.create_subprocess_exec", tracking_spawn):
+            task = asyncio.create_task(
+                cicd_manager._run_command(
+                    [sys.executable, "-c", "import time; time.sleep(60)"]
+                )
+            )
+            while not procs:
+                await asyncio.sleep(0.01)
+            task.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await task
+
+        assert procs[0].returncode is not None
+
+    @pytest.mark.asyncio
+    async def test_create_pipeline_skips_unchanged_files(
+        self, cicd_manager, tmp_path, monkeypatch
+    ):
+        """Test that regenerating identical pipeline files does not rewrite them."""
+        monkeypatch.chdir(tmp_path)
+        assert await cicd_manager.create_pipeline("demo") is True
+        jenkinsfile = tmp_path / "Jenkinsfile"
+        os.utime(jenkinsfile, ns=(0, 0))
+
+        assert await cicd_manager.create_pipeline("demo") is True
+        assert jenkinsfile.stat().st_mtime_ns == 0
+        assert (tmp_path / ".github" / "workflows" / "demo.yml").exists()
+
+
+class TestDeploymentCLI:
+    """Test deployment CLI helpers."""
+
+    def test_render_table_without_rows(self):
+        """Test that an empty listing still renders its headers."""
+        output = io.StringIO()
+        with patch.object(cli, "console", Console(file=output, width=80)):
+            cli._render_table("Backups", [("ID", "cyan"), ("Size", "green")], [])
+
+        assert "ID" in output.getvalue()
+        assert "Size" in output.getvalue()
+
+    def test_async_commands_share_the_cli_loop(self):
+        """Test that deployment commands run on the process-wide CLI loop."""
+        loops = []
+
+        @cli._async_command
+        async def command():
+            loops.append(asyncio.get_running_loop())
+
+        command()
+        command()
+
+        assert loops[0] is loops[1] is cli_event_loop()